@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import sys
+
+from config.benchmark import BASELINE
+from config.benchmark import CORPUS
+from config.benchmark import REPEAT
+from config.benchmark import TOLERANCE
+from config.parser.parser import SETTINGS
+from utils.benchmark import compare
+from utils.benchmark import measure
+
+
+def main():
+    """
+    Точка входа измерения производительности парсинга и записи данных
+    на корпусе сохраненных ответов без обращения к сети. Результаты
+    выводятся в формате json и сравниваются с базовыми, при наличии
+    регрессий программа завершается с кодом 1;
+
+    :return: None.
+    """
+
+    arguments = argparse.ArgumentParser(description=main.__doc__)
+    arguments.add_argument('--backend', default=SETTINGS['backend'])
+    arguments.add_argument('--format', default=SETTINGS['format'])
+    arguments.add_argument('--repeat', type=int, default=REPEAT)
+    arguments.add_argument('--tolerance', type=float, default=TOLERANCE)
+    arguments.add_argument('--output', help='файл результатов (json)')
+    arguments.add_argument('--save', action='store_true',
+                           help='сохранить результаты как базовые')
+    options = arguments.parse_args()
+
+    results = measure(CORPUS, options.backend, options.format, options.repeat)
+
+    print(f'Количество страниц: {results["pages"]}.', flush=True)
+    print('Время парсинга (мкс/стр.):', flush=True)
+    for field, microseconds in results['extractors'].items():
+        print(f'{field:11} {microseconds:10.1f}', flush=True)
+
+    pipeline = results['pipeline']
+    print(f'Скорость обработки: {pipeline["films"]:.1f} фильмов/сек.',
+          flush=True)
+    print(f'Пиковый объем памяти: {pipeline["memory"]:.0f} КБ.', flush=True)
+
+    preprocessing = results['preprocessing']
+    print(f'Предварительная обработка ({preprocessing["films"]} фильмов): '
+          f'{preprocessing["seconds"]:.3f} сек. '
+          f'(исходная реализация {preprocessing["reference"]:.3f} сек.).',
+          flush=True)
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(json.dumps(results, indent=4))
+
+    if options.save:
+        with open(BASELINE, 'w') as file:
+            file.write(json.dumps(results, indent=4))
+        return None
+
+    if not os.path.exists(BASELINE):
+        return None
+
+    with open(BASELINE) as file:
+        baseline = json.loads(file.read())
+
+    if (baseline['backend'], baseline['format']) != (options.backend,
+                                                     options.format):
+        print('Базовые результаты получены с другими настройками.',
+              flush=True)
+        return None
+
+    if regressions := compare(results, baseline, options.tolerance):
+        print('Регрессии:', flush=True)
+        for metric, values in regressions.items():
+            print(f'{metric:22} {values["baseline"]:10.1f} -> '
+                  f'{values["current"]:10.1f}',
+                  flush=True)
+        sys.exit(1)
+
+    print('Регрессий нет.', flush=True)
+
+
+if __name__ == '__main__':
+    main()
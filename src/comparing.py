@@ -0,0 +1,38 @@
+import os
+import pathlib
+
+from utils.comparison import compare
+
+
+def main():
+    """
+    Точка входа сравнения парсеров страниц фильмов по сохраненным
+    страницам;
+
+    :return: None.
+    """
+
+    os.system('cls')
+
+    if path := input('Укажите путь к каталогу с html-страницами фильмов: '):
+        files = sorted(pathlib.Path(path).glob('*.html'))
+        texts = [file.read_text(encoding='utf-8') for file in files]
+
+        result = compare(texts)
+
+        print(f'Количество страниц: {len(texts)}.', flush=True)
+
+        print('Время парсинга:', flush=True)
+        for backend, seconds in result['timings'].items():
+            speed = len(texts) / seconds if seconds else 0.0
+            print(f'{backend:6} {seconds:10.2f} сек. {speed:10.2f} стр./сек.',
+                  flush=True)
+
+        for backend, fields in result['mismatches'].items():
+            print(f'Расхождения ({backend}):', flush=True)
+            for field, count in fields.items():
+                print(f'{field:11} {count:6}', flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+from config.paths import PROJECT_PATH
+
+
+CORPUS = PROJECT_PATH + r'\resources\benchmark'
+BASELINE = CORPUS + r'\baseline.json'
+
+REPEAT = 5
+CATALOGUE = 20000
+TOLERANCE = 0.25
+RESOLUTION = 5
@@ -0,0 +1,13 @@
+import os
+
+
+CHUNK = 2 ** 18
+
+EXPORT = 'link'
+WORKERS = 16
+
+SHAPES = [(300, 200)]
+IMAGES = 256
+PROCESSES = os.cpu_count()
+MEAN = (0.485, 0.456, 0.406)
+STD = (0.229, 0.224, 0.225)
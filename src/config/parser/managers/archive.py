@@ -0,0 +1,9 @@
+ARCHIVE = 'archive'
+
+DATABASE = 'archive.db'
+
+SEGMENT = 2 ** 30
+
+LEVEL = 6
+
+CHUNK = 256
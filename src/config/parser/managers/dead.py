@@ -0,0 +1 @@
+DEAD = 'dead.jsonl'
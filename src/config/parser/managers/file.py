@@ -50,5 +50,107 @@ FIELD_NAMES = {
     'countries': [
         'id',
         'country'
+    ],
+    'ratings': [
+        'id',
+        'date',
+        'rating'
     ]
 }
+
+BUFFER = {
+    'size': 2 ** 20,
+    'interval': 30
+}
+
+CHUNK = 2 ** 24
+
+FIELD_TYPES = {
+    'movies': {
+        'id': 'int32',
+        'name': 'string',
+        'date': 'int16',
+        'tagline': 'string',
+        'description': 'string',
+        'minute': 'int32',
+        'rating': 'float32'
+    },
+    'posters': {
+        'id': 'int32',
+        'link': 'string'
+    },
+    'actors': {
+        'id': 'int32',
+        'name': 'string',
+        'role': 'string'
+    },
+    'crew': {
+        'id': 'int32',
+        'role': 'category',
+        'name': 'string'
+    },
+    'releases': {
+        'id': 'int32',
+        'country': 'category',
+        'date': 'date',
+        'type': 'category',
+        'rating': 'category'
+    },
+    'genres': {
+        'id': 'int32',
+        'genre': 'category'
+    },
+    'themes': {
+        'id': 'int32',
+        'theme': 'category'
+    },
+    'languages': {
+        'id': 'int32',
+        'type': 'category',
+        'language': 'category'
+    },
+    'studios': {
+        'id': 'int32',
+        'studio': 'string'
+    },
+    'countries': {
+        'id': 'int32',
+        'country': 'category'
+    },
+    'ratings': {
+        'id': 'int32',
+        'date': 'date',
+        'rating': 'float32'
+    }
+}
+
+GROUP = 2 ** 17
+
+COMPRESSION = 'zstd'
+
+DATABASE = 'data.db'
+
+TABLES = 'tables'
+
+DIMENSIONS = {
+    'actors': {'name': 'person'},
+    'crew': {'name': 'person'},
+    'releases': {'country': 'country'},
+    'genres': {'genre': 'genre'},
+    'themes': {'theme': 'theme'},
+    'languages': {'language': 'language'},
+    'studios': {'studio': 'studio'},
+    'countries': {'country': 'country'}
+}
+
+INDEXES = {
+    'actors': [['id']],
+    'crew': [['id']],
+    'releases': [['id'], ['country', 'type', 'date']],
+    'genres': [['id']],
+    'themes': [['id']],
+    'languages': [['id']],
+    'studios': [['id']],
+    'countries': [['id']],
+    'ratings': [['id']]
+}
@@ -0,0 +1,7 @@
+INDEX = 'index.db'
+
+IDENTIFIER = 10 ** 9
+
+SPAN = 10 ** 6
+
+DAY = 24 * 60 * 60
@@ -0,0 +1,3 @@
+CACHE = 'cache'
+
+EVICTION = 64
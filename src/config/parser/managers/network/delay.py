@@ -0,0 +1,2 @@
+CAPACITY = 1
+INCREASE = 0.1
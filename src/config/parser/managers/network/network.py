@@ -5,3 +5,19 @@ HEADERS = {
                   r"Chrome/113.0.0.0 Safari/537.36"
 }
 URL = r'https://letterboxd.com'
+CHUNK = 2 ** 16
+
+ENCODINGS = ('br', 'gzip', 'deflate')
+
+CONNECTOR = {
+    'limit': 64,
+    'keepalive_timeout': 30,
+    'ttl_dns_cache': 600
+}
+
+TIMEOUT = {
+    'total': None,
+    'connect': 30,
+    'sock_connect': 10,
+    'sock_read': 30
+}
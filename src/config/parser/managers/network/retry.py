@@ -0,0 +1,10 @@
+ATTEMPTS = {
+    'throttled': 20,
+    'server': 5,
+    'network': 5,
+    'client': 1
+}
+
+BACKOFF = (0.5, 60)
+
+DEADLINE = 600
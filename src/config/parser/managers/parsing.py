@@ -12,3 +12,11 @@ PARSING_FIELDS = [
     'minute',
     'rating'
 ]
+
+PARSING_DEFAULTS = {
+    'actors': [],
+    'crew': {},
+    'details': {},
+    'genres': {},
+    'releases': {}
+}
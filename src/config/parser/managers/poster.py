@@ -0,0 +1,3 @@
+STORE = 'store'
+
+DATABASE = 'store.db'
@@ -0,0 +1,11 @@
+QUEUE = 'queue.db'
+
+SHARDS = 'shards'
+
+RANGE = 10
+
+LEASE = 5 * 60
+
+HEARTBEAT = 60
+
+SHARES = 4
@@ -1,9 +1,23 @@
-VALID_ATTEMPTS = 5
+import os
+
 
 SETTINGS = {
-        'span': (1, 10),
-        'factor': 5,
+        'rates': (0.1, 20),
+        'factor': 2,
         'threshold': 35,
+        'rate': 1,
+        'images': 2,
+        'cache': 'on',
+        'capacity': 2 ** 31,
         'mode': 'w',
+        'format': 'csv',
+        'refresh': 30,
+        'archive': True,
         'timeout': 1,
+        'requests': 18,
+        'downloads': 8,
+        'queue': 36,
+        'batch': 1,
+        'workers': os.cpu_count(),
+        'backend': 'lxml',
 }
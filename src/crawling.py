@@ -0,0 +1,70 @@
+import asyncio
+import os
+import socket
+import sys
+import time
+
+from config.parser.managers.work import SHARES
+from config.parser.parser import SETTINGS
+from config.paths import FILE_RAW_PATH
+from parser.coordinator import Coordinator
+from parser.worker import work
+from utils.explorer import explorer
+
+
+def main():
+    """
+    Точка входа распределенного сбора данных. Без аргументов запускает
+    координатор и локальные процессы сбора данных, с аргументами
+    <директория> [имя] - процесс сбора данных, подключающийся к очереди
+    задач в общем каталоге (например, на другом компьютере);
+
+    :return: None.
+    """
+
+    if len(sys.argv) > 1:
+        directory = sys.argv[1]
+        default = f'{socket.gethostname()}-{os.getpid()}'
+        name = sys.argv[2] if len(sys.argv) > 2 else default
+
+        print(f'Выполнено задач: {work(directory, name)}.', flush=True)
+        return None
+
+    coordinator = Coordinator()
+
+    os.system('cls')
+
+    names = explorer(FILE_RAW_PATH, exclude=('checkpoints', 'cache'))
+    print('Список директорий:', names, sep='\n', flush=True)
+    directory = input('Укажите имя директории: ')
+
+    shares = input(f'Количество процессов сбора данных ({SHARES}): ')
+    shares = int(shares or SHARES)
+
+    print('Разбиение страниц на задачи...', end=' ', flush=True)
+    if not (tasks := asyncio.run(coordinator.plan(directory,
+                                                  SETTINGS,
+                                                  shares))):
+        print('Неудача.', flush=True)
+        return None
+    print(f'Ок ({tasks}).', flush=True)
+
+    start = time.perf_counter()
+    coordinator.start(shares)
+
+    while (stat := coordinator.supervise())['done'] < tasks:
+        print(f'\rВыполнено задач: {stat["done"]} из {tasks}, '
+              f'в работе: {stat["leased"]}, '
+              f'процессов: {len(stat["workers"])}.',
+              end='',
+              flush=True)
+        time.sleep(SETTINGS['timeout'])
+
+    print(f'\rВыполнено задач: {tasks} из {tasks}.', flush=True)
+    print(f'Количество постеров: {coordinator.merge()}.', flush=True)
+    print(f'Время сбора данных: {time.perf_counter() - start:.2f} сек.',
+          flush=True)
+
+
+if __name__ == '__main__':
+    main()
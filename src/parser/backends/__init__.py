@@ -0,0 +1,8 @@
+from parser.backends.soup import SoupBackend
+from parser.backends.xpath import XPathBackend
+
+
+BACKENDS = {
+    'soup': SoupBackend,
+    'lxml': XPathBackend
+}
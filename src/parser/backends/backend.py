@@ -0,0 +1,309 @@
+import abc
+import datetime
+import json
+
+
+class Document(object):
+    """
+    Разобранная страница фильма;
+
+    :var tree: корень дерева элементов страницы;
+    :var tabs: вкладки блока tabbed-content по их идентификаторам;
+    :var data: структурированные данные блока ld+json.
+    """
+
+    def __init__(self, tree, tabs: dict, data: dict):
+        self.tree = tree
+        self.tabs: dict = tabs
+        self.data: dict = data
+
+    def tab(self, name: str):
+        """
+        Возвращает вкладку блока tabbed-content;
+
+        :param name: идентификатор вкладки;
+        :return: вкладка.
+        """
+
+        try:
+            return self.tabs[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+class Backend(abc.ABC):
+    """
+    Интерфейс парсера страниц фильмов. Методы полей возвращают спарсенное
+    значение либо возбуждают AttributeError, ValueError, KeyError,
+    IndexError или TypeError, если поле не найдено на странице или имеет
+    неожиданный тип (например, пустой рейтинг). Поля, имеющиеся
+    в блоке ld+json, берутся из структурированных данных страницы,
+    остальные - из дерева элементов.
+    """
+
+    @abc.abstractmethod
+    def document(self, text: str) -> Document:
+        """
+        Разбирает страницу фильма;
+
+        :param text: данные для парсинга;
+        :return: разобранная страница.
+        """
+
+    def link(self, document: Document) -> str:
+        """
+        Осуществляет парсинг ссылки на изображение;
+
+        :param document: разобранная страница;
+        :return: ссылка на изображение.
+        """
+
+        return document.data['image']
+
+    @abc.abstractmethod
+    def name(self, document: Document) -> str:
+        """
+        Осуществляет парсинг названия фильма;
+
+        :param document: разобранная страница;
+        :return: название фильма.
+        """
+
+    @abc.abstractmethod
+    def date(self, document: Document) -> int:
+        """
+        Осуществляет парсинг года выхода фильма;
+
+        :param document: разобранная страница;
+        :return: год выхода фильма.
+        """
+
+    @abc.abstractmethod
+    def description(self, document: Document) -> str:
+        """
+        Осуществляет парсинг описания фильма;
+
+        :param document: разобранная страница;
+        :return: описание фильма.
+        """
+
+    @abc.abstractmethod
+    def tagline(self, document: Document) -> str:
+        """
+        Осуществляет парсинг слогана фильма;
+
+        :param document: разобранная страница;
+        :return: слоган фильма.
+        """
+
+    @abc.abstractmethod
+    def actors(self, document: Document) -> list:
+        """
+        Осуществляет парсинг актеров фильма;
+
+        :param document: разобранная страница;
+        :return: актеры фильма.
+        """
+
+    @abc.abstractmethod
+    def crew(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг съемочной группы фильма;
+
+        :param document: разобранная страница;
+        :return: съемочная группа.
+        """
+
+    @abc.abstractmethod
+    def details(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг деталей фильма (язык, киностудия, страна);
+
+        :param document: разобранная страница;
+        :return: детали фильма.
+        """
+
+    @abc.abstractmethod
+    def genres(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг жанров фильма;
+
+        :param document: разобранная страница;
+        :return: жанры фильма.
+        """
+
+    @abc.abstractmethod
+    def releases(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг релизов фильма;
+
+        :param document: разобранная страница;
+        :return: релизы фильма.
+        """
+
+    @abc.abstractmethod
+    def minute(self, document: Document) -> int:
+        """
+        Осуществляет парсинг продолжительности фильма (в минутах);
+
+        :param document: разобранная страница;
+        :return: продолжительность фильма (в минутах).
+        """
+
+    def rating(self, document: Document) -> float:
+        """
+        Осуществляет парсинг рейтинга фильма;
+
+        :param document: разобранная страница;
+        :return: рейтинг фильма.
+        """
+
+        return float(document.data['aggregateRating']['ratingValue'])
+
+
+def crew(string: str) -> str:
+    """
+    Приводит категорию съемочной группы к единственному числу;
+
+    :param string: категория;
+    :return: категория в единственном числе.
+    """
+
+    return (string
+            .replace('Directors', 'Director')
+            .replace('Operators', 'Operator')
+            .replace('Composers', 'Composer')
+            .replace('Producers', 'Producer')
+            .replace('Writers', 'Writer')
+            .replace('Editors', 'Editor')
+            .capitalize())
+
+
+def details(string: str) -> str:
+    """
+    Приводит категорию деталей фильма к единственному числу;
+
+    :param string: категория;
+    :return: категория в единственном числе.
+    """
+
+    return (string
+            .replace('Languages', 'Language')
+            .replace('Studios', 'Studio')
+            .replace('Countries', 'Country')
+            .capitalize())
+
+
+def genres(string: str) -> str:
+    """
+    Приводит категорию жанров фильма к единственному числу;
+
+    :param string: категория;
+    :return: категория в единственном числе.
+    """
+
+    return (string
+            .replace('Genres', 'Genre')
+            .replace('Themes', 'Theme')
+            .capitalize())
+
+
+def rating(string: str) -> str | None:
+    """
+    Проверяет, является ли строка возрастным рейтингом релиза;
+
+    :param string: строка;
+    :return: возрастной рейтинг релиза.
+    """
+
+    digit = ''.join(char
+                    if char.isdigit()
+                    else ''
+                    for char in string)
+    chars = ''.join(char
+                    if not char.isdigit()
+                    else ''
+                    for char in string)
+    symbols = ''.join(char
+                      if not char.isdigit() and not char.isalpha()
+                      else ''
+                      for char in string)
+
+    if (len(digit) <= 3 and
+            len(string) < 6 and
+            string.isascii() and
+            (len(chars) == 0 or chars.isupper()) and
+            (not symbols or set(symbols) < {'-', '/', '+'})):
+        return string.strip()
+    else:
+        return None
+
+
+def date(string: str) -> str:
+    """
+    Приводит дату релиза к формату ГГГГ-ММ-ДД;
+
+    :param string: дата релиза;
+    :return: дата релиза в формате ГГГГ-ММ-ДД.
+    """
+
+    return (datetime
+            .datetime
+            .strptime(string, '%d %b %Y')
+            .strftime('%Y-%m-%d'))
+
+
+def structured(contents: str) -> dict:
+    """
+    Декодирует структурированные данные блока ld+json;
+
+    :param contents: содержимое блока ld+json;
+    :return: структурированные данные.
+    """
+
+    start = contents.find('{')
+    finish = contents.rfind('}') + 1
+
+    try:
+        data = json.loads(contents[start:finish])
+    except ValueError:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def find(data: dict, *keys):
+    """
+    Возвращает вложенное значение структурированных данных;
+
+    :param data: структурированные данные;
+    :param keys: ключи и индексы пути к значению;
+    :return: значение или None, если путь отсутствует.
+    """
+
+    try:
+        for key in keys:
+            data = data[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    return data
+
+
+def genre(data: dict) -> list[str] | None:
+    """
+    Возвращает жанры фильма из структурированных данных;
+
+    :param data: структурированные данные;
+    :return: жанры фильма или None, если они отсутствуют.
+    """
+
+    genres = find(data, 'genre')
+
+    if isinstance(genres, str):
+        genres = [genres]
+
+    if not isinstance(genres, list) or not genres:
+        return None
+
+    return [' '.join(str(name).split()) for name in genres]
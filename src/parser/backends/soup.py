@@ -0,0 +1,265 @@
+import bs4
+
+from bs4 import BeautifulSoup
+
+from parser.backends import backend
+from parser.backends.backend import Backend
+from parser.backends.backend import Document
+
+
+class SoupBackend(Backend):
+    """
+    Парсер страниц фильмов на основе BeautifulSoup и html.parser.
+    """
+
+    def document(self, text: str) -> Document:
+        """
+        Разбирает страницу фильма. Находит блок tabbed-content и его вкладки,
+        декодирует блок ld+json;
+
+        :param text: данные для парсинга;
+        :return: разобранная страница.
+        """
+
+        soup = BeautifulSoup(text, 'html.parser')
+
+        data = {}
+        if html := soup.find('script', type="application/ld+json"):
+            data = backend.structured(html.get_text())
+
+        tabs = {}
+        if tabbed := soup.find('div', id='tabbed-content'):
+            for tab in tabbed.find_all('div', id=True):
+                if tab['id'].startswith('tab-'):
+                    tabs.setdefault(tab['id'], tab)
+
+        return Document(soup, tabs, data)
+
+    def name(self, document: Document) -> str:
+        """
+        Осуществляет парсинг названия фильма;
+
+        :param document: разобранная страница;
+        :return: название фильма.
+        """
+
+        if isinstance(name := backend.find(document.data, 'name'), str):
+            return name
+
+        return (document
+                .tree
+                .find('section', class_="film-header-group")
+                .find('h1')
+                .text)
+
+    def date(self, document: Document) -> int:
+        """
+        Осуществляет парсинг года выхода фильма;
+
+        :param document: разобранная страница;
+        :return: год выхода фильма.
+        """
+
+        date = backend.find(document.data, 'releasedEvent', 0, 'startDate')
+        if isinstance(date, str) and date.isdigit():
+            return int(date)
+
+        date = (document
+                .tree
+                .find('section', class_="film-header-group")
+                .find('div', class_="releaseyear")
+                .text)
+
+        return int(date)
+
+    def description(self, document: Document) -> str:
+        """
+        Осуществляет парсинг описания фильма;
+
+        :param document: разобранная страница;
+        :return: описание фильма.
+        """
+
+        class_ = 'review body-text -prose -hero prettify'
+        description = (document
+                       .tree
+                       .find('div', class_=class_)
+                       .find('p')
+                       .text)
+
+        return description.replace('\n', ' ')
+
+    def tagline(self, document: Document) -> str:
+        """
+        Осуществляет парсинг слогана фильма;
+
+        :param document: разобранная страница;
+        :return: слоган фильма.
+        """
+
+        class_ = 'review body-text -prose -hero prettify'
+
+        return (document
+                .tree
+                .find('div', class_=class_)
+                .find('h4')
+                .text)
+
+    def actors(self, document: Document) -> list:
+        """
+        Осуществляет парсинг актеров фильма;
+
+        :param document: разобранная страница;
+        :return: актеры фильма.
+        """
+
+        actors = (document
+                  .tab('tab-cast')
+                  .find_all('a', class_='text-slug tooltip'))
+
+        return [[actor.text, actor.attrs.get('title', None)]
+                for actor in actors]
+
+    def crew(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг съемочной группы фильма;
+
+        :param document: разобранная страница;
+        :return: съемочная группа.
+        """
+
+        crew = {}
+
+        category = ''
+        for tag in document.tab('tab-crew').contents:
+            if isinstance(tag, bs4.Tag):
+                if tag.name == 'h3':
+                    category = backend.crew(tag.find('span').text)
+                    crew[category] = []
+                else:
+                    names = tag.find_all('a')
+                    names = [name.text for name in names]
+                    crew[category] += names
+
+        return crew
+
+    def details(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг деталей фильма (язык, киностудия, страна);
+
+        :param document: разобранная страница;
+        :return: детали фильма.
+        """
+
+        details = {}
+
+        category = ''
+        for tag in document.tab('tab-details').contents:
+            if isinstance(tag, bs4.Tag):
+                if tag.name == 'h3':
+                    category = backend.details(tag.find('span').text)
+                    if category in ['Alternative titles',
+                                    'Alternative title']:
+                        break
+                    details[category] = []
+                else:
+                    names = tag.find_all('a')
+                    names = [name.text for name in names]
+                    details[category] += names
+
+        if details.get('Language') == ['No spoken language']:
+            details.pop('Language')
+
+        return details
+
+    def genres(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг жанров фильма;
+
+        :param document: разобранная страница;
+        :return: жанры фильма.
+        """
+
+        genres, served = {}, set()
+
+        if genre := backend.genre(document.data):
+            genres['Genre'], served = genre, {'Genre'}
+
+        category = ''
+        for tag in document.tab('tab-genres').contents:
+            if isinstance(tag, bs4.Tag):
+                if tag.name == 'h3':
+                    category = backend.genres(tag.find('span').text)
+                    if category not in served:
+                        genres[category] = []
+                elif category not in served:
+                    names = tag.find_all('a')
+                    names = [' '.join(name.text.split()) for name in names]
+                    genres[category] += names
+
+        if 'Theme' in genres and 'Show All…' in genres['Theme']:
+            genres['Theme'].remove('Show All…')
+
+        return genres
+
+    def releases(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг релизов фильма;
+
+        :param document: разобранная страница;
+        :return: релизы фильма.
+        """
+
+        releases = {}
+
+        tags = (document
+                .tab('tab-releases-by-country')
+                .find('div', class_='release-table -bycountry')
+                .contents)
+
+        for tag in tags:
+            if isinstance(tag, bs4.Tag) and tag.name == 'div':
+                country = (tag
+                           .find('div', class_='cell')
+                           .text
+                           .strip())
+
+                releases[country] = []
+
+                details = (tag
+                           .find('div', class_='cell details')
+                           .find_all('div', class_='release-date-list'))
+
+                for detail in details:
+                    date = backend.date(detail.find('h6', class_="date").text)
+
+                    info = detail.find('ul', class_="releases")
+
+                    form = (info
+                            .find('span', class_="type")
+                            .text
+                            .strip())
+
+                    rating = info.find('span', class_="label")
+                    rating = backend.rating(rating.text) if rating else None
+
+                    releases[country].append([date, form, rating])
+
+        return releases
+
+    def minute(self, document: Document) -> int:
+        """
+        Осуществляет парсинг продолжительности фильма (в минутах);
+
+        :param document: разобранная страница;
+        :return: продолжительность фильма (в минутах).
+        """
+
+        minute = (document
+                  .tree
+                  .find('p', class_="text-link text-footer")
+                  .strings)
+        minute = [*minute][0].strip()
+        minute = ''.join(m for m in minute if m.isdigit())
+
+        return int(minute)
@@ -0,0 +1,317 @@
+import lxml.etree
+import lxml.html
+
+from parser.backends import backend
+from parser.backends.backend import Backend
+from parser.backends.backend import Document
+
+
+def first(element, path: lxml.etree.XPath):
+    """
+    Возвращает первый элемент, найденный по выражению XPath;
+
+    :param element: элемент, относительно которого выполняется поиск;
+    :param path: скомпилированное выражение XPath;
+    :return: найденный элемент.
+    """
+
+    found = path(element)
+
+    if not found:
+        raise AttributeError(path.path)
+
+    return found[0]
+
+
+def tags(element) -> list:
+    """
+    Возвращает дочерние элементы, исключая комментарии и инструкции;
+
+    :param element: элемент;
+    :return: дочерние элементы.
+    """
+
+    return [child for child in element if isinstance(child.tag, str)]
+
+
+def names(element) -> list[str]:
+    """
+    Возвращает тексты ссылок, вложенных в элемент;
+
+    :param element: элемент;
+    :return: тексты ссылок.
+    """
+
+    return [a.text_content() for a in element.iterdescendants('a')]
+
+
+def token(tag: str, class_: str) -> str:
+    """
+    Формирует выражение XPath поиска элемента, содержащего указанный класс;
+
+    :param tag: имя элемента;
+    :param class_: класс элемента;
+    :return: выражение XPath.
+    """
+
+    return (f'.//{tag}'
+            f'[contains(concat(" ", normalize-space(@class), " "), '
+            f'" {class_} ")]')
+
+
+def xpath(path: str) -> lxml.etree.XPath:
+    """
+    Компилирует выражение XPath;
+
+    :param path: выражение XPath;
+    :return: скомпилированное выражение XPath.
+    """
+
+    return lxml.etree.XPath(path)
+
+
+SCRIPT = xpath('.//script[@type="application/ld+json"]')
+SECTION = xpath(token('section', 'film-header-group'))
+HEADER = xpath('.//h1')
+YEAR = xpath(token('div', 'releaseyear'))
+REVIEW = xpath('.//div[@class="review body-text -prose -hero prettify"]')
+PARAGRAPH = xpath('.//p')
+TAGLINE = xpath('.//h4')
+CAST = xpath('.//a[@class="text-slug tooltip"]')
+SPAN = xpath('.//span')
+TABLE = xpath('.//div[@class="release-table -bycountry"]')
+CELL = xpath(token('div', 'cell'))
+DETAILS = xpath('.//div[@class="cell details"]')
+LIST = xpath(token('div', 'release-date-list'))
+DATE = xpath(token('h6', 'date'))
+RELEASES = xpath(token('ul', 'releases'))
+TYPE = xpath(token('span', 'type'))
+LABEL = xpath(token('span', 'label'))
+FOOTER = xpath('.//p[@class="text-link text-footer"]')
+TEXT = xpath('.//text()')
+
+
+class XPathBackend(Backend):
+    """
+    Парсер страниц фильмов на основе lxml. Блок tabbed-content
+    находится один раз, а все его вкладки собираются за один проход.
+    """
+
+    def document(self, text: str) -> Document:
+        """
+        Разбирает страницу фильма. Находит блок tabbed-content и его вкладки,
+        декодирует блок ld+json;
+
+        :param text: данные для парсинга;
+        :return: разобранная страница.
+        """
+
+        tree = lxml.html.document_fromstring(text)
+
+        data = {}
+        if html := SCRIPT(tree):
+            data = backend.structured(html[0].text or '')
+
+        tabs = {}
+        for tabbed in tree.iterfind('.//div[@id="tabbed-content"]'):
+            for tab in tabbed.iterdescendants('div'):
+                if (tab.get('id') or '').startswith('tab-'):
+                    tabs.setdefault(tab.get('id'), tab)
+            break
+
+        return Document(tree, tabs, data)
+
+    def name(self, document: Document) -> str:
+        """
+        Осуществляет парсинг названия фильма;
+
+        :param document: разобранная страница;
+        :return: название фильма.
+        """
+
+        if isinstance(name := backend.find(document.data, 'name'), str):
+            return name
+
+        section = first(document.tree, SECTION)
+
+        return first(section, HEADER).text_content()
+
+    def date(self, document: Document) -> int:
+        """
+        Осуществляет парсинг года выхода фильма;
+
+        :param document: разобранная страница;
+        :return: год выхода фильма.
+        """
+
+        date = backend.find(document.data, 'releasedEvent', 0, 'startDate')
+        if isinstance(date, str) and date.isdigit():
+            return int(date)
+
+        section = first(document.tree, SECTION)
+        date = first(section, YEAR).text_content()
+
+        return int(date)
+
+    def description(self, document: Document) -> str:
+        """
+        Осуществляет парсинг описания фильма;
+
+        :param document: разобранная страница;
+        :return: описание фильма.
+        """
+
+        review = first(document.tree, REVIEW)
+        description = first(review, PARAGRAPH).text_content()
+
+        return description.replace('\n', ' ')
+
+    def tagline(self, document: Document) -> str:
+        """
+        Осуществляет парсинг слогана фильма;
+
+        :param document: разобранная страница;
+        :return: слоган фильма.
+        """
+
+        review = first(document.tree, REVIEW)
+
+        return first(review, TAGLINE).text_content()
+
+    def actors(self, document: Document) -> list:
+        """
+        Осуществляет парсинг актеров фильма;
+
+        :param document: разобранная страница;
+        :return: актеры фильма.
+        """
+
+        actors = CAST(document.tab('tab-cast'))
+
+        return [[actor.text_content(), actor.get('title')]
+                for actor in actors]
+
+    def crew(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг съемочной группы фильма;
+
+        :param document: разобранная страница;
+        :return: съемочная группа.
+        """
+
+        crew = {}
+
+        category = ''
+        for tag in tags(document.tab('tab-crew')):
+            if tag.tag == 'h3':
+                category = backend.crew(first(tag, SPAN).text_content())
+                crew[category] = []
+            else:
+                crew[category] += names(tag)
+
+        return crew
+
+    def details(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг деталей фильма (язык, киностудия, страна);
+
+        :param document: разобранная страница;
+        :return: детали фильма.
+        """
+
+        details = {}
+
+        category = ''
+        for tag in tags(document.tab('tab-details')):
+            if tag.tag == 'h3':
+                category = backend.details(first(tag, SPAN).text_content())
+                if category in ['Alternative titles',
+                                'Alternative title']:
+                    break
+                details[category] = []
+            else:
+                details[category] += names(tag)
+
+        if details.get('Language') == ['No spoken language']:
+            details.pop('Language')
+
+        return details
+
+    def genres(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг жанров фильма;
+
+        :param document: разобранная страница;
+        :return: жанры фильма.
+        """
+
+        genres, served = {}, set()
+
+        if genre := backend.genre(document.data):
+            genres['Genre'], served = genre, {'Genre'}
+
+        category = ''
+        for tag in tags(document.tab('tab-genres')):
+            if tag.tag == 'h3':
+                category = backend.genres(first(tag, SPAN).text_content())
+                if category not in served:
+                    genres[category] = []
+            elif category not in served:
+                genres[category] += [' '.join(name.split())
+                                     for name in names(tag)]
+
+        if 'Theme' in genres and 'Show All…' in genres['Theme']:
+            genres['Theme'].remove('Show All…')
+
+        return genres
+
+    def releases(self, document: Document) -> dict:
+        """
+        Осуществляет парсинг релизов фильма;
+
+        :param document: разобранная страница;
+        :return: релизы фильма.
+        """
+
+        releases = {}
+
+        table = first(document.tab('tab-releases-by-country'), TABLE)
+
+        for tag in tags(table):
+            if tag.tag == 'div':
+                country = first(tag, CELL).text_content().strip()
+
+                releases[country] = []
+
+                details = LIST(first(tag, DETAILS))
+
+                for detail in details:
+                    date = first(detail, DATE).text_content()
+                    date = backend.date(date)
+
+                    info = first(detail, RELEASES)
+
+                    form = first(info, TYPE).text_content().strip()
+
+                    rating = LABEL(info)
+                    rating = (backend.rating(rating[0].text_content())
+                              if rating
+                              else None)
+
+                    releases[country].append([date, form, rating])
+
+        return releases
+
+    def minute(self, document: Document) -> int:
+        """
+        Осуществляет парсинг продолжительности фильма (в минутах);
+
+        :param document: разобранная страница;
+        :return: продолжительность фильма (в минутах).
+        """
+
+        footer = first(document.tree, FOOTER)
+        minute = TEXT(footer)[0].strip()
+        minute = ''.join(m for m in minute if m.isdigit())
+
+        return int(minute)
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+
+from config.parser.managers.work import RANGE
+from config.parser.managers.work import SHARDS
+from config.paths import FILE_RAW_PATH
+from parser.managers.network.cache import place
+from parser.managers.work import WorkManager
+from parser.parser import Parser
+from parser.worker import work
+
+
+class Coordinator(object):
+    """
+    Координатор распределенного сбора данных, задачами которого являются:
+
+    - разбиение страниц на задачи в общей очереди;
+    - запуск локальных процессов сбора данных и перезапуск завершившихся
+      процессов, пока в очереди остаются свободные задачи;
+    - объединение постеров шардов;
+
+    :var directory: имя директории с данными;
+    :var work: менеджер очереди задач;
+    :var processes: локальные процессы сбора данных по именам.
+    """
+
+    def __init__(self):
+        self.directory: str | None = None
+        self.work: WorkManager = WorkManager()
+        self.processes: dict[str, multiprocessing.Process] = {}
+
+    async def plan(self, directory: str, settings: dict, shares: int) -> int:
+        """
+        Получает номер последней страницы и разбивает страницы на задачи
+        по RANGE страниц. Частота запросов settings делится между shares
+        процессами;
+
+        :param directory: имя директории с данными;
+        :param settings: настройки сбора данных;
+        :param shares: количество процессов сбора данных;
+        :return: количество задач.
+        """
+
+        self.directory = directory
+
+        path = fr'{FILE_RAW_PATH}\{directory}'
+        os.makedirs(path, exist_ok=True)
+
+        parser = Parser()
+
+        try:
+            await parser.connect()
+
+            parser.network.setting(rates=settings['rates'],
+                                   factor=settings['factor'],
+                                   threshold=settings['threshold'],
+                                   rate=settings['rate'],
+                                   images=settings['images'],
+                                   cache=settings['cache'],
+                                   capacity=settings['capacity'])
+
+            last = await parser.page()
+        finally:
+            await parser.disconnect()
+
+        if last is None:
+            return 0
+
+        self.work.open(path)
+
+        return self.work.plan(1, last, RANGE, settings | {'shares': shares})
+
+    def start(self, shares: int) -> None:
+        """
+        Запускает локальные процессы сбора данных;
+
+        :param shares: количество процессов сбора данных;
+        :return: None.
+        """
+
+        for number in range(1, shares + 1):
+            self.spawn(f'worker-{number:02}')
+
+    def spawn(self, name: str) -> None:
+        """
+        Запускает локальный процесс сбора данных;
+
+        :param name: имя процесса;
+        :return: None.
+        """
+
+        process = multiprocessing.Process(target=work,
+                                          args=(self.directory, name),
+                                          name=name)
+        process.start()
+
+        self.processes[name] = process
+
+    def supervise(self) -> dict:
+        """
+        Перезапускает завершившиеся локальные процессы, если в очереди
+        остались свободные задачи или задачи с истекшей арендой;
+
+        :return: количество задач по состояниям.
+        """
+
+        stat = self.work.stat()
+
+        for name, process in self.processes.items():
+            if not process.is_alive() and (stat['pending'] or
+                                           stat['expired']):
+                process.join()
+                self.spawn(name)
+
+        return stat
+
+    def merge(self) -> int:
+        """
+        Дожидается завершения локальных процессов и связывает постеры
+        шардов с каталогом постеров. Таблицы шардов объединяются
+        при чтении данных;
+
+        :return: количество постеров.
+        """
+
+        for process in self.processes.values():
+            process.join()
+
+        self.work.close()
+
+        path = fr'{FILE_RAW_PATH}\{self.directory}'
+        posters = fr'{path}\posters'
+
+        os.makedirs(posters, exist_ok=True)
+
+        for shard in sorted(os.listdir(fr'{path}\{SHARDS}')):
+            with os.scandir(fr'{path}\{SHARDS}\{shard}\posters') as entries:
+                for entry in entries:
+                    if not os.path.exists(fr'{posters}\{entry.name}'):
+                        place(entry.path, fr'{posters}\{entry.name}')
+
+        return len(os.listdir(posters))
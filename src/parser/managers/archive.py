@@ -0,0 +1,311 @@
+import asyncio
+import datetime
+import gzip
+import os
+import shutil
+import sqlite3
+import uuid
+
+from config.parser.managers.archive import ARCHIVE
+from config.parser.managers.archive import DATABASE
+from config.parser.managers.archive import LEVEL
+from config.parser.managers.archive import SEGMENT
+
+
+def record(i: int, link: str, text: str) -> bytes:
+    """
+    Формирует запись архива в формате WARC (resource), сжатую отдельным
+    членом gzip, поэтому каждая запись читается независимо от остальных;
+
+    :param i: id фильма;
+    :param link: ссылка на страницу фильма;
+    :param text: страница фильма;
+    :return: сжатая запись архива.
+    """
+
+    body = text.encode('utf-8')
+    date = datetime.datetime.now(datetime.UTC)
+
+    headers = [
+        'WARC/1.1',
+        'WARC-Type: resource',
+        f'WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>',
+        f'WARC-Date: {date.strftime("%Y-%m-%dT%H:%M:%SZ")}',
+        f'WARC-Target-URI: {link}',
+        'Content-Type: text/html; charset=utf-8',
+        f'Content-Length: {len(body)}',
+        f'Film-Id: {i}'
+    ]
+
+    data = '\r\n'.join(headers).encode('utf-8') + b'\r\n\r\n'
+    data += body + b'\r\n\r\n'
+
+    return gzip.compress(data, compresslevel=LEVEL, mtime=0)
+
+
+def parse(data: bytes) -> tuple[dict, str]:
+    """
+    Распаковывает запись архива;
+
+    :param data: сжатая запись архива;
+    :return: заголовки записи и страница фильма.
+    """
+
+    data = gzip.decompress(data)
+    head, body = data.split(b'\r\n\r\n', 1)
+
+    headers = dict(line.split(': ', 1)
+                   for line in head.decode('utf-8').split('\r\n')[1:])
+    body = body[:int(headers['Content-Length'])]
+
+    return headers, body.decode('utf-8')
+
+
+class ArchiveManager(object):
+    """
+    Менеджер архива страниц фильмов, задачами которого являются:
+
+    - дописывание полученных страниц в сжатые сегменты архива;
+    - ведение индекса смещений записей в сегментах;
+    - чтение записей архива для повторного парсинга;
+
+    Записи индекса накапливаются в памяти и записываются вместе с данными,
+    а при возобновлении сбора данных сегмент обрезается до последней
+    записи индекса, поэтому архив не опережает записанные на диск данные;
+
+    :var enabled: флаг ведения архива;
+    :var path: путь к каталогу архива;
+    :var connection: соединение с базой данных индекса архива;
+    :var file: текущий сегмент архива;
+    :var segment: номер текущего сегмента;
+    :var offset: размер текущего сегмента;
+    :var pending: записи индекса, не записанные на диск;
+    :var size: размер архива.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.path: str | None = None
+        self.connection: sqlite3.Connection | None = None
+        self.file = None
+        self.segment: int = 0
+        self.offset: int = 0
+        self.pending: list[tuple] = []
+        self.size: int = 0
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает архив. В режиме 'w' архив создается заново, в режиме 'a'
+        записи, отсутствующие в индексе, удаляются, в режиме 'r' архив
+        открывается только для чтения;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        self.path = fr'{path}\{ARCHIVE}'
+
+        if mode == 'w':
+            shutil.rmtree(self.path, ignore_errors=True)
+        if mode == 'r' or self.enabled:
+            os.makedirs(self.path, exist_ok=True)
+        else:
+            return None
+
+        self.connection = sqlite3.connect(fr'{self.path}\{DATABASE}',
+                                          check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS records ('
+                'id INTEGER NOT NULL, '
+                'date TEXT NOT NULL, '
+                'segment INTEGER NOT NULL, '
+                'offset INTEGER NOT NULL, '
+                'length INTEGER NOT NULL)'
+            )
+
+        if mode != 'r':
+            self.recover()
+
+    def recover(self) -> None:
+        """
+        Открывает последний сегмент архива для записи. Сегменты и записи
+        после последней записи индекса удаляются;
+
+        :return: None.
+        """
+
+        row = self.connection.execute(
+            'SELECT segment, offset + length FROM records '
+            'ORDER BY segment DESC, offset DESC LIMIT 1'
+        ).fetchone()
+
+        self.segment, self.offset = row or (0, 0)
+        self.size = 0
+
+        for file in sorted(os.listdir(self.path)):
+            if not file.startswith('segment-'):
+                continue
+
+            path = fr'{self.path}\{file}'
+
+            if int(file[8:13]) > self.segment:
+                os.remove(path)
+            else:
+                self.size += os.stat(path).st_size
+
+        path = self.locate(self.segment)
+
+        if os.path.exists(path):
+            self.size -= os.stat(path).st_size - self.offset
+            os.truncate(path, self.offset)
+
+        # Сегмент остается открытым до его смены или закрытия архива
+        self.file = open(path, 'ab')  # noqa: SIM115
+
+    def locate(self, segment: int) -> str:
+        """
+        Возвращает путь к сегменту архива;
+
+        :param segment: номер сегмента;
+        :return: путь к сегменту.
+        """
+
+        return fr'{self.path}\segment-{segment:05}.warc.gz'
+
+    async def write(self, i: int, link: str, text: str) -> None:
+        """
+        Дописывает страницу фильма в архив. Запись сжимается в отдельном
+        потоке. При достижении размера SEGMENT сегмент записывается на диск
+        и начинается новый сегмент;
+
+        :param i: id фильма;
+        :param link: ссылка на страницу фильма;
+        :param text: страница фильма;
+        :return: None.
+        """
+
+        if not self.file:
+            return None
+
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(None, record, i, link, text)
+
+        if self.offset >= SEGMENT:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+            self.segment, self.offset = self.segment + 1, 0
+            # Новый сегмент остается открытым до его смены или закрытия
+            self.file = open(  # noqa: SIM115
+                self.locate(self.segment), 'ab'
+            )
+
+        self.file.write(data)
+
+        date = datetime.date.today().isoformat()
+        self.pending.append((i, date, self.segment, self.offset, len(data)))
+
+        self.offset += len(data)
+        self.size += len(data)
+
+    def take(self) -> tuple[list[tuple], int | None]:
+        """
+        Извлекает записи индекса. Записанные записи архива передаются
+        операционной системе, а для принудительной записи на диск
+        возвращается копия дескриптора текущего сегмента;
+
+        :return: записи индекса и дескриптор сегмента.
+        """
+
+        if not self.file:
+            return [], None
+
+        self.file.flush()
+        pending, self.pending = self.pending, []
+
+        return pending, os.dup(self.file.fileno())
+
+    def dump(self, chunk: tuple[list[tuple], int | None], sync: bool) -> None:
+        """
+        Записывает записи индекса одной транзакцией после записи сегмента
+        на диск. Может выполняться в отдельном потоке;
+
+        :param chunk: записи индекса и дескриптор сегмента;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
+
+        pending, descriptor = chunk
+
+        if descriptor is None:
+            return None
+
+        try:
+            if sync:
+                os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO records (id, date, segment, offset, length) '
+                'VALUES (?, ?, ?, ?, ?)',
+                pending
+            )
+
+    def records(self) -> list[tuple]:
+        """
+        Возвращает записи индекса в порядке их записи в архив;
+
+        :return: id фильма, дата, номер сегмента, смещение и размер записи.
+        """
+
+        return self.connection.execute(
+            'SELECT id, date, segment, offset, length FROM records '
+            'ORDER BY segment, offset'
+        ).fetchall()
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся записи и закрывает архив;
+
+        :return: None.
+        """
+
+        if self.file:
+            self.dump(self.take(), sync=True)
+
+            self.file.close()
+            self.file = None
+
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def setting(self, enabled: bool) -> None:
+        """
+        Настраивает менеджер;
+
+        :param enabled: флаг ведения архива;
+        :return: None.
+        """
+
+        self.enabled = enabled
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - archive: флаг ведения архива.
+
+        :return: текущие параметры.
+        """
+
+        return {'archive': self.enabled}
@@ -0,0 +1,133 @@
+import datetime
+import json
+import os
+
+from config.parser.managers.dead import DEAD
+
+
+class DeadLetterManager(object):
+    """
+    Менеджер отложенных запросов, задачами которого являются:
+
+    - запись запросов, исчерпавших попытки, в файл формата json lines;
+    - выдача отложенных запросов для повторной обработки;
+
+    Отложенные запросы дописываются в файл сразу. После завершения сбора
+    данных файл перезаписывается запросами, отложенными в текущем сборе,
+    а после прерванного сбора повторяющиеся запросы объединяются
+    при чтении;
+
+    :var path: путь к файлу отложенных запросов;
+    :var file: файл отложенных запросов;
+    :var letters: отложенные запросы для повторной обработки;
+    :var failed: запросы, отложенные в текущем сборе данных.
+    """
+
+    def __init__(self):
+        self.path: str | None = None
+        self.file = None
+        self.letters: list[dict] = []
+        self.failed: list[dict] = []
+
+    @property
+    def count(self) -> int:
+        """
+        Возвращает количество отложенных запросов;
+
+        :return: количество отложенных запросов.
+        """
+
+        return len(self.letters) + len(self.failed)
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает файл отложенных запросов. В режиме 'w' файл создается
+        заново, в режиме 'a' отложенные запросы загружаются
+        для повторной обработки;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        self.path = fr'{path}\{DEAD}'
+        self.letters, self.failed = [], []
+
+        if mode == 'w' and os.path.exists(self.path):
+            os.remove(self.path)
+        elif mode == 'a' and os.path.exists(self.path):
+            letters = {}
+
+            with open(self.path, encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        letter = json.loads(line)
+                        letters[letter['kind'], letter['link']] = letter
+
+            self.letters = list(letters.values())
+
+        # Файл остается открытым до закрытия менеджера
+        self.file = open(self.path, 'a', encoding='utf-8')  # noqa: SIM115
+
+    def add(self,
+            kind: str,
+            link: str,
+            response: dict,
+            **fields) -> None:
+        """
+        Записывает запрос, исчерпавший попытки;
+
+        :param kind: вид запроса (page, movie, poster);
+        :param link: адрес запроса;
+        :param response: последний ответ на запрос;
+        :param fields: данные для повторной обработки запроса;
+        :return: None.
+        """
+
+        letter = {
+            'kind': kind,
+            'link': link,
+            **fields,
+            'code': response['code'],
+            'attempts': response.get('attempts', 1),
+            'time': datetime.datetime.now().isoformat(timespec='seconds')
+        }
+
+        self.failed.append(letter)
+
+        if self.file:
+            self.file.write(json.dumps(letter, ensure_ascii=False) + '\n')
+            self.file.flush()
+
+    def take(self) -> list[dict]:
+        """
+        Извлекает отложенные запросы для повторной обработки;
+
+        :return: отложенные запросы.
+        """
+
+        letters, self.letters = self.letters, []
+
+        return letters
+
+    def close(self) -> None:
+        """
+        Перезаписывает файл запросами, отложенными в текущем сборе данных,
+        и закрывает его;
+
+        :return: None.
+        """
+
+        if not self.file:
+            return None
+
+        self.file.close()
+        self.file = None
+
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as file:
+            for letter in self.letters + self.failed:
+                file.write(json.dumps(letter, ensure_ascii=False) + '\n')
+
+        os.replace(self.path + '.tmp', self.path)
@@ -1,4 +1,4 @@
-import csv
+import asyncio
 import json
 import os
 import pathlib
@@ -6,36 +6,76 @@ import pathlib
 from config.parser.managers.file import FIELD_NAMES
 from config.paths import CHECKPOINT_PATH
 from config.paths import FILE_RAW_PATH
+from parser.managers.archive import ArchiveManager
+from parser.managers.dead import DeadLetterManager
+from parser.managers.index import IndexManager
+from parser.managers.poster import PosterManager
+from parser.writers import WRITERS
+from parser.writers.writer import Writer
 
 
 class FileManager(object):
     """
     Файловый менеджер, задачами которого являются:
 
-    - запись собранных файлов в csv файл;
+    - запись собранных файлов в csv-файлы или в колоночном формате;
     - учет количества собранных данных;
+    - ведение индекса собранных фильмов;
+    - ведение архива страниц фильмов;
+    - хранение постеров фильмов;
+    - запись отложенных запросов;
     - чтение и запись контрольной точки в формате json;
 
     :var directory: имя директории с данными;
     :var checkpoint: имя файла контрольной точки в формате json;
-    :var size: размер файла с данными;
+    :var format: формат записи данных (csv, parquet, arrow, sqlite);
+    :var writer: буферизованная запись данных;
+    :var index: менеджер индекса собранных фильмов;
+    :var archive: менеджер архива страниц фильмов;
+    :var dead: менеджер отложенных запросов;
+    :var posters: менеджер хранилища постеров;
+    :var lock: блокировка записи буферов на диск;
     :var records: количество собранных данных;
-    :var image: размер и количество изображений.
+    :var state: состояние файлов на момент последней записи буферов.
     """
 
     def __init__(self):
         self.directory: str | None = ''
         self.checkpoint: str | None = ''
-        self.size: dict = {file: 0 for file in FIELD_NAMES}
+        self.format: str = 'csv'
+        self.writer: Writer = WRITERS[self.format]()
+        self.index: IndexManager = IndexManager()
+        self.archive: ArchiveManager = ArchiveManager()
+        self.dead: DeadLetterManager = DeadLetterManager()
+        self.posters: PosterManager = PosterManager()
+        self.lock: asyncio.Lock = asyncio.Lock()
         self.records: dict = {file: 0 for file in FIELD_NAMES}
-        self.image: dict = {
-            'size': 0,
-            'count': 0
-        }
+        self.state: dict = {'files': {}}
+
+    @property
+    def size(self) -> dict:
+        """
+        Возвращает размер файлов с данными без обращения к файловой системе;
+
+        :return: размер файлов с данными.
+        """
+
+        return self.writer.size
+
+    @property
+    def image(self) -> dict:
+        """
+        Возвращает размер и количество постеров по индексу хранилища
+        без обращения к файловой системе;
+
+        :return: размер и количество постеров.
+        """
+
+        return self.posters.stat()
 
     def create(self) -> None:
         """
-        Создает csv-файл с данными;
+        Создает файлы с данными;
 
         :return: None.
         """
@@ -45,11 +85,11 @@ class FileManager(object):
         if not os.path.exists(path):
             os.mkdir(path)
 
-        for name, fields in FIELD_NAMES.items():
-            name = fr'{path}\{name}.csv'
-            with open(name, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file, delimiter=',')
-                writer.writerow(fields)
+        self.writer.open(path, 'w')
+        self.index.open(path, 'w')
+        self.archive.open(path, 'w')
+        self.dead.open(path, 'w')
+        self.posters.open(path, 'w')
 
         path = fr'{FILE_RAW_PATH}\{self.directory}\posters'
 
@@ -62,49 +102,137 @@ class FileManager(object):
 
     async def write(self, records: dict) -> None:
         """
-        Записывает данные в csv-файлы. Учитывает количество собранных данных;
+        Записывает данные в буферы. Учитывает количество собранных
+        данных. При достижении порога буферы записываются на диск;
 
         :param records: записываемые данные;
         :return: None.
         """
 
+        self.writer.write(records)
+
         for name in FIELD_NAMES:
-            path = fr'{FILE_RAW_PATH}\{self.directory}\{name}.csv'
-            with open(path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file, delimiter=',')
-                for record in records[name]:
-                    writer.writerow(record)
-            self.size[name] = os.path.getsize(path)
-            self.records[name] += len(records[name])
+            self.records[name] += len(records.get(name, []))
+
+        if self.writer.full():
+            await self.flush()
 
-    async def images(self, images: dict):
+    async def flush(self, sync: bool = False) -> None:
         """
-        Записывает изображения. Учитывает количество и размер изображений;
+        Записывает буферы, архив и отметки индекса о собранных фильмах
+        на диск в отдельном потоке. Запись не прерывается при отмене сбора
+        данных, поэтому следующая запись начинается после ее завершения;
 
-        :param images: записываемые изображения;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
         :return: None.
         """
 
-        for name, data in images.items():
-            path = fr'{FILE_RAW_PATH}\{self.directory}\posters\{name}.jpg'
-            with open(path, 'wb') as file:
-                file.write(data)
+        await asyncio.shield(self.dump(sync))
+
+    async def dump(self, sync: bool) -> None:
+        """
+        Записывает буферы, архив и отметки индекса на диск в отдельном
+        потоке. Отметки записываются вместе с позицией данных после
+        принудительной записи данных на диск. Количество собранных данных
+        запоминается вместе с извлеченными буферами, поэтому состояние
+        файлов не учитывает данные, записанные в буферы во время записи
+        на диск;
+
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
 
-            self.image['size'] += os.path.getsize(path)
-        self.image['count'] += len(images)
+        async with self.lock:
+            chunks = self.writer.take()
+            records = dict(self.records)
+            marks = self.index.take()
+            pages = self.archive.take()
+            images = self.posters.take()
+
+            sync = sync or bool(marks)
+
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.writer.dump, chunks, sync)
+            await loop.run_in_executor(None, self.archive.dump, pages, sync)
+            await loop.run_in_executor(None, self.posters.dump, images)
+
+            position = self.writer.position()
+            await loop.run_in_executor(None, self.index.dump, marks, position)
+
+            files = self.writer.stat()
+
+            for name in files:
+                files[name]['records'] = records[name]
+
+            self.state = {'files': files}
+
+    async def close(self) -> None:
+        """
+        Записывает буферы на диск и закрывает файлы с данными;
+
+        :return: None.
+        """
+
+        await self.flush(sync=True)
+
+        self.writer.close()
+        self.archive.close()
+        self.dead.close()
+        self.posters.close()
+        self.index.close()
+
+    def poster(self, name: int) -> str:
+        """
+        Возвращает путь к файлу постера;
+
+        :param name: id фильма;
+        :return: путь к файлу постера.
+        """
+
+        return fr'{FILE_RAW_PATH}\{self.directory}\posters\{name}.jpg'
+
+    async def adopt(self, i: int, path: str, digest: str, size: int) -> None:
+        """
+        Сохраняет полученный постер в хранилище и размещает постер фильма
+        в отдельном потоке;
+
+        :param i: id фильма;
+        :param path: путь к полученному постеру;
+        :param digest: хеш постера;
+        :param size: размер постера;
+        :return: None.
+        """
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None,
+                                   self.posters.store,
+                                   path,
+                                   digest,
+                                   self.poster(i))
+
+        self.posters.add(i, digest, size)
 
     async def save(self, checkpoint: dict) -> None:
         """
-        Записывает контрольную точки в формат json;
+        Записывает контрольную точки в формат json. Перед записью
+        контрольной точки буферы записываются на диск. Контрольная точка
+        записывается во временный файл, который затем заменяет прежнюю
+        контрольную точку, поэтому она не может быть записана частично;
 
         :param checkpoint: контрольная точка;
         :return: None.
         """
 
+        await self.flush(sync=True)
+
         path = fr'{CHECKPOINT_PATH}\{self.checkpoint}'
-        with open(path, 'w') as json_file:
+        with open(path + '.tmp', 'w') as json_file:
             checkpoint = self.json() | checkpoint
             json_file.write(json.dumps(checkpoint, indent=4))
+            json_file.flush()
+            os.fsync(json_file.fileno())
+
+        os.replace(path + '.tmp', path)
 
     @staticmethod
     def load(checkpoint: str) -> dict:
@@ -135,42 +263,91 @@ class FileManager(object):
     def setting(self,
                 directory: str,
                 mode: str,
-                checkpoint: str | None) -> None:
+                checkpoint: str | None,
+                format: str = 'csv',
+                refresh: int = 0,
+                archive: bool = True,
+                state: dict | None = None) -> None:
         """
         Настраивает менеджер;
 
         :param directory: имя директории с данными;
         :param mode: режим работы с файлом;
         :param checkpoint: имя файла контрольной точки в формате json;
+        :param format: формат записи данных (csv, parquet, arrow, sqlite);
+        :param refresh: интервал обновления рейтинга (в днях);
+        :param archive: флаг ведения архива страниц фильмов;
+        :param state: состояние файлов, сохраненное в контрольной точке;
         :return: None.
         """
 
         self.directory = directory
         self.checkpoint = checkpoint
 
+        if format != self.format:
+            self.writer.close()
+
+            self.format = format
+            self.writer = WRITERS[format]()
+
+        self.index.setting(refresh)
+        self.archive.setting(archive)
+
         if mode == 'w':
             self.create()
         elif mode == 'a':
-            for name in FIELD_NAMES:
-                path = fr'{FILE_RAW_PATH}\{self.directory}\{name}.csv'
-                with open(path, newline='', encoding='utf-8') as file:
-                    rows = csv.reader(file, delimiter=',')
-                    self.records[name] = sum([1 for _ in rows]) - 1
-                self.size[name] = os.path.getsize(path)
-
-            path = fr'{FILE_RAW_PATH}\{self.directory}\posters'
-            directory = pathlib.Path(path)
-            for file in directory.iterdir():
-                self.image['size'] += os.path.getsize(file)
-                self.image['count'] += 1
+            path = fr'{FILE_RAW_PATH}\{self.directory}'
+            self.writer.open(path, 'a')
+            self.index.open(path, 'a')
+            self.writer.rollback(self.index.position())
+            self.archive.open(path, 'a')
+            self.dead.open(path, 'a')
+            self.posters.open(path, 'a')
+
+            self.restore(state or {})
+
+    def restore(self, state: dict) -> None:
+        """
+        Восстанавливает количество собранных данных. Значения из контрольной
+        точки используются, если размер и время изменения файлов совпадают
+        с сохраненными, иначе данные пересчитываются;
+
+        :param state: состояние файлов, сохраненное в контрольной точке;
+        :return: None.
+        """
+
+        files = state.get('files', {})
+
+        path = fr'{FILE_RAW_PATH}\{self.directory}'
+        probe = self.writer.probe(path)
+
+        for name in FIELD_NAMES:
+            saved = files.get(name, {})
+
+            if (saved.get('size') == probe[name]['size'] and
+                    saved.get('mtime') == probe[name]['mtime']):
+                self.records[name] = saved['records']
+            else:
+                self.records[name] = self.writer.count(path, name)
+
+        self.posters.recover(fr'{path}\posters')
 
     def json(self) -> dict:
         """
         Возвращает текущие параметры:
 
         - имя директории с данными;
+        - формат записи данных;
+        - интервал обновления рейтинга;
+        - флаг ведения архива страниц фильмов;
+        - состояние файлов на момент последней записи буферов: количество
+          записей, размер и время изменения файлов с данными;
 
         :return: текущие параметры.
         """
 
-        return {'directory': self.directory}
+        return {'directory': self.directory,
+                'format': self.format,
+                **self.index.json(),
+                **self.archive.json(),
+                'state': self.state}
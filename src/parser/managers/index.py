@@ -0,0 +1,264 @@
+import os
+import sqlite3
+import time
+
+from config.parser.managers.index import DAY
+from config.parser.managers.index import IDENTIFIER
+from config.parser.managers.index import INDEX
+from config.parser.managers.index import SPAN
+
+
+class IndexManager(object):
+    """
+    Менеджер индекса собранных фильмов, задачами которого являются:
+
+    - хранение постоянных id фильмов по их адресам (slug);
+    - пропуск фильмов, собранных ранее или повторяющихся в списке;
+    - планирование обновления рейтинга собранных фильмов;
+
+    Отметки о собранных фильмах накапливаются в памяти и записываются
+    в индекс одной транзакцией с позицией записанных на диск данных, поэтому
+    индекс служит журналом собранных фильмов: данные, записанные после
+    последней транзакции, отменяются при возобновлении сбора данных;
+
+    :var refresh: интервал обновления рейтинга (в днях), 0 - без обновления;
+    :var connection: соединение с базой данных индекса;
+    :var seen: фильмы, встреченные в текущем сборе данных;
+    :var pending: отметки о собранных фильмах, не записанные в индекс;
+    :var first: первый id диапазона для фильмов без id в списке;
+    :var next: следующий id для фильмов без id в списке.
+    """
+
+    def __init__(self):
+        self.refresh: int = 0
+        self.connection: sqlite3.Connection | None = None
+        self.seen: set[str] = set()
+        self.pending: list[tuple] = []
+        self.first: int = IDENTIFIER
+        self.next: int = IDENTIFIER
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает индекс. В режиме 'w' индекс создается заново;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        database = fr'{path}\{INDEX}'
+
+        if mode == 'w':
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(database + suffix)
+                except FileNotFoundError:
+                    pass
+
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS films ('
+                'slug TEXT PRIMARY KEY, '
+                'id INTEGER NOT NULL UNIQUE, '
+                'scraped REAL NOT NULL, '
+                'refreshed REAL NOT NULL)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS position ('
+                'name TEXT PRIMARY KEY, '
+                'value INTEGER NOT NULL)'
+            )
+
+        self.next = self.free()
+        self.seen = set()
+        self.pending = []
+
+    def reserve(self, block: int) -> None:
+        """
+        Выделяет индексу диапазон из SPAN id для фильмов без id в списке.
+        Шарды распределенного сбора данных получают разные диапазоны,
+        поэтому назначенные ими id не совпадают при объединении шардов;
+
+        :param block: номер диапазона;
+        :return: None.
+        """
+
+        self.first = IDENTIFIER + block * SPAN
+        self.next = self.free()
+
+    def free(self) -> int:
+        """
+        Возвращает следующий свободный id диапазона индекса;
+
+        :return: следующий свободный id.
+        """
+
+        last = self.connection.execute(
+            'SELECT MAX(id) FROM films WHERE id >= ? AND id < ?',
+            (self.first, self.first + SPAN)
+        ).fetchone()[0]
+
+        return last + 1 if last else self.first
+
+    def action(self, slug: str) -> str:
+        """
+        Определяет действие с фильмом из списка:
+
+        - scrape: фильм не собирался ранее;
+        - refresh: фильм собран, но его рейтинг необходимо обновить;
+        - skip: фильм собран или уже встречался в текущем сборе данных;
+
+        :param slug: адрес фильма;
+        :return: действие с фильмом.
+        """
+
+        if slug in self.seen:
+            return 'skip'
+
+        self.seen.add(slug)
+
+        row = self.connection.execute(
+            'SELECT refreshed FROM films WHERE slug = ?', (slug, )
+        ).fetchone()
+
+        if row is None:
+            return 'scrape'
+        if self.refresh and time.time() - row[0] >= self.refresh * DAY:
+            return 'refresh'
+
+        return 'skip'
+
+    def identify(self, slug: str, i: int | None) -> int:
+        """
+        Возвращает постоянный id фильма. Фильм, собранный ранее, сохраняет
+        свой id, новый фильм получает id из списка или, если он отсутствует
+        или занят, следующий свободный id;
+
+        :param slug: адрес фильма;
+        :param i: id фильма в списке;
+        :return: id фильма.
+        """
+
+        row = self.connection.execute(
+            'SELECT id FROM films WHERE slug = ?', (slug, )
+        ).fetchone()
+
+        if row:
+            return row[0]
+
+        used = i is not None and self.connection.execute(
+            'SELECT 1 FROM films WHERE id = ?', (i, )
+        ).fetchone()
+
+        if i is None or used:
+            i, self.next = self.next, self.next + 1
+
+        return i
+
+    def forget(self) -> None:
+        """
+        Забывает фильмы, встреченные в текущем сборе данных. Выполняется
+        после записи отметок в индекс, поэтому собранные фильмы
+        пропускаются по индексу, а фильмы прерванного сбора данных
+        собираются повторно;
+
+        :return: None.
+        """
+
+        self.seen = set()
+
+    def mark(self, slug: str, i: int) -> None:
+        """
+        Отмечает фильм собранным (или обновленным);
+
+        :param slug: адрес фильма;
+        :param i: id фильма;
+        :return: None.
+        """
+
+        self.pending.append((slug, i, time.time()))
+
+    def take(self) -> list[tuple]:
+        """
+        Извлекает отметки о собранных фильмах;
+
+        :return: отметки о собранных фильмах.
+        """
+
+        pending, self.pending = self.pending, []
+
+        return pending
+
+    def dump(self, marks: list[tuple], position: dict | None = None) -> None:
+        """
+        Записывает отметки о собранных фильмах и позицию записанных
+        на диск данных в индекс одной транзакцией. Может выполняться
+        в отдельном потоке;
+
+        :param marks: отметки о собранных фильмах;
+        :param position: позиция данных;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT INTO films (slug, id, scraped, refreshed) '
+                'VALUES (?1, ?2, ?3, ?3) '
+                'ON CONFLICT (slug) DO UPDATE SET refreshed = ?3',
+                marks
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO position (name, value) '
+                'VALUES (?, ?)',
+                (position or {}).items()
+            )
+
+    def position(self) -> dict:
+        """
+        Возвращает позицию данных, записанную последней транзакцией;
+
+        :return: позиция данных.
+        """
+
+        return dict(self.connection.execute(
+            'SELECT name, value FROM position'
+        ))
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся отметки и закрывает индекс;
+
+        :return: None.
+        """
+
+        if self.connection:
+            self.dump(self.take())
+
+            self.connection.close()
+            self.connection = None
+
+    def setting(self, refresh: int) -> None:
+        """
+        Настраивает менеджер;
+
+        :param refresh: интервал обновления рейтинга (в днях);
+        :return: None.
+        """
+
+        self.refresh = refresh
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - refresh: интервал обновления рейтинга (в днях).
+
+        :return: текущие параметры.
+        """
+
+        return {'refresh': self.refresh}
@@ -0,0 +1,439 @@
+import asyncio
+import hashlib
+import os
+import shutil
+import sqlite3
+import time
+import urllib.parse
+
+from collections.abc import Mapping
+
+from config.parser.managers.network.cache import CACHE
+from config.parser.managers.network.cache import EVICTION
+from config.paths import FILE_RAW_PATH
+
+
+def place(source: str, target: str) -> None:
+    """
+    Размещает копию файла по указанному пути. Файл связывается жесткой
+    ссылкой, а если это невозможно, копируется. Размещение выполняется
+    через временный файл;
+
+    :param source: путь к исходному файлу;
+    :param target: путь к размещаемому файлу;
+    :return: None.
+    """
+
+    part = target + '.part'
+
+    if os.path.exists(part):
+        os.remove(part)
+
+    try:
+        os.link(source, part)
+    except OSError:
+        shutil.copyfile(source, part)
+
+    os.replace(part, target)
+
+
+class CacheManager(object):
+    """
+    Менеджер дискового кэша ответов, задачами которого являются:
+
+    - хранение тел ответов по хешу их содержимого (sha256);
+    - хранение валидаторов ответов (ETag, Last-Modified) по адресу запроса;
+    - формирование заголовков условных запросов;
+    - вытеснение давно не используемых тел ответов при превышении объема;
+
+    Режимы работы: 'off' - кэш не используется, 'on' - ответы сохраняются
+    и проверяются условными запросами, 'only' - ответы выдаются только
+    из кэша без обращения к сети. Кэш может использоваться несколькими
+    процессами одновременно, поэтому объем кэша учитывается в его индексе
+    триггерами, а не в памяти процесса;
+
+    :var mode: режим работы кэша;
+    :var capacity: максимальный объем кэша (в байтах);
+    :var root: путь к каталогу кэша;
+    :var connection: соединение с базой данных индекса кэша.
+    """
+
+    def __init__(self):
+        self.mode: str = 'off'
+        self.capacity: int = 0
+        self.root: str | None = None
+        self.connection: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        """
+        Открывает индекс кэша, создавая его при отсутствии;
+
+        :return: None.
+        """
+
+        self.root = fr'{FILE_RAW_PATH}\{CACHE}'
+        os.makedirs(fr'{self.root}\objects', exist_ok=True)
+
+        self.connection = sqlite3.connect(fr'{self.root}\cache.db',
+                                          timeout=60)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.connection.execute('PRAGMA synchronous = NORMAL')
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS objects ('
+                'hash TEXT PRIMARY KEY, '
+                'size INTEGER NOT NULL, '
+                'used REAL NOT NULL)'
+            )
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS objects_used ON objects (used)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, '
+                'hash TEXT NOT NULL REFERENCES objects (hash), '
+                'etag TEXT, '
+                'modified TEXT, '
+                'encoding TEXT)'
+            )
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS usage ('
+                'id INTEGER PRIMARY KEY CHECK (id = 0), '
+                'size INTEGER NOT NULL)'
+            )
+            self.connection.execute(
+                'INSERT OR IGNORE INTO usage (id, size) '
+                'SELECT 0, COALESCE(SUM(size), 0) FROM objects'
+            )
+            self.connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS objects_insert '
+                'AFTER INSERT ON objects BEGIN '
+                'UPDATE usage SET size = size + NEW.size; END'
+            )
+            self.connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS objects_delete '
+                'AFTER DELETE ON objects BEGIN '
+                'UPDATE usage SET size = size - OLD.size; END'
+            )
+
+    @property
+    def size(self) -> int:
+        """
+        Возвращает объем тел ответов, находящихся в кэше, с учетом
+        ответов, записанных другими процессами;
+
+        :return: объем кэша (в байтах).
+        """
+
+        return self.connection.execute(
+            'SELECT size FROM usage'
+        ).fetchone()[0]
+
+    @staticmethod
+    def key(link: str, params: dict | None) -> str:
+        """
+        Формирует ключ записи кэша по адресу и параметрам запроса;
+
+        :param link: адрес запроса;
+        :param params: параметры запроса;
+        :return: ключ записи кэша.
+        """
+
+        if params:
+            return f'{link}?{urllib.parse.urlencode(sorted(params.items()))}'
+
+        return link
+
+    def path(self, digest: str) -> str:
+        """
+        Возвращает путь к телу ответа по его хешу;
+
+        :param digest: хеш тела ответа;
+        :return: путь к телу ответа.
+        """
+
+        return fr'{self.root}\objects\{digest[:2]}\{digest}'
+
+    def lookup(self, key: str) -> dict | None:
+        """
+        Возвращает запись кэша и отмечает использование ее тела ответа,
+        чтобы оно не было вытеснено до чтения. Запись, тело ответа которой
+        отсутствует на диске, удаляется;
+
+        :param key: ключ записи кэша;
+        :return: хеш тела ответа, валидаторы и кодировка ответа.
+        """
+
+        if not self.connection:
+            return None
+
+        row = self.connection.execute(
+            'SELECT hash, etag, modified, encoding FROM entries WHERE key = ?',
+            (key, )
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        entry = dict(zip(('hash', 'etag', 'modified', 'encoding'),
+                         row,
+                         strict=True))
+
+        if not os.path.exists(self.path(entry['hash'])):
+            self.remove([entry['hash']])
+            return None
+
+        self.touch(entry)
+
+        return entry
+
+    @staticmethod
+    def conditional(entry: dict | None) -> dict:
+        """
+        Формирует заголовки условного запроса по валидаторам записи кэша;
+
+        :param entry: запись кэша;
+        :return: заголовки условного запроса.
+        """
+
+        headers = {}
+
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['modified']:
+            headers['If-Modified-Since'] = entry['modified']
+
+        return headers
+
+    async def body(self, entry: dict) -> bytes:
+        """
+        Читает тело ответа из кэша в отдельном потоке. Если тело ответа
+        отсутствует, вызывается исключение FileNotFoundError;
+
+        :param entry: запись кэша;
+        :return: тело ответа.
+        """
+
+        def read() -> bytes:
+            with open(self.path(entry['hash']), 'rb') as file:
+                return file.read()
+
+        self.touch(entry)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, read)
+
+    async def restore(self, entry: dict, path: str) -> int:
+        """
+        Размещает тело ответа из кэша по указанному пути в отдельном потоке.
+        Если тело ответа отсутствует, вызывается исключение
+        FileNotFoundError;
+
+        :param entry: запись кэша;
+        :param path: путь к файлу;
+        :return: размер файла.
+        """
+
+        source = self.path(entry['hash'])
+
+        self.touch(entry)
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, place, source, path)
+
+        return os.stat(path).st_size
+
+    async def store(self,
+                    key: str,
+                    headers: Mapping,
+                    body: bytes,
+                    encoding: str | None = None) -> None:
+        """
+        Сохраняет тело ответа и его валидаторы в кэш. Тело ответа
+        записывается в отдельном потоке, если оно отсутствует в кэше;
+
+        :param key: ключ записи кэша;
+        :param headers: заголовки ответа;
+        :param body: тело ответа;
+        :param encoding: кодировка ответа;
+        :return: None.
+        """
+
+        if not self.connection:
+            return None
+
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.path(digest)
+
+        def write() -> None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            with open(path + '.part', 'wb') as file:
+                file.write(body)
+
+            os.replace(path + '.part', path)
+
+        if not os.path.exists(path):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, write)
+
+        self.record(key, digest, len(body), headers, encoding)
+
+    async def adopt(self,
+                    key: str,
+                    headers: Mapping,
+                    path: str,
+                    digest: str) -> None:
+        """
+        Сохраняет в кэш записанный на диск файл ответа и его валидаторы.
+        Файл связывается с кэшем жесткой ссылкой или копируется;
+
+        :param key: ключ записи кэша;
+        :param headers: заголовки ответа;
+        :param path: путь к файлу ответа;
+        :param digest: хеш файла ответа;
+        :return: None.
+        """
+
+        if not self.connection:
+            return None
+
+        target = self.path(digest)
+
+        def link() -> None:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            place(path, target)
+
+        if not os.path.exists(target):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, link)
+
+        self.record(key, digest, os.stat(target).st_size, headers, None)
+
+    def record(self,
+               key: str,
+               digest: str,
+               size: int,
+               headers: Mapping,
+               encoding: str | None) -> None:
+        """
+        Записывает в индекс кэша тело ответа и запись с валидаторами.
+        При превышении объема кэша вытесняет давно не используемые тела
+        ответов;
+
+        :param key: ключ записи кэша;
+        :param digest: хеш тела ответа;
+        :param size: размер тела ответа;
+        :param headers: заголовки ответа;
+        :param encoding: кодировка ответа;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR IGNORE INTO objects (hash, size, used) '
+                'VALUES (?, ?, ?)',
+                (digest, size, time.time())
+            )
+            self.connection.execute(
+                'INSERT OR REPLACE INTO entries '
+                '(key, hash, etag, modified, encoding) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key,
+                 digest,
+                 headers.get('ETag'),
+                 headers.get('Last-Modified'),
+                 encoding)
+            )
+
+        if self.size > self.capacity:
+            self.evict()
+
+    def touch(self, entry: dict) -> None:
+        """
+        Отмечает использование тела ответа;
+
+        :param entry: запись кэша;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'UPDATE objects SET used = ? WHERE hash = ?',
+                (time.time(), entry['hash'])
+            )
+
+    def evict(self) -> None:
+        """
+        Вытесняет давно не используемые тела ответов, пока объем кэша
+        превышает максимальный;
+
+        :return: None.
+        """
+
+        while self.size > self.capacity:
+            rows = self.connection.execute(
+                'SELECT hash FROM objects ORDER BY used LIMIT ?',
+                (EVICTION, )
+            ).fetchall()
+
+            if not rows:
+                break
+
+            self.remove([digest for digest, in rows])
+
+    def remove(self, digests: list[str]) -> None:
+        """
+        Удаляет тела ответов и ссылающиеся на них записи кэша;
+
+        :param digests: хеши тел ответов;
+        :return: None.
+        """
+
+        rows = [(digest, ) for digest in digests]
+
+        with self.connection:
+            self.connection.executemany(
+                'DELETE FROM entries WHERE hash = ?', rows
+            )
+            self.connection.executemany(
+                'DELETE FROM objects WHERE hash = ?', rows
+            )
+
+        for digest in digests:
+            try:
+                os.remove(self.path(digest))
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """
+        Закрывает индекс кэша;
+
+        :return: None.
+        """
+
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    def setting(self, mode: str, capacity: int) -> None:
+        """
+        Настраивает менеджер;
+
+        :param mode: режим работы кэша ('off', 'on', 'only');
+        :param capacity: максимальный объем кэша (в байтах);
+        :return: None.
+        """
+
+        self.close()
+
+        self.mode = mode
+        self.capacity = capacity
+
+        if mode != 'off':
+            self.open()
@@ -1,70 +1,157 @@
 import asyncio
+import time
 
-from random import uniform
+from email.utils import parsedate_to_datetime
+
+from config.parser.managers.network.delay import CAPACITY
+from config.parser.managers.network.delay import INCREASE
 
 
 class DelayManager(object):
     """
     Менеджер задержки, задачами которого являются:
 
-    - Задержка выполнения программы перед отправкой запроса;
-    - Получение кода статуса отправленного запроса для масштабирования задержки;
-
-    :var span: диапазон задержки;
-    :var factor: масштаб задержки;
-    :var type: тип текущей задержки;
-    :var success: количество отправленных запросов с кодом 200;
-    :var threshold: порог смены типа задержки.
+    - Выдача токенов на отправку запросов с заданной частотой (token bucket);
+    - Получение кода статуса отправленного запроса для подстройки частоты
+      (аддитивное увеличение, мультипликативное уменьшение);
+    - Приостановка отправки запросов на время, указанное в Retry-After;
+
+    :var rates: диапазон частоты запросов (зап./сек.);
+    :var factor: коэффициент уменьшения частоты;
+    :var threshold: количество успешных запросов для увеличения частоты;
+    :var rate: текущая частота запросов (зап./сек.);
+    :var tokens: количество доступных токенов;
+    :var updated: время последнего пополнения токенов;
+    :var paused: время, до которого отправка запросов приостановлена;
+    :var decreased: время последнего уменьшения частоты;
+    :var success: количество успешных запросов с момента изменения частоты;
+    :var lock: блокировка выдачи токенов.
     """
 
     def __init__(self):
-        self.span: tuple[int, int] | None = None
-        self.factor: int | None = None
-        self.type: str = 'normal'
-        self.success: int = 0
+        self.rates: tuple[float, float] | None = None
+        self.factor: float | None = None
         self.threshold: int | None = None
+        self.rate: float | None = None
+        self.tokens: float = 0
+        self.updated: float = time.monotonic()
+        self.paused: float = 0
+        self.decreased: float = 0
+        self.success: int = 0
+        self.lock: asyncio.Lock = asyncio.Lock()
 
-    async def delay(self) -> None:
+    async def delay(self) -> float:
         """
-        Задерживает выполнение программы перед отправкой запроса;
+        Задерживает выполнение программы до получения токена на отправку
+        запроса;
 
-        :return: None.
+        :return: время выдачи токена.
         """
 
-        if self.type == 'normal':
-            span = self.span
-        else:
-            span = [s * self.factor for s in self.span]
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self.paused:
+                    await asyncio.sleep(self.paused - now)
+                    continue
+
+                self.refill(now)
 
-        await asyncio.sleep(uniform(*span))
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now
 
-    async def code(self, code: int) -> None:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def refill(self, now: float) -> None:
+        """
+        Пополняет токены пропорционально времени, прошедшему с момента
+        последнего пополнения;
+
+        :param now: текущее время;
+        :return: None.
         """
-        Получает код статуса отправленного запроса для масштабирования задержки;
+
+        tokens = self.tokens + (now - self.updated) * self.rate
+        self.tokens = min(CAPACITY, tokens)
+        self.updated = now
+
+    async def code(self,
+                   code: int,
+                   sent: float = 0,
+                   retry: str | None = None) -> None:
+        """
+        Получает код статуса отправленного запроса для подстройки частоты.
+        Частота уменьшается не более одного раза для запросов, отправленных
+        до предыдущего уменьшения;
 
         :param code: код статуса запроса;
+        :param sent: время выдачи токена на отправку запроса;
+        :param retry: значение заголовка Retry-After;
         :return: None.
         """
 
-        if code == 429:
-            self.type = 'increased'
-        elif code == 200 and self.type == 'increased':
+        if code == 429 or code >= 500:
+            now = time.monotonic()
+
+            if sent >= self.decreased:
+                self.refill(now)
+                self.rate = max(self.rates[0], self.rate / self.factor)
+                self.decreased = now
+                self.success = 0
+
+            if seconds := self.after(retry):
+                self.paused = max(self.paused, now + seconds)
+        elif code in (200, 304):
             self.success += 1
 
             if self.success >= self.threshold:
-                self.type = 'normal'
+                self.refill(time.monotonic())
+                self.rate = min(self.rates[1], self.rate + INCREASE)
                 self.success = 0
 
-    def setting(self, span: tuple, factor: int, threshold: int) -> None:
+    @staticmethod
+    def after(retry: str | None) -> float:
+        """
+        Вычисляет время ожидания по значению заголовка Retry-After,
+        указанного в секундах или в виде даты;
+
+        :param retry: значение заголовка Retry-After;
+        :return: время ожидания (в секундах).
+        """
+
+        if not retry:
+            return 0
+
+        try:
+            return max(0.0, float(retry))
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(retry)
+        except (TypeError, ValueError):
+            return 0
+
+        return max(0.0, date.timestamp() - time.time())
+
+    def setting(self,
+                rates: tuple,
+                factor: float,
+                threshold: int,
+                rate: float) -> None:
         """
         Настраивает менеджер;
 
-        :param span: диапазон задержки;
-        :param factor: масштаб задержки;
-        :param threshold: порог смены типа задержки;
+        :param rates: диапазон частоты запросов (зап./сек.);
+        :param factor: коэффициент уменьшения частоты;
+        :param threshold: количество успешных запросов для увеличения частоты;
+        :param rate: начальная частота запросов (зап./сек.);
         :return: None.
         """
 
-        self.span = span
+        self.rates = rates
         self.factor = factor
         self.threshold = threshold
+        self.rate = min(max(rate, rates[0]), rates[1])
@@ -1,127 +1,379 @@
+import hashlib
+import os
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+
 import aiohttp
 
+from aiohttp.compression_utils import HAS_BROTLI
+
+from config.parser.managers.network.network import CHUNK
+from config.parser.managers.network.network import CONNECTOR
+from config.parser.managers.network.network import ENCODINGS
 from config.parser.managers.network.network import HEADERS
+from config.parser.managers.network.network import TIMEOUT
 from config.parser.managers.network.network import URL
+from parser.managers.network.cache import CacheManager
 from parser.managers.network.delay import DelayManager
+from parser.managers.network.retry import RetryManager
 
 
 class NetworkManager(object):
     """
     Сетевой менеджер, задачами которого являются:
 
-    - Создание клиентской сессии;
+    - Создание клиентской сессии с пулом соединений и тайм-аутами;
     - Проверка соединения с сервером перед началом сбора данных;
-    - Отправление get-запроса по указанному адресу;
+    - Отправление get-запросов за html-страницами и двоичными данными;
+    - Потоковая запись тела ответа в файл;
+    - Условные запросы и выдача ответов из дискового кэша;
     - учет размера входящего трафика;
     - учет статусов отправленных запросов;
+    - учет использования пула соединений;
     - хранение и выдача адресов страниц для сбора данных;
 
-    :var delay: менеджер задержки;
+    :var delay: менеджер задержки запросов страниц;
+    :var images: менеджер задержки запросов постеров;
+    :var cache: менеджер дискового кэша ответов;
+    :var retry: менеджер повторных запросов;
     :var headers: заголовки get-запросов;
-    :var traffic: размер входящего трафика;
+    :var traffic: размер входящего трафика (байты тел ответов);
     :var url: адрес сайта web-ресурса;
     :var session: клиентская сессия для отправления запросов;
     :var statuses: статусы отправленных запросов;
+    :var pool: использование пула соединений.
     """
 
     def __init__(self):
         self.delay: DelayManager = DelayManager()
+        self.images: DelayManager = DelayManager()
+        self.cache: CacheManager = CacheManager()
+        self.retry: RetryManager = RetryManager()
 
-        self.headers: dict = HEADERS
+        self.headers: dict = HEADERS | {
+            'Accept-Encoding': ', '.join(encoding
+                                         for encoding in ENCODINGS
+                                         if encoding != 'br' or HAS_BROTLI)
+        }
         self.traffic: int = 0
         self.url: str = URL
         self.session: aiohttp.ClientSession | None = None
         self.statuses: dict = {
             "successful": 0,
+            "cached": 0,
             "failed": {}
         }
+        self.pool: dict = {
+            'limit': 0,
+            'active': 0,
+            'queued': 0,
+            'created': 0,
+            'reused': 0
+        }
 
-    async def connect(self) -> int:
+    async def connect(self, limit: int, check: bool = True) -> int:
         """
-        Создает экземпляр клиентской сессии ClientSession. Проверяет соединение
+        Создает экземпляр клиентской сессии ClientSession с пулом
+        соединений TCPConnector (ограничение количества соединений
+        с сервером, кэш DNS, время жизни неактивных соединений)
+        и тайм-аутами соединения и чтения. Проверяет соединение
         с сервером перед началом сбора данных;
 
+        :param limit: максимальное количество соединений с сервером;
+        :param check: флаг проверки соединения с сервером;
         :return: код статуса ответа на запрос.
         """
 
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_queued_start.append(self.trace('queued', 1))
+        trace.on_connection_queued_end.append(self.trace('queued', -1))
+        trace.on_connection_create_end.append(self.trace('created', 1))
+        trace.on_connection_reuseconn.append(self.trace('reused', 1))
+
+        self.pool['limit'] = limit
         self.session = aiohttp.ClientSession(
-            headers=self.headers
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(**CONNECTOR,
+                                           limit_per_host=limit),
+            timeout=aiohttp.ClientTimeout(**TIMEOUT),
+            trace_configs=[trace]
         )
 
+        if not check:
+            return 200
+
         async with self.session.get(self.url) as response:
             return response.status
 
-    async def get(self, link: str, params: dict = None) -> dict:
+    def trace(self, name: str, step: int) -> Callable[..., Awaitable[None]]:
+        """
+        Формирует обработчик события пула соединений, изменяющий
+        соответствующий счетчик использования пула;
+
+        :param name: имя счетчика;
+        :param step: изменение счетчика;
+        :return: обработчик события.
         """
-        Отправляет get-запрос по указанному адресу. Учитывает размер входящего
-        трафика и статусы отправленных запросов;
+
+        async def handler(*_) -> None:
+            self.pool[name] += step
+
+        return handler
+
+    async def request(self,
+                      link: str,
+                      params: dict | None,
+                      read: Callable[[aiohttp.ClientResponse, str],
+                                     Awaitable[dict]],
+                      load: Callable[[dict], Awaitable[dict]],
+                      images: bool = False) -> dict:
+        """
+        Отправляет get-запрос по указанному адресу. Учитывает статусы
+        отправленных запросов. Тело успешного ответа читается один раз
+        указанной функцией. При наличии ответа в кэше запрос отправляется
+        условным, а ответ 304 (или ответ в режиме работы только с кэшем)
+        выдается из кэша с кодом 200. Отсутствие ответа в режиме работы
+        только с кэшем выдается с кодом 404. Если тело ответа было
+        вытеснено из кэша после поиска записи, запрос повторяется
+        без условий;
 
         :param link: адрес, по которому будет отправлен запрос;
         :param params: параметры запроса;
-        :return: код статуса запроса, текст тела запроса.
+        :param read: функция чтения тела ответа и записи его в кэш;
+        :param load: функция чтения тела ответа из кэша;
+        :param images: флаг запроса постера (отдельная частота запросов);
+        :return: код статуса запроса, прочитанное тело ответа.
         """
 
-        await self.delay.delay()
+        key = self.cache.key(link, params)
+        entry = self.cache.lookup(key)
+
+        if self.cache.mode == 'only':
+            if entry and (cached := await self.cached(entry, load)):
+                return {'code': 200} | cached
+
+            return {'code': 404}
+
+        delay = self.images if images else self.delay
+        sent = await delay.delay()
+
+        headers = self.cache.conditional(entry)
+
+        self.pool['active'] += 1
 
         try:
-            async with self.session.get(link, params=params) as response:
+            async with self.session.get(link,
+                                        params=params,
+                                        headers=headers) as response:
                 code = response.status
+                retry = response.headers.get('Retry-After')
 
-                await self.delay.code(code)
+                await delay.code(code, sent, retry)
 
-                if code == 200:
+                if code == 304 and entry:
+                    if cached := await self.cached(entry, load):
+                        return {'code': 200} | cached
+                elif code == 200:
                     self.statuses["successful"] += 1
+                    return {'code': code} | await read(response, key)
                 else:
                     if code in self.statuses["failed"]:
                         self.statuses["failed"][code] += 1
                     else:
                         self.statuses["failed"][code] = 1
 
-                if code != 404:
-                    self.traffic += int(response
-                                        .headers
-                                        .get('Content-Length', 0))
+                    return {'code': code}
+        except aiohttp.ClientError:
+            return {'code': 0}
+        except TimeoutError:
+            return {'code': 0}
+        finally:
+            self.pool['active'] -= 1
 
-                    return {
-                        'code': code,
-                        'text': await response.text(errors='ignore'),
-                        'binary': await response.read()
-                    }
-                else:
-                    return {
-                        'code': code,
-                        'text': ''
-                    }
-        except aiohttp.ClientConnectorError:
-            return {'code': 0, 'text': '', 'binary': b''}
-        except aiohttp.ClientOSError:
-            return {'code': 0, 'text': '', 'binary': b''}
+        return await self.request(link, params, read, load, images)
+
+    async def cached(self,
+                     entry: dict,
+                     load: Callable[[dict], Awaitable[dict]]) -> dict | None:
+        """
+        Читает тело ответа из кэша. Запись кэша, тело ответа которой
+        отсутствует (вытеснено другим запросом), удаляется;
+
+        :param entry: запись кэша;
+        :param load: функция чтения тела ответа из кэша;
+        :return: прочитанное тело ответа или None, если оно отсутствует.
+        """
+
+        try:
+            cached = await load(entry)
+        except FileNotFoundError:
+            self.cache.remove([entry['hash']])
+            return None
+
+        self.statuses["cached"] += 1
+
+        return cached
+
+    async def receive(self, response: aiohttp.ClientResponse) -> bytes:
+        """
+        Читает тело ответа по частям. Учитывает размер входящего трафика
+        так же, как при записи тела ответа в файл;
+
+        :param response: ответ на запрос;
+        :return: тело ответа.
+        """
+
+        body = bytearray()
+
+        async for chunk in response.content.iter_chunked(CHUNK):
+            body += chunk
+            self.traffic += len(chunk)
+
+        return bytes(body)
+
+    async def html(self, link: str, params: dict = None) -> dict:
+        """
+        Отправляет get-запрос за html-страницей. Учитывает размер входящего
+        трафика;
+
+        :param link: адрес, по которому будет отправлен запрос;
+        :param params: параметры запроса;
+        :return: код статуса запроса, текст тела ответа.
+        """
+
+        async def read(response: aiohttp.ClientResponse, key: str) -> dict:
+            body = await self.receive(response)
+
+            encoding = response.get_encoding()
+            await self.cache.store(key, response.headers, body, encoding)
+
+            return {'text': body.decode(encoding, 'ignore')}
+
+        async def load(entry: dict) -> dict:
+            body = await self.cache.body(entry)
+
+            return {'text': body.decode(entry['encoding'], 'ignore')}
+
+        return await self.request(link, params, read, load)
+
+    async def binary(self,
+                     link: str,
+                     params: dict = None,
+                     images: bool = False) -> dict:
+        """
+        Отправляет get-запрос за двоичными данными. Учитывает размер
+        входящего трафика;
+
+        :param link: адрес, по которому будет отправлен запрос;
+        :param params: параметры запроса;
+        :param images: флаг запроса постера (отдельная частота запросов);
+        :return: код статуса запроса, двоичные данные тела ответа.
+        """
+
+        async def read(response: aiohttp.ClientResponse, key: str) -> dict:
+            body = await self.receive(response)
+
+            await self.cache.store(key, response.headers, body)
+
+            return {'binary': body}
+
+        async def load(entry: dict) -> dict:
+            return {'binary': await self.cache.body(entry)}
+
+        return await self.request(link, params, read, load, images)
+
+    async def stream(self,
+                     link: str,
+                     path: str,
+                     params: dict = None,
+                     images: bool = False) -> dict:
+        """
+        Отправляет get-запрос и записывает тело ответа в файл по частям,
+        не загружая его в память целиком. Учитывает размер входящего трафика;
+
+        :param link: адрес, по которому будет отправлен запрос;
+        :param path: путь к файлу;
+        :param params: параметры запроса;
+        :param images: флаг запроса постера (отдельная частота запросов);
+        :return: код статуса запроса, размер и хеш записанного файла.
+        """
+
+        async def read(response: aiohttp.ClientResponse, key: str) -> dict:
+            size, part = 0, path + '.part'
+            digest = hashlib.sha256()
+
+            try:
+                with open(part, 'wb') as file:
+                    async for chunk in response.content.iter_chunked(CHUNK):
+                        file.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                        self.traffic += len(chunk)
+            except BaseException:
+                if os.path.exists(part):
+                    os.remove(part)
+                raise
+
+            os.replace(part, path)
+
+            await self.cache.adopt(key,
+                                   response.headers,
+                                   path,
+                                   digest.hexdigest())
+
+            return {'size': size, 'digest': digest.hexdigest()}
+
+        async def load(entry: dict) -> dict:
+            return {'size': await self.cache.restore(entry, path),
+                    'digest': entry['hash']}
+
+        return await self.request(link, params, read, load, images)
 
-    def setting(self, span: tuple, factor: int, threshold: int) -> None:
+    def setting(self,
+                rates: tuple,
+                factor: float,
+                threshold: int,
+                rate: float,
+                images: float,
+                cache: str,
+                capacity: int) -> None:
         """
         Настраивает менеджер;
 
-        :param span: диапазон задержки;
-        :param factor: масштаб задержки;
-        :param threshold: порог смены типа задержки;
+        :param rates: диапазон частоты запросов (зап./сек.);
+        :param factor: коэффициент уменьшения частоты;
+        :param threshold: количество успешных запросов для увеличения частоты;
+        :param rate: начальная частота запросов страниц (зап./сек.);
+        :param images: начальная частота запросов постеров (зап./сек.);
+        :param cache: режим работы кэша ('off', 'on', 'only');
+        :param capacity: максимальный объем кэша (в байтах);
         :return: None.
         """
 
-        self.delay.span = span
-        self.delay.factor = factor
-        self.delay.threshold = threshold
+        self.delay.setting(rates, factor, threshold, rate)
+        self.images.setting(rates, factor, threshold, images)
+        self.cache.setting(cache, capacity)
 
     def json(self) -> dict:
         """
         Возвращает текущие параметры:
 
-        - span: Диапазон задержки;
-        - factor: Масштаб задержки;
-        - threshold: Порог смены типа задержки.
+        - rates: Диапазон частоты запросов;
+        - factor: Коэффициент уменьшения частоты;
+        - threshold: Количество успешных запросов для увеличения частоты;
+        - rate: Достигнутая частота запросов страниц;
+        - images: Достигнутая частота запросов постеров;
+        - cache: Режим работы кэша;
+        - capacity: Максимальный объем кэша.
 
         :return: Текущие параметры.
         """
 
-        return {'span': self.delay.span,
+        return {'rates': self.delay.rates,
                 'factor': self.delay.factor,
-                'threshold': self.delay.threshold}
+                'threshold': self.delay.threshold,
+                'rate': self.delay.rate,
+                'images': self.images.rate,
+                'cache': self.cache.mode,
+                'capacity': self.cache.capacity}
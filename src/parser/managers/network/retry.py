@@ -0,0 +1,89 @@
+import asyncio
+import random
+import time
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+from config.parser.managers.network.retry import ATTEMPTS
+from config.parser.managers.network.retry import BACKOFF
+from config.parser.managers.network.retry import DEADLINE
+
+
+class RetryManager(object):
+    """
+    Менеджер повторных запросов, задачами которого являются:
+
+    - ограничение количества попыток по классам кодов статусов;
+    - задержка между попытками (экспоненциальная с декоррелированным
+      случайным разбросом);
+    - ограничение общего времени выполнения запроса;
+
+    :var attempts: количество попыток по классам кодов статусов;
+    :var backoff: минимальная и максимальная задержка между попытками;
+    :var deadline: максимальное время выполнения запроса (в секундах);
+    :var exhausted: количество запросов, исчерпавших попытки.
+    """
+
+    def __init__(self):
+        self.attempts: dict = ATTEMPTS
+        self.backoff: tuple[float, float] = BACKOFF
+        self.deadline: float = DEADLINE
+        self.exhausted: int = 0
+
+    @staticmethod
+    def kind(code: int) -> str:
+        """
+        Определяет класс кода статуса неуспешного запроса:
+
+        - throttled: превышена частота запросов (429);
+        - server: ошибка сервера (5xx);
+        - network: ошибка соединения или тайм-аут (0);
+        - client: остальные коды статусов;
+
+        :param code: код статуса запроса;
+        :return: класс кода статуса.
+        """
+
+        if code == 429:
+            return 'throttled'
+        if code >= 500:
+            return 'server'
+        if code == 0:
+            return 'network'
+
+        return 'client'
+
+    async def run(self, send: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Отправляет запрос до получения успешного ответа, исчерпания попыток
+        класса кода статуса или истечения времени выполнения запроса;
+
+        :param send: функция отправки запроса;
+        :return: код статуса запроса, тело ответа и количество попыток.
+        """
+
+        start = time.monotonic()
+        attempts = {kind: 0 for kind in self.attempts}
+        low, high = self.backoff
+        sleep = low
+
+        while True:
+            response = await send()
+            code = response['code']
+
+            if code == 200:
+                return response
+
+            kind = self.kind(code)
+            attempts[kind] += 1
+
+            sleep = min(high, random.uniform(low, sleep * 3))
+            passed = time.monotonic() - start
+
+            if (attempts[kind] >= self.attempts[kind] or
+                    passed + sleep > self.deadline):
+                self.exhausted += 1
+                return response | {'attempts': sum(attempts.values())}
+
+            await asyncio.sleep(sleep)
@@ -64,34 +64,44 @@ class OutputManager(object):
 
     async def file(self,
                    directory: str,
+                   format: str,
                    size: dict,
                    records: dict,
-                   image: dict) -> None:
+                   image: dict,
+                   dead: int) -> None:
         """
         Получает данные и формирует состояние файлового менеджера;
 
         :param directory: имя файла с данными;
+        :param format: формат записи данных;
         :param size: размер файла с данными;
         :param records: количество собранных данных;
         :param image: размер и количество изображений;
+        :param dead: количество отложенных запросов;
         :return: None
         """
 
         self.states['file'] = f'Имя каталога: {directory:>24}.\n'
         for (file, size), records in zip(size.items(), records.values()):
-            file += '.csv'
+            file += '.csv' if format == 'csv' else '/'
             size /= 2 ** 10
             self.states['file'] += f'{file:<15} {records:7} {size:11.2f} KB.\n'
         folder, count, size = 'posters', image['count'], image['size'] / 2 ** 10
         self.states['file'] += f'{folder:<15} {count:7} {size:11.2f} KB.\n'
+        self.states['file'] += f'{"Отложено":<15} {dead:7}.\n'
 
-    async def network(self, statuses: dict, traffic: int, span: tuple) -> None:
+    async def network(self,
+                      statuses: dict,
+                      traffic: int,
+                      rate: float,
+                      pool: dict) -> None:
         """
         Получает данные и формирует состояние сетевого менеджера;
 
         :param statuses: статусы отправленных запросов;
         :param traffic: размер входящего трафика;
-        :param span: диапазон задержки;
+        :param rate: частота запросов (зап./сек.);
+        :param pool: использование пула соединений;
         :return: None.
         """
 
@@ -100,14 +110,22 @@ class OutputManager(object):
             failed += f'{"-":>5} {status:<6} {count:22};\n'
 
         total = statuses["successful"]
+        total += statuses["cached"]
         total += sum(statuses["failed"].values())
-        spans = f'{span[0]} - {span[1]}'
+
+        active = f'{pool["active"]} из {pool["limit"]}'
 
         self.states['network'] = (
             f'Входящий трафик: {traffic / 2 ** 10:15.2f} KB.\n'
-            f'Задержка: {spans:>21} сек.\n'
+            f'Частота запросов: {rate:14.2f} зап./сек.\n'
+            f'Пул соединений:\n'
+            f'{"Активные":12} {active:>22};\n'
+            f'{"В очереди":12} {pool["queued"]:22};\n'
+            f'{"Новые":12} {pool["created"]:22};\n'
+            f'{"Повторные":12} {pool["reused"]:22}.\n'
             f'Коды статусов отправленных запросов:\n'
             f'{"Успешно":10} {statuses["successful"]:24};\n'
+            f'{"Из кэша":10} {statuses["cached"]:24};\n'
             f'{"Неуспешно":10} {sum(statuses["failed"].values()):24};\n'
             f'{failed}'
             f'{"Всего":10} {total:24}.'
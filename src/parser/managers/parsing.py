@@ -1,11 +1,15 @@
-import ast
-import datetime
+import asyncio
+import copy
 
-import bs4
+from concurrent.futures import ProcessPoolExecutor
 
 from bs4 import BeautifulSoup
 
+from config.parser.managers.parsing import PARSING_DEFAULTS
 from config.parser.managers.parsing import PARSING_FIELDS
+from parser.backends import BACKENDS
+from parser.backends.backend import Backend
+from parser.backends.backend import Document
 from parser.movie import Movie
 
 
@@ -17,474 +21,95 @@ class ParsingManager(object):
     - учет успешно и неуспешно спарсенных данных;
 
     :var success: успешно спарсенные данные;
-    :var failed: неуспешно спарсенные данные.
+    :var failed: неуспешно спарсенные данные;
+    :var backend: имя парсера страниц фильмов;
+    :var parser: парсер страниц фильмов;
+    :var workers: количество процессов для парсинга;
+    :var executor: пул процессов для парсинга.
     """
 
-    def __init__(self):
+    def __init__(self, backend: str = 'soup'):
         self.success: dict[str: int] = {field: 0 for field in PARSING_FIELDS}
         self.failed: dict[str: int] = {field: 0 for field in PARSING_FIELDS}
+        self.backend: str = backend
+        self.parser: Backend = BACKENDS[backend]()
+        self.workers: int = 0
+        self.executor: ProcessPoolExecutor | None = None
 
-    async def parse(self, movie: Movie,  text: str) -> None:
+    async def parse(self, movie: Movie, text: str) -> None:
         """
-        Осуществляет парсинг основных данных;
+        Осуществляет парсинг основных данных. При наличии пула процессов
+        парсинг выполняется в отдельном процессе, а количество успешно
+        и неуспешно спарсенных данных объединяется в текущем процессе;
 
         :param movie: экземпляр класса Movie;
         :param text: данные для парсинга;
         :return: None.
         """
 
-        soup = BeautifulSoup(text, 'html.parser')
-
-        movie.link = await self.link(soup)
-        movie.name = await self.name(soup)
-        movie.date = await self.date(soup)
-        movie.description = await self.description(soup)
-        movie.tagline = await self.tagline(soup)
-        movie.actors = await self.actors(soup)
-        movie.crew = await self.crew(soup)
-        movie.details = await self.details(soup)
-        movie.genres = await self.genres(soup)
-        movie.releases = await self.releases(soup)
-        movie.minute = await self.minute(soup)
-        movie.rating = await self.rating(soup)
-
-    async def link(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг ссылки на изображение;
+        if self.executor:
+            loop = asyncio.get_running_loop()
+            fields, success, failed = await loop.run_in_executor(
+                self.executor,
+                extract,
+                text,
+                self.backend
+            )
 
-        :param soup: объект BeautifulSoup;
-        :return: ссылка на изображение.
-        """
+            for field, value in fields.items():
+                movie.assign(field, value)
 
-        try:
-            html = soup.find('script', type="application/ld+json")
-            contents = str(html.contents[0])
-            start = contents.find('{')
-            finish = contents.rfind('}') + 1
-            contents = ast.literal_eval(contents[start:finish])
-            image = contents['image']
-
-            self.success['link'] += 1
-            return image
-        except AttributeError:
-            self.failed['link'] += 1
-        except ValueError:
-            self.failed['link'] += 1
-        except KeyError:
-            self.failed['link'] += 1
-
-    async def name(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг названия фильма;
-
-        :param soup: объект BeautifulSoup;
-        :return: название фильма.
-        """
-
-        try:
-            name = (soup
-                    .find('section', class_="film-header-group")
-                    .find('h1')
-                    .text)
-
-            self.success['name'] += 1
-            return name
-        except AttributeError:
-            self.failed['name'] += 1
-        except ValueError:
-            self.failed['name'] += 1
-
-    async def date(self, soup: BeautifulSoup) -> int | None:
-        """
-        Осуществляет парсинг года выхода фильма;
-
-        :param soup: объект BeautifulSoup;
-        :return: года выхода фильма.
-        """
-
-        try:
-            date = (soup
-                    .find('section', class_="film-header-group")
-                    .find('div', class_="releaseyear")
-                    .text)
-            date = int(date)
-
-            self.success['date'] += 1
-            return date
-        except AttributeError:
-            self.failed['date'] += 1
-        except ValueError:
-            self.failed['date'] += 1
-        except KeyError:
-            self.failed['date'] += 1
-
-    async def description(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг описания фильма;
-
-        :param soup: объект BeautifulSoup;
-        :return: описание фильма.
-        """
-
-        try:
-            class_ = 'review body-text -prose -hero prettify'
-            description = (soup
-                           .find('div', class_=class_)
-                           .find('p')
-                           .text)
-            description = description.replace('\n', ' ')
-
-            self.success['description'] += 1
-            return description
-        except AttributeError:
-            self.failed['description'] += 1
-        except ValueError:
-            self.failed['description'] += 1
-        except KeyError:
-            self.failed['description'] += 1
-
-    async def tagline(self, soup: BeautifulSoup) -> str | None:
-        """
-        Осуществляет парсинг слогана фильма;
+            self.merge(success, failed)
+        else:
+            self.fill(movie, text)
 
-        :param soup: объект BeautifulSoup;
-        :return: слоган фильма.
+    def fill(self, movie: Movie, text: str) -> None:
         """
+        Осуществляет парсинг основных данных в текущем процессе;
 
-        try:
-            class_ = 'review body-text -prose -hero prettify'
-            tagline = (soup
-                       .find('div', class_=class_)
-                       .find('h4')
-                       .text)
-
-            self.success['tagline'] += 1
-            return tagline
-        except AttributeError:
-            self.failed['tagline'] += 1
-        except ValueError:
-            self.failed['tagline'] += 1
-        except KeyError:
-            self.failed['tagline'] += 1
-
-    async def actors(self, soup: BeautifulSoup) -> list | None:
-        """
-        Осуществляет парсинг актеров фильма;
-
-        :param soup: объект BeautifulSoup;
-        :return: актеры фильма.
-        """
-
-        try:
-            actors = (soup
-                      .find('div', id='tabbed-content')
-                      .find('div', id='tab-cast')
-                      .find_all('a', class_='text-slug tooltip'))
-
-            actors = [[actor.text, actor.attrs.get('title', None)]
-                      for actor in actors]
-
-            self.success['actors'] += 1
-            return actors
-        except AttributeError:
-            self.failed['actors'] += 1
-            return []
-        except ValueError:
-            self.failed['actors'] += 1
-            return []
-        except KeyError:
-            self.failed['actors'] += 1
-            return []
-
-    async def crew(self, soup: BeautifulSoup) -> dict | None:
-        """
-        Осуществляет парсинг съемочной группы фильма;
-
-        :param soup: объект BeautifulSoup;
-        :return: съемочная группа.
-        """
-
-        async def standard(string: str) -> str:
-            return (string
-                    .replace('Directors', 'Director')
-                    .replace('Operators', 'Operator')
-                    .replace('Composers', 'Composer')
-                    .replace('Producers', 'Producer')
-                    .replace('Writers', 'Writer')
-                    .replace('Editors', 'Editor')
-                    .capitalize())
-
-        try:
-            crew = {}
-
-            tags = (soup
-                    .find('div', id='tabbed-content')
-                    .find('div', id='tab-crew')
-                    .contents)
-
-            category = ''
-            for tag in tags:
-                if isinstance(tag, bs4.Tag):
-                    if tag.name == 'h3':
-                        category = await standard(tag.find('span').text)
-                        crew[category] = []
-                    else:
-                        names = tag.find_all('a')
-                        names = [name.text for name in names]
-                        crew[category] += names
-
-            self.success['crew'] += 1
-            return crew
-        except AttributeError:
-            self.failed['crew'] += 1
-            return {}
-        except ValueError:
-            self.failed['crew'] += 1
-            return {}
-        except KeyError:
-            self.failed['crew'] += 1
-            return {}
-
-    async def details(self, soup: BeautifulSoup) -> dict | None:
-        """
-        Осуществляет парсинг деталей фильма:
-
-        - язык;
-        - киностудия;
-        - страна;
-
-        :param soup: объект BeautifulSoup;
-        :return: детали фильма.
-        """
-
-        async def standard(string: str) -> str:
-            return (string
-                    .replace('Languages', 'Language')
-                    .replace('Studios', 'Studio')
-                    .replace('Countries', 'Country')
-                    .capitalize())
-
-        try:
-            details = {}
-
-            tags = (soup
-                    .find('div', id='tabbed-content')
-                    .find('div', id='tab-details')
-                    .contents)
-
-            category = ''
-            for tag in tags:
-                if isinstance(tag, bs4.Tag):
-                    if tag.name == 'h3':
-                        category = await standard(tag.find('span').text)
-                        if category in ['Alternative titles',
-                                        'Alternative title']:
-                            break
-                        details[category] = []
-                    else:
-                        names = tag.find_all('a')
-                        names = [name.text for name in names]
-                        details[category] += names
-
-            if details.get('Language') == ['No spoken language']:
-                details.pop('Language')
-
-            self.success['details'] += 1
-            return details
-        except AttributeError:
-            self.failed['details'] += 1
-            return {}
-        except ValueError:
-            self.failed['details'] += 1
-            return {}
-        except KeyError:
-            self.failed['details'] += 1
-            return {}
-
-    async def genres(self, soup: BeautifulSoup) -> dict | None:
+        :param movie: экземпляр класса Movie;
+        :param text: данные для парсинга;
+        :return: None.
         """
-        Осуществляет парсинг жанров фильма;
 
-        :param soup: объект BeautifulSoup;
-        :return: жанры фильма.
-        """
+        document = self.parser.document(text)
 
-        async def standard(string: str) -> str:
-            return (string
-                    .replace('Genres', 'Genre')
-                    .replace('Themes', 'Theme')
-                    .capitalize())
+        for field in PARSING_FIELDS:
+            movie.assign(field, self.field(field, document))
 
-        try:
-            genres = {}
-
-            tags = (soup
-                    .find('div', id='tabbed-content')
-                    .find('div', id='tab-genres')
-                    .contents)
-
-            category = ''
-            for tag in tags:
-                if isinstance(tag, bs4.Tag):
-                    if tag.name == 'h3':
-                        category = await standard(tag.find('span').text)
-                        genres[category] = []
-                    else:
-                        names = tag.find_all('a')
-                        names = [' '.join(name.text.split()) for name in names]
-                        genres[category] += names
-
-            if 'Theme' in genres and 'Show All…' in genres['Theme']:
-                genres['Theme'].remove('Show All…')
-
-            self.success['genres'] += 1
-            return genres
-        except AttributeError:
-            self.failed['genres'] += 1
-            return {}
-        except ValueError:
-            self.failed['genres'] += 1
-            return {}
-        except KeyError:
-            self.failed['genres'] += 1
-            return {}
-
-    async def releases(self, soup: BeautifulSoup) -> dict | None:
+    def field(self, field: str, document: Document):
         """
-        Осуществляет парсинг релизов фильма;
+        Осуществляет парсинг поля. Учитывает успешно и неуспешно
+        спарсенные данные. Поле, отсутствующее на странице или имеющее
+        неожиданный тип, получает значение по умолчанию;
 
-        :param soup: объект BeautifulSoup;
-        :return: релизы фильма.
+        :param field: название поля;
+        :param document: разобранная страница;
+        :return: значение поля.
         """
 
-        async def clear(string: str) -> str | None:
-            digit = ''.join(char
-                            if char.isdigit()
-                            else ''
-                            for char in string)
-            chars = ''.join(char
-                            if not char.isdigit()
-                            else ''
-                            for char in string)
-            symbols = ''.join(char
-                              if not char.isdigit() and not char.isalpha()
-                              else ''
-                              for char in string)
-
-            if (len(digit) <= 3 and
-                    len(string) < 6 and
-                    string.isascii() and
-                    (len(chars) == 0 or chars.isupper()) and
-                    (not symbols or set(symbols) < {'-', '/', '+'})):
-                return string.strip()
-            else:
-                return None
-
         try:
-            releases = {}
-
-            tags = (soup
-                    .find('div', id='tabbed-content')
-                    .find('div', id='tab-releases-by-country')
-                    .find('div', class_='release-table -bycountry')
-                    .contents
-                    )
-
-            for tag in tags:
-                if isinstance(tag, bs4.Tag) and tag.name == 'div':
-                    country = (tag
-                               .find('div', class_='cell')
-                               .text
-                               .strip())
-
-                    releases[country] = []
-
-                    details = (tag
-                               .find('div', class_='cell details')
-                               .find_all('div', class_='release-date-list'))
-
-                    for detail in details:
-                        date = detail.find('h6', class_="date").text
-                        date = (datetime
-                                .datetime
-                                .strptime(date, '%d %b %Y')
-                                .strftime('%Y-%m-%d'))
-
-                        info = detail.find('ul', class_="releases")
-
-                        form = (info
-                                .find('span', class_="type")
-                                .text
-                                .strip())
-
-                        rating = info.find('span', class_="label")
-                        rating = await clear(rating
-                                             .text) if rating else None
-
-                        releases[country].append([date, form, rating])
-
-            self.success['releases'] += 1
-            return releases
-        except AttributeError:
-            self.failed['releases'] += 1
-            return {}
-        except ValueError:
-            self.failed['releases'] += 1
-            return {}
-        except KeyError:
-            self.failed['releases'] += 1
-            return {}
-
-    async def minute(self, soup: BeautifulSoup) -> int | None:
-        """
-        Осуществляет парсинг продолжительности фильма (в минутах);
+            value = getattr(self.parser, field)(document)
 
-        :param soup: объект BeautifulSoup;
-        :return: продолжительность фильма (в минутах).
-        """
+            self.success[field] += 1
+            return value
+        except (AttributeError, ValueError, KeyError, IndexError, TypeError):
+            self.failed[field] += 1
+            return copy.copy(PARSING_DEFAULTS.get(field))
 
-        try:
-            minute = (soup
-                      .find('p', class_="text-link text-footer")
-                      .strings)
-            minute = [*minute][0].strip()
-            minute = ''.join(m for m in minute if m.isdigit())
-            minute = int(minute)
-
-            self.success['minute'] += 1
-            return minute
-        except AttributeError:
-            self.failed['minute'] += 1
-        except ValueError:
-            self.failed['minute'] += 1
-        except KeyError:
-            self.failed['minute'] += 1
-
-    async def rating(self, soup: BeautifulSoup) -> float | None:
+    def merge(self, success: dict, failed: dict) -> None:
         """
-        Осуществляет парсинг рейтинга фильма;
+        Учитывает успешно и неуспешно спарсенные данные, полученные
+        из другого процесса;
 
-        :param soup: объект BeautifulSoup;
-        :return: рейтинг фильма.
+        :param success: успешно спарсенные данные;
+        :param failed: неуспешно спарсенные данные;
+        :return: None.
         """
 
-        try:
-            html = soup.find('script', type="application/ld+json")
-            contents = str(html.contents[0])
-            start = contents.find('{')
-            finish = contents.rfind('}') + 1
-            contents = ast.literal_eval(contents[start:finish])
-            rating = contents['aggregateRating']['ratingValue']
-            rating = float(rating)
-
-            self.success['rating'] += 1
-            return rating
-        except AttributeError:
-            self.failed['rating'] += 1
-        except ValueError:
-            self.failed['rating'] += 1
-        except KeyError:
-            self.failed['rating'] += 1
+        for field in PARSING_FIELDS:
+            self.success[field] += success[field]
+            self.failed[field] += failed[field]
 
     @staticmethod
     async def page(text: str) -> int:
@@ -510,22 +135,90 @@ class ParsingManager(object):
         return number
 
     @staticmethod
-    async def movies(url: str, text: str) -> list:
+    async def movies(url: str, text: str) -> list[tuple]:
         """
-        Осуществляет парсинг ссылок на фильмы, находящеюся на странице;
+        Осуществляет парсинг фильмов, находящихся на странице: id фильма
+        на сайте (data-film-id), адреса фильма (slug) и ссылки на фильм;
 
         :param url: адрес сайта letterbox;
         :param text: данные для парсинга;
-        :return: ссылки на фильмы.
+        :return: id, адреса и ссылки на фильмы.
         """
 
-        links = []
+        films = []
 
         soup = BeautifulSoup(text, 'html.parser')
         html = soup.find_all('li')
 
         for li in html:
-            link = li.find('div')['data-target-link']
-            links.append(url + link)
+            div = li.find('div')
+            link = div['data-target-link']
+            slug = div.get('data-film-slug') or link.strip('/').split('/')[-1]
+            i = div.get('data-film-id', '')
+
+            films.append((int(i) if i.isdigit() else None, slug, url + link))
+
+        return films
+
+    def setting(self, workers: int, backend: str) -> None:
+        """
+        Настраивает менеджер. При нулевом количестве процессов парсинг
+        выполняется в текущем процессе;
+
+        :param workers: количество процессов для парсинга;
+        :param backend: имя парсера страниц фильмов;
+        :return: None.
+        """
+
+        self.close()
+
+        self.backend = backend
+        self.parser = BACKENDS[backend]()
+        self.workers = workers
+
+        if workers:
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+
+    def close(self) -> None:
+        """
+        Завершает работу пула процессов;
+
+        :return: None.
+        """
+
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - workers: количество процессов для парсинга;
+        - backend: имя парсера страниц фильмов.
+
+        :return: текущие параметры.
+        """
+
+        return {'workers': self.workers,
+                'backend': self.backend}
+
+
+def extract(text: str, backend: str) -> tuple[dict, dict, dict]:
+    """
+    Осуществляет парсинг основных данных в процессе из пула процессов;
+
+    :param text: данные для парсинга;
+    :param backend: имя парсера страниц фильмов;
+    :return: спарсенные данные, количество успешно и неуспешно
+    спарсенных данных.
+    """
+
+    manager = ParsingManager(backend)
+    movie = Movie(None)
+
+    manager.fill(movie, text)
+
+    fields = {field: getattr(movie, field) for field in PARSING_FIELDS}
 
-        return links
+    return fields, manager.success, manager.failed
@@ -0,0 +1,160 @@
+import asyncio
+
+
+class Page(object):
+    """
+    Страница с данными, фильмы которой обрабатываются конвейером;
+
+    :var number: номер страницы;
+    :var remain: количество необработанных фильмов;
+    :var listed: флаг получения всех ссылок страницы.
+    """
+
+    def __init__(self, number: int, count: int):
+        self.number: int = number
+        self.remain: int = count
+        self.listed: bool = False
+
+    def done(self) -> None:
+        """
+        Отмечает завершение обработки фильма страницы (запись данных
+        и постера);
+
+        :return: None.
+        """
+
+        self.remain -= 1
+
+    def complete(self) -> bool:
+        """
+        Проверяет, обработаны ли все фильмы страницы;
+
+        :return: флаг завершения обработки страницы.
+        """
+
+        return self.listed and not self.remain
+
+
+class PipelineManager(object):
+    """
+    Менеджер конвейера, задачами которого являются:
+
+    - хранение ограниченных очередей между этапами сбора данных;
+    - учет страниц, фильмы которых находятся в обработке;
+    - выдача завершенных страниц в порядке их следования;
+
+    :var requests: количество одновременно обрабатываемых фильмов;
+    :var downloads: количество одновременно получаемых постеров;
+    :var queue: размер очередей между этапами;
+    :var batch: количество страниц между контрольными точками;
+    :var movies: очередь фильмов для получения данных;
+    :var posters: очередь ссылок для получения постеров;
+    :var pages: очередь страниц для сохранения контрольных точек;
+    :var processing: страницы, находящиеся в обработке;
+    :var current: номер следующей страницы для записи.
+    """
+
+    def __init__(self):
+        self.requests: int | None = None
+        self.downloads: int | None = None
+        self.queue: int | None = None
+        self.batch: int | None = None
+        self.movies: asyncio.Queue | None = None
+        self.posters: asyncio.Queue | None = None
+        self.pages: asyncio.Queue | None = None
+        self.processing: dict[int, Page] = {}
+        self.current: int | None = None
+
+    def start(self, current: int) -> None:
+        """
+        Создает очереди между этапами сбора данных;
+
+        :param current: номер первой страницы для записи;
+        :return: None.
+        """
+
+        self.movies = asyncio.Queue(self.queue)
+        self.posters = asyncio.Queue(self.queue)
+        self.pages = asyncio.Queue(self.queue)
+        self.processing = {}
+        self.current = current
+
+    def open(self, number: int, count: int) -> Page:
+        """
+        Регистрирует страницу, фильмы которой поступают в обработку;
+
+        :param number: номер страницы;
+        :param count: количество фильмов на странице;
+        :return: страница.
+        """
+
+        page = Page(number, count)
+        self.processing[number] = page
+
+        return page
+
+    def completed(self) -> list[Page]:
+        """
+        Извлекает завершенные страницы, сохраняя порядок их следования;
+
+        :return: завершенные страницы.
+        """
+
+        pages = []
+
+        while (self.current in self.processing and
+               self.processing[self.current].complete()):
+            pages.append(self.processing.pop(self.current))
+            self.current += 1
+
+        return pages
+
+    @staticmethod
+    async def close(queue: asyncio.Queue, count: int) -> None:
+        """
+        Сообщает обработчикам очереди о завершении поступления данных;
+
+        :param queue: очередь;
+        :param count: количество обработчиков очереди;
+        :return: None.
+        """
+
+        for _ in range(count):
+            await queue.put(None)
+
+    def setting(self,
+                requests: int,
+                downloads: int,
+                queue: int,
+                batch: int) -> None:
+        """
+        Настраивает менеджер;
+
+        :param requests: количество одновременно обрабатываемых фильмов;
+        :param downloads: количество одновременно получаемых постеров;
+        :param queue: размер очередей между этапами;
+        :param batch: количество страниц между контрольными точками;
+        :return: None.
+        """
+
+        self.requests = requests
+        self.downloads = downloads
+        self.queue = queue
+        self.batch = batch
+
+    def json(self) -> dict:
+        """
+        Возвращает текущие параметры:
+
+        - requests: количество одновременно обрабатываемых фильмов;
+        - downloads: количество одновременно получаемых постеров;
+        - queue: размер очередей между этапами;
+        - batch: количество страниц между контрольными точками.
+
+        :return: текущие параметры.
+        """
+
+        return {'requests': self.requests,
+                'downloads': self.downloads,
+                'queue': self.queue,
+                'batch': self.batch}
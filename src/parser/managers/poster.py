@@ -0,0 +1,252 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+
+from config.parser.managers.poster import DATABASE
+from config.parser.managers.poster import STORE
+from parser.managers.network.cache import place
+
+
+class PosterManager(object):
+    """
+    Менеджер хранилища постеров, задачами которого являются:
+
+    - хранение постеров по хешу их содержимого (sha256), поэтому
+      одинаковые постеры разных фильмов записываются на диск один раз;
+    - размещение постеров фильмов (posters/<id>.jpg) жесткими ссылками
+      на постеры хранилища;
+    - ведение индекса постеров фильмов и учет их количества и размера
+      без обращения к файловой системе;
+
+    Записи индекса накапливаются в памяти и записываются вместе с данными,
+    а при возобновлении сбора данных постеры фильмов, отсутствующие
+    в индексе, добавляются в хранилище;
+
+    :var path: путь к каталогу хранилища;
+    :var connection: соединение с базой данных индекса;
+    :var posters: хеши постеров по id фильмов;
+    :var blobs: размеры постеров хранилища по их хешам;
+    :var pending: записи индекса, не записанные на диск;
+    :var size: размер постеров хранилища.
+    """
+
+    def __init__(self):
+        self.path: str | None = None
+        self.connection: sqlite3.Connection | None = None
+        self.posters: dict[int, str] = {}
+        self.blobs: dict[str, int] = {}
+        self.pending: list[tuple] = []
+        self.size: int = 0
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает хранилище. В режиме 'w' хранилище создается заново,
+        иначе временные файлы прерванного получения постеров удаляются;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        self.path = fr'{path}\{STORE}'
+
+        if mode == 'w':
+            shutil.rmtree(self.path, ignore_errors=True)
+
+        os.makedirs(self.path, exist_ok=True)
+
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.startswith('incoming-'):
+                    os.remove(entry.path)
+
+        self.connection = sqlite3.connect(fr'{self.path}\{DATABASE}',
+                                          check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS blobs ('
+                'hash TEXT PRIMARY KEY, '
+                'size INTEGER NOT NULL)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS posters ('
+                'id INTEGER PRIMARY KEY, '
+                'hash TEXT NOT NULL REFERENCES blobs (hash))'
+            )
+
+        self.posters = dict(self.connection.execute(
+            'SELECT id, hash FROM posters'
+        ))
+        self.blobs = dict(self.connection.execute(
+            'SELECT hash, size FROM blobs'
+        ))
+        self.pending = []
+        self.size = sum(self.blobs.values())
+
+    def stage(self, i: int) -> str:
+        """
+        Возвращает путь к временному файлу для получения постера;
+
+        :param i: id фильма;
+        :return: путь к временному файлу.
+        """
+
+        return fr'{self.path}\incoming-{i}.jpg'
+
+    def locate(self, digest: str) -> str:
+        """
+        Возвращает путь к постеру хранилища по его хешу;
+
+        :param digest: хеш постера;
+        :return: путь к постеру хранилища.
+        """
+
+        return fr'{self.path}\{digest[:2]}\{digest}.jpg'
+
+    def has(self, i: int) -> bool:
+        """
+        Проверяет, сохранен ли постер фильма;
+
+        :param i: id фильма;
+        :return: флаг наличия постера.
+        """
+
+        return i in self.posters
+
+    def store(self, source: str, digest: str, target: str) -> None:
+        """
+        Перемещает полученный постер в хранилище, если постера с таким
+        хешем в нем нет, иначе удаляет его, и размещает постер фильма
+        ссылкой на постер хранилища, если он еще не размещен. Выполняется
+        в отдельном потоке;
+
+        :param source: путь к полученному постеру;
+        :param digest: хеш постера;
+        :param target: путь к постеру фильма;
+        :return: None.
+        """
+
+        blob = self.locate(digest)
+
+        if os.path.exists(blob):
+            os.remove(source)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(source, blob)
+
+        if not (os.path.exists(target) and os.path.samefile(blob, target)):
+            place(blob, target)
+
+    def add(self, i: int, digest: str, size: int) -> None:
+        """
+        Учитывает размещенный постер фильма в индексе;
+
+        :param i: id фильма;
+        :param digest: хеш постера;
+        :param size: размер постера;
+        :return: None.
+        """
+
+        if digest not in self.blobs:
+            self.blobs[digest] = size
+            self.size += size
+            self.pending.append(('blob', digest, size))
+
+        if self.posters.get(i) != digest:
+            self.posters[i] = digest
+            self.pending.append(('poster', i, digest))
+
+    def recover(self, path: str) -> None:
+        """
+        Добавляет в хранилище постеры фильмов, отсутствующие в индексе
+        (записанные до последней записи индекса или без хранилища),
+        и удаляет временные файлы прерванного размещения постеров;
+
+        :param path: путь к каталогу постеров фильмов;
+        :return: None.
+        """
+
+        with os.scandir(path) as entries:
+            entries = list(entries)
+
+        for entry in entries:
+            name, _, extension = entry.name.partition('.')
+
+            if extension == 'jpg.part':
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+            if extension != 'jpg' or not name.isdigit():
+                continue
+            if int(name) in self.posters:
+                continue
+
+            with open(entry.path, 'rb') as file:
+                digest = hashlib.file_digest(file, 'sha256').hexdigest()
+
+            source = self.stage(int(name))
+            place(entry.path, source)
+
+            self.store(source, digest, entry.path)
+            self.add(int(name), digest, entry.stat().st_size)
+
+        self.dump(self.take())
+
+    def take(self) -> list[tuple]:
+        """
+        Извлекает записи индекса;
+
+        :return: записи индекса.
+        """
+
+        pending, self.pending = self.pending, []
+
+        return pending
+
+    def dump(self, pending: list[tuple]) -> None:
+        """
+        Записывает записи индекса одной транзакцией. Может выполняться
+        в отдельном потоке;
+
+        :param pending: записи индекса;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO blobs (hash, size) VALUES (?, ?)',
+                [row[1:] for row in pending if row[0] == 'blob']
+            )
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO posters (id, hash) VALUES (?, ?)',
+                [row[1:] for row in pending if row[0] == 'poster']
+            )
+
+    def stat(self) -> dict:
+        """
+        Возвращает количество постеров фильмов и размер постеров
+        хранилища;
+
+        :return: размер и количество постеров.
+        """
+
+        return {'size': self.size, 'count': len(self.posters)}
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся записи и закрывает индекс;
+
+        :return: None.
+        """
+
+        if self.connection:
+            self.dump(self.take())
+
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,222 @@
+import json
+import sqlite3
+import time
+
+from config.parser.managers.work import LEASE
+from config.parser.managers.work import QUEUE
+
+
+class WorkManager(object):
+    """
+    Менеджер очереди задач распределенного сбора данных, задачами
+    которого являются:
+
+    - разбиение страниц на задачи (диапазоны страниц);
+    - выдача задач процессам сбора данных во временное владение (аренду);
+    - продление аренды и отметка о выполнении задач;
+    - повторная выдача задач, аренда которых истекла;
+    - выделение процессам диапазонов id для фильмов без id в списке;
+
+    Очередь хранится в базе данных SQLite в каталоге с данными, поэтому
+    процессы сбора данных могут выполняться на разных компьютерах
+    с общим каталогом;
+
+    :var lease: время аренды задачи (в секундах);
+    :var connection: соединение с базой данных очереди.
+    """
+
+    def __init__(self):
+        self.lease: float = LEASE
+        self.connection: sqlite3.Connection | None = None
+
+    def open(self, path: str) -> None:
+        """
+        Открывает очередь задач, создавая ее при отсутствии;
+
+        :param path: путь к каталогу с данными;
+        :return: None.
+        """
+
+        self.close()
+
+        self.connection = sqlite3.connect(fr'{path}\{QUEUE}', timeout=60)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS tasks ('
+                'first INTEGER PRIMARY KEY, '
+                'last INTEGER NOT NULL, '
+                'state TEXT NOT NULL, '
+                'worker TEXT, '
+                'expires REAL, '
+                'attempts INTEGER NOT NULL DEFAULT 0)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS settings ('
+                'key TEXT PRIMARY KEY, '
+                'value TEXT NOT NULL)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS blocks ('
+                'block INTEGER PRIMARY KEY, '
+                'worker TEXT NOT NULL UNIQUE)'
+            )
+
+    def plan(self, first: int, last: int, size: int, settings: dict) -> int:
+        """
+        Разбивает страницы на задачи по size страниц и сохраняет настройки
+        сбора данных. Имеющаяся очередь не изменяется, поэтому прерванный
+        сбор данных продолжается;
+
+        :param first: номер первой страницы;
+        :param last: номер последней страницы;
+        :param size: количество страниц в задаче;
+        :param settings: настройки сбора данных;
+        :return: количество задач.
+        """
+
+        with self.connection:
+            if not self.connection.execute('SELECT 1 FROM tasks').fetchone():
+                self.connection.executemany(
+                    'INSERT INTO tasks (first, last, state) '
+                    "VALUES (?, ?, 'pending')",
+                    [(page, min(page + size - 1, last))
+                     for page in range(first, last + 1, size)]
+                )
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO settings (key, value) '
+                    'VALUES (?, ?)',
+                    [(key, json.dumps(value))
+                     for key, value in settings.items()]
+                )
+
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM tasks'
+        ).fetchone()[0]
+
+    def settings(self) -> dict:
+        """
+        Возвращает настройки сбора данных;
+
+        :return: настройки сбора данных.
+        """
+
+        return {key: json.loads(value)
+                for key, value in self.connection.execute(
+                    'SELECT key, value FROM settings'
+                )}
+
+    def reserve(self, worker: str) -> int:
+        """
+        Выделяет процессу номер диапазона id для фильмов без id в списке.
+        Процесс с тем же именем получает прежний номер, поэтому id шарда
+        не пересекаются с id других шардов;
+
+        :param worker: имя процесса;
+        :return: номер диапазона.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR IGNORE INTO blocks (worker) VALUES (?)',
+                (worker, )
+            )
+
+        return self.connection.execute(
+            'SELECT block FROM blocks WHERE worker = ?', (worker, )
+        ).fetchone()[0]
+
+    def claim(self, worker: str) -> tuple[int, int] | None:
+        """
+        Выдает процессу первую свободную задачу или задачу, аренда
+        которой истекла. Выдача выполняется одним запросом, поэтому
+        задача не может быть выдана двум процессам;
+
+        :param worker: имя процесса;
+        :return: номера первой и последней страниц задачи.
+        """
+
+        now = time.time()
+
+        with self.connection:
+            rows = self.connection.execute(
+                "UPDATE tasks SET state = 'leased', worker = ?, expires = ?, "
+                'attempts = attempts + 1 '
+                'WHERE first = ('
+                'SELECT first FROM tasks '
+                "WHERE state = 'pending' "
+                "OR (state = 'leased' AND expires < ?) "
+                'ORDER BY first LIMIT 1) '
+                'RETURNING first, last',
+                (worker, now + self.lease, now)
+            ).fetchall()
+
+        return rows[0] if rows else None
+
+    def heartbeat(self, worker: str, task: tuple[int, int]) -> bool:
+        """
+        Продлевает аренду задачи;
+
+        :param worker: имя процесса;
+        :param task: номера первой и последней страниц задачи;
+        :return: флаг продления аренды (задача не передана другому
+        процессу).
+        """
+
+        with self.connection:
+            return self.connection.execute(
+                'UPDATE tasks SET expires = ? '
+                "WHERE first = ? AND worker = ? AND state = 'leased'",
+                (time.time() + self.lease, task[0], worker)
+            ).rowcount == 1
+
+    def complete(self, task: tuple[int, int]) -> None:
+        """
+        Отмечает задачу выполненной;
+
+        :param task: номера первой и последней страниц задачи;
+        :return: None.
+        """
+
+        with self.connection:
+            self.connection.execute(
+                "UPDATE tasks SET state = 'done', expires = NULL "
+                'WHERE first = ?',
+                (task[0], )
+            )
+
+    def stat(self) -> dict:
+        """
+        Возвращает количество задач по состояниям и имена процессов,
+        владеющих задачами;
+
+        :return: количество задач и имена процессов.
+        """
+
+        stat = {'pending': 0, 'leased': 0, 'expired': 0, 'done': 0}
+
+        for state, count in self.connection.execute(
+                "SELECT CASE WHEN state = 'leased' AND expires < ? "
+                "THEN 'expired' ELSE state END, COUNT(*) "
+                'FROM tasks GROUP BY 1',
+                (time.time(), )):
+            stat[state] = count
+
+        stat['workers'] = [worker for worker, in self.connection.execute(
+            "SELECT DISTINCT worker FROM tasks WHERE state = 'leased' "
+            'ORDER BY worker'
+        )]
+
+        return stat
+
+    def close(self) -> None:
+        """
+        Закрывает очередь задач;
+
+        :return: None.
+        """
+
+        if self.connection:
+            self.connection.close()
+            self.connection = None
@@ -1,10 +1,37 @@
+import sys
+
+from collections.abc import Iterator
+
+
+def intern(value):
+    """
+    Возвращает значение, строки которого, в том числе вложенные в списки,
+    кортежи и словари, заменены единственными экземплярами повторяющихся
+    строк (ролей, стран, типов релизов, языков), чтобы данные фильмов
+    в памяти не дублировались;
+
+    :param value: значение;
+    :return: значение с интернированными строками.
+    """
+
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {intern(key): intern(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(intern(item) for item in value)
+
+    return value
+
+
 class Movie(object):
     """
-    Фильм;
+    Фильм. Атрибуты хранятся в слотах, строки вложенных значений
+    интернируются при записи, а строки таблиц формируются по требованию
+    без промежуточных структур;
 
     :var id: идентификатор;
     :var link: ссылка на постер;
-    :var poster: постер;
     :var name: название;
     :var date: год выхода;
     :var description: описание;
@@ -18,12 +45,27 @@ class Movie(object):
     :var rating: средний рейтинг;
     """
 
+    __slots__ = (
+        'id',
+        'link',
+        'name',
+        'date',
+        'description',
+        'tagline',
+        'actors',
+        'crew',
+        'details',
+        'genres',
+        'releases',
+        'minute',
+        'rating'
+    )
+
     def __init__(self, num: int):
         self.id: int | None = num
         self.link: str | None = None
-        self.poster: bytes | None = None
         self.name: str | None = None
-        self.date: str | None = None
+        self.date: int | None = None
         self.description: str | None = None
         self.tagline: str | None = None
         self.actors: list | None = None
@@ -34,46 +76,66 @@ class Movie(object):
         self.minute: int | None = None
         self.rating: float | None = None
 
-    def csv(self) -> dict:
+    def assign(self, field: str, value) -> None:
         """
-        Возвращает данные для записи в csv-файл.
+        Записывает значение поля. Строки вложенных значений (актеров,
+        съемочной группы, деталей, жанров, релизов) интернируются, поэтому
+        повторяющиеся строки не дублируются в фильмах, ожидающих записи;
 
-        :return: Данные для записи в csv-файл.
+        :param field: название поля;
+        :param value: значение поля;
+        :return: None.
         """
 
-        csv = {
-            'movies': [
-                self.id,
-                self.name,
-                self.date,
-                self.tagline,
-                self.description,
-                self.minute,
-                self.rating
-            ],
-            'posters': [
-                self.id,
-                self.link
-            ],
-            'actors': [[self.id, name, role] for name, role in self.actors],
-            'crew': [[self.id, role, name]
-                     for role in self.crew
-                     for name in self.crew[role]],
-            'releases': [[self.id, country, date, t, rating]
-                         for country in self.releases
-                         for (date, t, rating) in self.releases[country]],
-            'genres': [[self.id, genre]
-                       for genre in self.genres.get('Genre', [])],
-            'themes': [[self.id, theme]
-                       for theme in self.genres.get('Theme', [])],
-            'languages': [[self.id, t, language]
-                          for t in self.details
-                          for language in self.details[t]
-                          if t not in ['Studio', 'Country']],
-            'studios': [[self.id, studio]
-                        for studio in self.details.get('Studio', [])],
-            'countries': [[self.id, country]
-                          for country in self.details.get('Country', [])]
-        }
-
-        return csv
+        if isinstance(value, (list, dict)):
+            value = intern(value)
+
+        setattr(self, field, value)
+
+    def rows(self) -> Iterator[tuple[str, tuple]]:
+        """
+        Последовательно возвращает строки таблиц фильма;
+
+        :return: имя таблицы и строка.
+        """
+
+        i = self.id
+
+        yield 'movies', (i,
+                         self.name,
+                         self.date,
+                         self.tagline,
+                         self.description,
+                         self.minute,
+                         self.rating)
+        yield 'posters', (i, self.link)
+
+        for name, role in self.actors:
+            yield 'actors', (i, name, role)
+
+        for role, names in self.crew.items():
+            for name in names:
+                yield 'crew', (i, role, name)
+
+        for country, releases in self.releases.items():
+            for date, t, rating in releases:
+                yield 'releases', (i, country, date, t, rating)
+
+        for genre in self.genres.get('Genre', []):
+            yield 'genres', (i, genre)
+
+        for theme in self.genres.get('Theme', []):
+            yield 'themes', (i, theme)
+
+        for t, values in self.details.items():
+            if t in ('Studio', 'Country'):
+                continue
+
+            for language in values:
+                yield 'languages', (i, t, language)
+
+        for studio in self.details.get('Studio', []):
+            yield 'studios', (i, studio)
+
+        for country in self.details.get('Country', []):
+            yield 'countries', (i, country)
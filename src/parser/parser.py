@@ -1,10 +1,13 @@
 import asyncio
+import datetime
 
-from config.parser.parser import VALID_ATTEMPTS
+from config.parser.parser import SETTINGS
 from parser.managers.file import FileManager
 from parser.managers.network.network import NetworkManager
 from parser.managers.output import OutputManager
 from parser.managers.parsing import ParsingManager
+from parser.managers.pipeline import Page
+from parser.managers.pipeline import PipelineManager
 from parser.managers.progress import ProgressManager
 from parser.movie import Movie
 
@@ -17,6 +20,7 @@ class Parser(object):
     :var network: сетевой менеджер;
     :var output: менеджер вывода;
     :var parsing: менеджер парсинга;
+    :var pipeline: менеджер конвейера;
     :var progress: менеджер прогресса;
     :var stopped: флаг остановки трансфера данных.
     """
@@ -26,17 +30,22 @@ class Parser(object):
         self.network: NetworkManager = NetworkManager()
         self.output: OutputManager = OutputManager()
         self.parsing: ParsingManager = ParsingManager()
+        self.pipeline: PipelineManager = PipelineManager()
         self.progress: ProgressManager = ProgressManager()
         self.stopped: bool = False
 
     async def connect(self) -> int:
         """
-        Проверяет соединение с сервером перед началом сбора данных;
+        Проверяет соединение с сервером перед началом сбора данных.
+        Количество соединений с сервером ограничивается количеством
+        одновременно обрабатываемых фильмов и получаемых постеров.
+        В режиме работы только с кэшем соединение не проверяется;
 
         :return: Код статуса запроса.
         """
 
-        code = await self.network.connect()
+        limit = SETTINGS['requests'] + SETTINGS['downloads']
+        code = await self.network.connect(limit, SETTINGS['cache'] != 'only')
 
         return code
 
@@ -63,21 +72,307 @@ class Parser(object):
 
     async def run(self) -> None:
         """
-        Запускает процесс сбора данных;
+        Запускает процесс сбора данных и завершает его после обработки
+        всех страниц;
 
         :return: None
         """
 
         current, last = self.progress.progress
 
-        for page in range(current, last + 1):
-            links = await self.links(page)
+        await self.crawl(current, last)
 
-            first = (page - 1) * 18 + 1
-            ids = [10 ** 6 + i for i in range(first, first + len(links))]
+        await self.file.close()
+        self.file.delete()
+
+        await self.transfer()
+        await self.output.state()
+
+        self.output.stopped = True
+        self.stopped = True
+
+    async def crawl(self, current: int, last: int) -> None:
+        """
+        Осуществляет сбор данных с указанных страниц. Получение ссылок,
+        данных фильмов, постеров и сохранение контрольных точек выполняются
+        отдельными этапами, связанными ограниченными очередями. Ошибка
+        любого этапа отменяет остальные этапы и вызывается повторно, поэтому
+        этапы не ожидают друг друга бесконечно. При отмене сбора данных
+        отменяются все этапы;
+
+        :param current: номер первой страницы;
+        :param last: номер последней страницы;
+        :return: None
+        """
+
+        requests = self.pipeline.requests
+        downloads = self.pipeline.downloads
+
+        self.pipeline.start(current)
+
+        discovery = asyncio.create_task(self.discover(current, last))
+        fetchers = [asyncio.create_task(self.fetch())
+                    for _ in range(requests)]
+        downloaders = [asyncio.create_task(self.download())
+                       for _ in range(downloads)]
+        writer = asyncio.create_task(self.store())
+
+        async def finish() -> None:
+            await discovery
+            await self.pipeline.close(self.pipeline.movies, requests)
+            await asyncio.gather(*fetchers)
+            await self.pipeline.close(self.pipeline.posters, downloads)
+            await asyncio.gather(*downloaders)
+            await self.pipeline.close(self.pipeline.pages, 1)
+            await writer
+
+        stages = (discovery, *fetchers, *downloaders, writer)
+        control = asyncio.create_task(finish())
+
+        try:
+            done, _ = await asyncio.wait((*stages, control),
+                                         return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for stage in (*stages, control):
+                stage.cancel()
+
+            await asyncio.gather(*stages, control, return_exceptions=True)
+
+        for stage in (*stages, control):
+            if stage in done and not stage.cancelled() and stage.exception():
+                raise stage.exception()
+
+    async def discover(self, current: int, last: int) -> None:
+        """
+        Этап получения ссылок на страницы с данными. Перед получением
+        ссылок повторно обрабатываются отложенные запросы. Страница,
+        ссылки которой получить не удалось, откладывается;
+
+        :param current: номер первой страницы;
+        :param last: номер последней страницы;
+        :return: None.
+        """
+
+        await self.replay()
+
+        for number in range(current, last + 1):
+            films = await self.links(number) or []
+
+            page = self.pipeline.open(number, len(films))
+
+            await self.queue(page, films)
+
+            page.listed = True
+            await self.pipeline.pages.put(page)
+
+    async def queue(self, page: Page, films: list[tuple]) -> None:
+        """
+        Передает новые фильмы и фильмы, рейтинг которых необходимо
+        обновить, на этап получения данных. Собранные ранее
+        и повторяющиеся фильмы пропускаются;
+
+        :param page: страница с данными;
+        :param films: id, адреса и ссылки на страницы фильмов;
+        :return: None.
+        """
+
+        index = self.file.index
+
+        for i, slug, link in films:
+            if (action := index.action(slug)) == 'skip':
+                page.done()
+                continue
+
+            i = index.identify(slug, i)
+            refresh = action == 'refresh'
+
+            await self.pipeline.movies.put((page, link, i, slug, refresh))
+
+    async def replay(self) -> None:
+        """
+        Повторно обрабатывает запросы, отложенные в предыдущем сборе данных.
+        Фильмы и постеры отложенных запросов относятся к отдельной странице,
+        которая не учитывается в прогрессе и контрольных точках;
+
+        :return: None.
+        """
+
+        page = Page(0, 0)
+
+        for letter in self.file.dead.take():
+            if letter['kind'] == 'page':
+                films = await self.links(letter['page']) or []
+
+                page.remain += len(films)
+                await self.queue(page, films)
+            elif letter['kind'] == 'movie':
+                film = letter['id'], letter['slug'], letter['link']
+
+                page.remain += 1
+                await self.queue(page, [film])
+            elif letter['kind'] == 'poster':
+                page.remain += 1
+                await self.pipeline.posters.put((page,
+                                                 letter['link'],
+                                                 letter['id'],
+                                                 None))
+
+        page.listed = True
+        await self.pipeline.pages.put(page)
+
+    async def fetch(self) -> None:
+        """
+        Этап получения данных фильмов. Данные фильма без постера
+        записываются сразу после парсинга, иначе передаются вместе
+        со ссылкой на постер на этап получения постеров. Для фильмов,
+        собранных ранее, записывается только обновленный рейтинг. Фильм,
+        данные которого получить не удалось, не отмечается в индексе,
+        а фильм, обработка которого завершилась ошибкой, откладывается;
+
+        :return: None.
+        """
+
+        while item := await self.pipeline.movies.get():
+            page, link, i, slug, refresh = item
+
+            try:
+                await self.film(page, link, i, slug, refresh)
+            except Exception as error:
+                self.file.dead.add('movie',
+                                   link,
+                                   {'code': None},
+                                   id=i,
+                                   slug=slug,
+                                   error=repr(error))
+
+                page.done()
+                await self.pipeline.pages.put(page)
+
+    async def film(self,
+                   page: Page,
+                   link: str,
+                   i: int,
+                   slug: str,
+                   refresh: bool) -> None:
+        """
+        Получает и парсит данные фильма, затем записывает их или передает
+        на этап получения постеров;
+
+        :param page: страница с данными;
+        :param link: ссылка на страницу фильма;
+        :param i: id фильма;
+        :param slug: адрес фильма;
+        :param refresh: флаг обновления рейтинга;
+        :return: None.
+        """
+
+        movie = await self.movie(link, i, slug)
+
+        if movie is None:
+            page.done()
+            await self.pipeline.pages.put(page)
+            return None
+
+        if refresh:
+            today = datetime.date.today().isoformat()
+            records = {'ratings': [[i, today, movie.rating]]}
+        else:
+            records = self.records([movie])
+
+        if movie.link and not refresh:
+            await self.pipeline.posters.put((page,
+                                             movie.link,
+                                             movie.id,
+                                             (slug, link, records)))
+        else:
+            await self.commit(slug, i, records)
 
-            movies = await self.movies(links, ids)
+            page.done()
+            await self.pipeline.pages.put(page)
 
+    async def download(self) -> None:
+        """
+        Этап получения постеров. Постеры записываются на диск по мере
+        получения, не удерживаясь в памяти. Постеры, сохраненные ранее,
+        повторно не запрашиваются. Данные фильма записываются после его
+        постера. Если обработка постера завершилась ошибкой, данные фильма
+        не записываются, а фильм откладывается целиком;
+
+        :return: None.
+        """
+
+        while item := await self.pipeline.posters.get():
+            page, link, i, film = item
+
+            try:
+                if not self.file.posters.has(i):
+                    await self.poster(link, i)
+
+                if film:
+                    await self.commit(film[0], i, film[2])
+            except Exception as error:
+                if film:
+                    self.file.dead.add('movie',
+                                       film[1],
+                                       {'code': None},
+                                       id=i,
+                                       slug=film[0],
+                                       error=repr(error))
+                else:
+                    self.file.dead.add('poster',
+                                       link,
+                                       {'code': None},
+                                       id=i,
+                                       error=repr(error))
+
+            page.done()
+            await self.pipeline.pages.put(page)
+
+    async def commit(self, slug: str, i: int, records: dict) -> None:
+        """
+        Записывает данные фильма и отмечает его собранным в индексе.
+        Отметка и данные попадают на диск одной записью буферов, поэтому
+        фильм считается собранным только вместе со всеми своими данными;
+
+        :param slug: адрес фильма;
+        :param i: id фильма;
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        self.file.index.mark(slug, i)
+
+        await self.file.write(records)
+
+    async def store(self) -> None:
+        """
+        Этап сохранения контрольных точек. Отмечает завершенные страницы
+        в порядке их следования и сохраняет контрольную точку после каждой
+        группы из batch страниц;
+
+        :return: None.
+        """
+
+        while await self.pipeline.pages.get():
+            for page in self.pipeline.completed():
+                await self.progress.next()
+
+                if not page.number % self.pipeline.batch:
+                    await self.save()
+
+    @staticmethod
+    def records(movies: list[Movie], data: dict | None = None) -> dict:
+        """
+        Формирует данные фильмов для записи, распределяя строки фильмов
+        по таблицам. Если переданы накопленные данные, строки дописываются
+        в них без промежуточных списков;
+
+        :param movies: данные фильмов;
+        :param data: накопленные данные;
+        :return: записываемые данные.
+        """
+
+        if data is None:
             data = {
                 'movies': [],
                 'posters': [],
@@ -91,61 +386,33 @@ class Parser(object):
                 'countries': []
             }
 
-            for move in movies:
-                csv = move.csv()
-
-                data['movies'].append(csv['movies'])
-                data['posters'].append(csv['posters'])
-                data['actors'] += csv['actors']
-                data['crew'] += csv['crew']
-                data['releases'] += csv['releases']
-                data['genres'] += csv['genres']
-                data['themes'] += csv['themes']
-                data['languages'] += csv['languages']
-                data['studios'] += csv['studios']
-                data['countries'] += csv['countries']
-
-            await self.file.write(data)
-
-            images = {movie.id: movie.poster
-                      for movie in movies
-                      if movie.poster}
-            await self.file.images(images)
-
-            await self.progress.next()
-
-            await self.save()
-
-        self.file.delete()
-
-        await self.transfer()
-        await self.output.state()
+        for movie in movies:
+            for name, row in movie.rows():
+                data[name].append(row)
 
-        self.output.stopped = True
-        self.stopped = True
+        return data
 
-    async def links(self, page: int) -> list[str]:
+    async def links(self, page: int) -> list[tuple] | None:
         """
-        Получает ссылки на страницы с данными;
+        Получает id, адреса и ссылки на страницы с данными. Если попытки
+        исчерпаны, запрос откладывается;
 
         :param page: номер страницы;
-        :return: ссылки на страницы с данными.
+        :return: id, адреса и ссылки на страницы с данными.
         """
 
         link = self.network.url
         link += f'/films/ajax/by/popular/size/large/page/{page}'
 
-        code, links = None, []
-
-        while code != 200:
-            response = await self.network.get(link, params={})
-            code = response['code']
+        response = await self.network.retry.run(
+            lambda: self.network.html(link, params={})
+        )
 
-            if code == 200:
-                text = response['text']
-                links = await self.parsing.movies(self.network.url, text)
+        if response['code'] != 200:
+            self.file.dead.add('page', link, response, page=page)
+            return None
 
-        return links
+        return await self.parsing.movies(self.network.url, response['text'])
 
     async def page(self) -> None | int:
         """
@@ -154,111 +421,138 @@ class Parser(object):
         :return: номер последней страницы.
         """
 
-        code, number, attempts = None, None, 0
         link = f'{self.network.url}/films/ajax/by/release-earliest/size/large'
 
-        while code != 200 and attempts < VALID_ATTEMPTS:
-            response = await self.network.get(link, {})
-            code, attempts = response['code'], attempts + 1
+        response = await self.network.retry.run(
+            lambda: self.network.html(link, {})
+        )
 
-            if code == 200:
-                text = response['text']
-                number = await self.parsing.page(text)
+        if response['code'] != 200:
+            return None
 
-        return number
+        return await self.parsing.page(response['text'])
 
-    async def movie(self, link: str, i: int) -> Movie:
+    async def movie(self, link: str, i: int, slug: str) -> Movie | None:
         """
-        Получает данные о видеоигре по указанной ссылке;
+        Получает данные о фильме по указанной ссылке. Полученная страница
+        дописывается в архив. Если попытки исчерпаны, запрос откладывается;
 
-        :param i: id фильма;
         :param link: ссылка на страницу с данными;
+        :param i: id фильма;
+        :param slug: адрес фильма;
         :return: данные фильма.
         """
 
-        code, attempts = None, 0
-        movie = Movie(i)
-
-        while code != 200:
-            if attempts > VALID_ATTEMPTS and code != 429:
-                return movie
-
-            response = await self.network.get(link)
-            code = response['code']
-
-            attempts += 1
-
-            if code == 200:
-                text = response['text']
-                await self.parsing.parse(movie, text)
-
-                if movie.link:
-                    code, attempts = None, 0
-
-                    while code != 200:
-                        if attempts > VALID_ATTEMPTS and code != 429:
-                            movie.poster = None
-                            return movie
+        response = await self.network.retry.run(
+            lambda: self.network.html(link)
+        )
 
-                        response = await self.network.get(movie.link)
-                        code = response['code']
+        if response['code'] != 200:
+            self.file.dead.add('movie', link, response, id=i, slug=slug)
+            return None
 
-                        attempts += 1
+        movie = Movie(i)
+        text = response['text']
 
-                        if code == 200:
-                            movie.poster = response['binary']
+        await self.file.archive.write(i, link, text)
+        await self.parsing.parse(movie, text)
 
         return movie
 
-    async def movies(self, links: list[str], ids: list[int]) -> tuple[Movie]:
+    async def poster(self, link: str, i: int) -> None:
         """
-        Получает данные о видеоиграх по указанным ссылкам;
+        Получает постер фильма по указанной ссылке и сохраняет его
+        в хранилище постеров. Если попытки исчерпаны, запрос откладывается;
 
-        :param ids: идентификаторы фильмов;
-        :param links: ссылки на страницы с данными;
-        :return: данные видеоигр.
+        :param link: ссылка на постер;
+        :param i: id фильма;
+        :return: None.
         """
 
-        tasks = []
-        for link, num in zip(links, ids):
-            tasks.append(asyncio.create_task(self.movie(link, num)))
+        path = self.file.posters.stage(i)
+
+        response = await self.network.retry.run(
+            lambda: self.network.stream(link, path, images=True)
+        )
 
-        movies = await asyncio.gather(*tasks)
+        if response['code'] != 200:
+            self.file.dead.add('poster', link, response, id=i)
+            return None
 
-        return movies
+        await self.file.adopt(i, path, response['digest'], response['size'])
 
     async def disconnect(self) -> None:
         """
-        Закрывает сессию;
+        Закрывает сессию, кэш и пул процессов для парсинга;
 
         :return: None.
         """
 
         await self.network.session.close()
+        self.network.cache.close()
+
+        self.parsing.close()
 
     async def setting(self,
-                      span: tuple[int, int],
-                      factor: int,
+                      rates: tuple[float, float],
+                      factor: float,
                       threshold: int,
+                      rate: float,
+                      images: float,
+                      cache: str,
+                      capacity: int,
                       directory: str,
                       mode: str,
+                      format: str,
+                      refresh: int,
+                      archive: bool,
                       timeout: int,
+                      requests: int,
+                      downloads: int,
+                      queue: int,
+                      batch: int,
+                      workers: int,
+                      backend: str,
                       checkpoint: str):
         """
         Настраивает менеджеры;
 
-        :param span: диапазон задержки;
-        :param factor: масштаб задержки;
-        :param threshold: порог смены типа задержки;
+        :param rates: диапазон частоты запросов (зап./сек.);
+        :param factor: коэффициент уменьшения частоты;
+        :param threshold: количество успешных запросов для увеличения частоты;
+        :param rate: начальная частота запросов (зап./сек.);
+        :param images: начальная частота запросов постеров (зап./сек.);
+        :param cache: режим работы кэша ('off', 'on', 'only');
+        :param capacity: максимальный объем кэша (в байтах);
         :param directory: имя директории с данными;
         :param mode: режим работы с файлом;
+        :param format: формат записи данных (csv, parquet, arrow, sqlite);
+        :param refresh: интервал обновления рейтинга (в днях);
+        :param archive: флаг ведения архива страниц фильмов;
         :param timeout: задержка между выводами текущего состояния;
+        :param requests: количество одновременно обрабатываемых фильмов;
+        :param downloads: количество одновременно получаемых постеров;
+        :param queue: размер очередей между этапами сбора данных;
+        :param batch: количество страниц между контрольными точками;
+        :param workers: количество процессов для парсинга;
+        :param backend: имя парсера страниц фильмов;
         :param checkpoint: имя файла контрольной точки в формате json;
         :return: None.
         """
 
-        self.network.setting(span, factor, threshold)
-        self.file.setting(directory, mode, checkpoint)
+        self.network.setting(rates,
+                             factor,
+                             threshold,
+                             rate,
+                             images,
+                             cache,
+                             capacity)
+        self.file.setting(directory,
+                          mode,
+                          checkpoint,
+                          format,
+                          refresh,
+                          archive)
 
         last = await self.page()
 
@@ -266,6 +560,10 @@ class Parser(object):
 
         self.output.setting(timeout)
 
+        self.pipeline.setting(requests, downloads, queue, batch)
+
+        self.parsing.setting(workers, backend)
+
         await self.transfer()
 
     async def save(self) -> None:
@@ -279,6 +577,8 @@ class Parser(object):
         settings |= self.progress.json()
         settings |= self.network.json()
         settings |= self.output.json()
+        settings |= self.pipeline.json()
+        settings |= self.parsing.json()
 
         await self.file.save(settings)
 
@@ -295,13 +595,26 @@ class Parser(object):
         self.file.setting(
             directory=settings['directory'],
             mode='a',
-            checkpoint=checkpoint
+            checkpoint=checkpoint,
+            format=settings.get('format', SETTINGS['format']),
+            refresh=settings.get('refresh', SETTINGS['refresh']),
+            archive=settings.get('archive', SETTINGS['archive']),
+            state=settings.get('state')
         )
 
+        # Контрольные точки прежних версий содержат диапазон задержки
+        # (span) вместо диапазона частоты запросов, поэтому параметры
+        # подстройки частоты берутся из настроек.
+        control = settings if 'rates' in settings else SETTINGS
+
         self.network.setting(
-            span=settings['span'],
-            factor=settings['factor'],
-            threshold=settings['threshold']
+            rates=control['rates'],
+            factor=control['factor'],
+            threshold=control['threshold'],
+            rate=settings.get('rate', SETTINGS['rate']),
+            images=settings.get('images', SETTINGS['images']),
+            cache=settings.get('cache', SETTINGS['cache']),
+            capacity=settings.get('capacity', SETTINGS['capacity'])
         )
 
         last = await self.page()
@@ -314,6 +627,18 @@ class Parser(object):
             timeout=settings['timeout']
         )
 
+        self.pipeline.setting(
+            requests=settings.get('requests', SETTINGS['requests']),
+            downloads=settings.get('downloads', SETTINGS['downloads']),
+            queue=settings.get('queue', SETTINGS['queue']),
+            batch=settings.get('batch', SETTINGS['batch'])
+        )
+
+        self.parsing.setting(
+            workers=settings.get('workers', SETTINGS['workers']),
+            backend=settings.get('backend', SETTINGS['backend'])
+        )
+
         await self.transfer()
 
     async def state(self) -> None:
@@ -335,15 +660,18 @@ class Parser(object):
         while not self.stopped:
             await self.output.file(
                 directory=self.file.directory,
+                format=self.file.format,
                 size=self.file.size,
                 records=self.file.records,
-                image=self.file.image
+                image=self.file.image,
+                dead=self.file.dead.count
             )
 
             await self.output.network(
                 statuses=self.network.statuses,
                 traffic=self.network.traffic,
-                span=self.network.delay.span,
+                rate=self.network.delay.rate,
+                pool=self.network.pool
             )
 
             await self.output.parsing(
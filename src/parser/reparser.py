@@ -0,0 +1,195 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from config.parser.managers.archive import CHUNK
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.parsing import PARSING_FIELDS
+from config.paths import FILE_RAW_PATH
+from parser.managers.archive import ArchiveManager
+from parser.managers.archive import parse
+from parser.managers.network.cache import place
+from parser.managers.parsing import ParsingManager
+from parser.movie import Movie
+from parser.parser import Parser
+from parser.writers import WRITERS
+
+
+def extract(path: str,
+            entries: list[tuple],
+            backend: str) -> tuple[dict, dict, dict]:
+    """
+    Осуществляет парсинг записей сегмента архива в процессе из пула
+    процессов. Для первой записи фильма формируются все его данные,
+    для последующих - только рейтинг на дату записи;
+
+    :param path: путь к сегменту архива;
+    :param entries: id фильма, дата, смещение, размер записи и флаг
+    первой записи фильма;
+    :param backend: имя парсера страниц фильмов;
+    :return: записываемые данные, количество успешно и неуспешно
+    спарсенных данных.
+    """
+
+    manager = ParsingManager(backend)
+    records = {name: [] for name in FIELD_NAMES}
+
+    with open(path, 'rb') as file:
+        for i, date, offset, length, first in entries:
+            file.seek(offset)
+            _, text = parse(file.read(length))
+
+            movie = Movie(i)
+            manager.fill(movie, text)
+
+            if first:
+                Parser.records([movie], records)
+            else:
+                records['ratings'].append([i, date, movie.rating])
+
+    return records, manager.success, manager.failed
+
+
+class Reparser(object):
+    """
+    Повторный парсинг архива страниц фильмов без обращения к сети. Записи
+    архива разбиваются на части по CHUNK записей, которые обрабатываются
+    в пуле процессов, а данные записываются в новый каталог в порядке
+    записей архива;
+
+    :var source: имя директории с архивом;
+    :var directory: имя директории для записи данных;
+    :var format: формат записи данных (csv, parquet, arrow, sqlite);
+    :var workers: количество процессов для парсинга;
+    :var backend: имя парсера страниц фильмов;
+    :var archive: менеджер архива страниц фильмов;
+    :var parsing: менеджер парсинга;
+    :var records: количество записанных данных.
+    """
+
+    def __init__(self):
+        self.source: str | None = None
+        self.directory: str | None = None
+        self.format: str = 'csv'
+        self.workers: int = 0
+        self.backend: str = 'soup'
+        self.archive: ArchiveManager = ArchiveManager()
+        self.parsing: ParsingManager = ParsingManager()
+        self.records: dict = {name: 0 for name in FIELD_NAMES}
+
+    def chunks(self) -> list[tuple]:
+        """
+        Разбивает записи архива на части, каждая из которых относится
+        к одному сегменту;
+
+        :return: путь к сегменту и записи части.
+        """
+
+        chunks, seen = [], set()
+        entries, current = [], None
+
+        for i, date, segment, offset, length in self.archive.records():
+            if entries and (segment != current or len(entries) >= CHUNK):
+                chunks.append((self.archive.locate(current), entries))
+                entries = []
+
+            entries.append((i, date, offset, length, i not in seen))
+
+            seen.add(i)
+            current = segment
+
+        if entries:
+            chunks.append((self.archive.locate(current), entries))
+
+        return chunks
+
+    def run(self) -> int:
+        """
+        Осуществляет повторный парсинг архива и записывает данные. Постеры
+        связываются с постерами исходного каталога после открытия файлов
+        с данными, так как в режиме 'w' их содержимое удаляется;
+
+        :return: количество обработанных страниц.
+        """
+
+        source = fr'{FILE_RAW_PATH}\{self.source}'
+        path = fr'{FILE_RAW_PATH}\{self.directory}'
+
+        os.makedirs(fr'{path}\posters', exist_ok=True)
+
+        writer = WRITERS[self.format]()
+        writer.open(path, 'w')
+
+        with os.scandir(fr'{source}\posters') as entries:
+            for entry in entries:
+                place(entry.path, fr'{path}\posters\{entry.name}')
+
+        self.archive.open(source, 'r')
+        chunks = self.chunks()
+
+        pages, total = 0, sum(len(entries) for _, entries in chunks)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(extract,
+                                       [segment for segment, _ in chunks],
+                                       [entries for _, entries in chunks],
+                                       [self.backend] * len(chunks))
+
+                for records, success, failed in results:
+                    writer.write(records)
+
+                    if writer.full():
+                        writer.dump(writer.take())
+
+                    for name in FIELD_NAMES:
+                        self.records[name] += len(records[name])
+
+                    self.parsing.merge(success, failed)
+
+                    pages += sum(len(records[name])
+                                 for name in ('movies', 'ratings'))
+                    print(f'\rОбработано страниц: {pages} из {total}.',
+                          end='',
+                          flush=True)
+        finally:
+            writer.close()
+            self.archive.close()
+
+        print(flush=True)
+
+        return pages
+
+    def failures(self) -> dict:
+        """
+        Возвращает количество неуспешно спарсенных данных по полям;
+
+        :return: количество неуспешно спарсенных данных.
+        """
+
+        return {field: self.parsing.failed[field]
+                for field in PARSING_FIELDS
+                if self.parsing.failed[field]}
+
+    def setting(self,
+                source: str,
+                directory: str,
+                format: str,
+                workers: int,
+                backend: str) -> None:
+        """
+        Настраивает повторный парсинг;
+
+        :param source: имя директории с архивом;
+        :param directory: имя директории для записи данных;
+        :param format: формат записи данных (csv, parquet, arrow, sqlite);
+        :param workers: количество процессов для парсинга;
+        :param backend: имя парсера страниц фильмов;
+        :return: None.
+        """
+
+        self.source = source
+        self.directory = directory
+        self.format = format
+        self.workers = workers or os.cpu_count()
+        self.backend = backend
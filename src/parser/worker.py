@@ -0,0 +1,142 @@
+import asyncio
+import os
+
+from config.parser.managers.work import HEARTBEAT
+from config.parser.managers.work import SHARDS
+from config.paths import FILE_RAW_PATH
+from parser.managers.work import WorkManager
+from parser.parser import Parser
+
+
+class Worker(object):
+    """
+    Процесс распределенного сбора данных. Получает задачи из общей очереди,
+    собирает данные страниц задачи в собственный каталог (шард) с долей
+    общей частоты запросов и продлевает аренду задачи во время сбора.
+    Если аренду продлить не удалось (задача передана другому процессу),
+    сбор данных задачи прекращается. При повторном запуске процесса
+    с тем же именем сбор данных в шард продолжается. Фильмы без id
+    в списке получают id из диапазона, выделенного процессу;
+
+    :var name: имя процесса;
+    :var parser: программа сбора данных;
+    :var work: менеджер очереди задач;
+    :var completed: количество выполненных задач;
+    :var abandoned: количество прекращенных задач.
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.parser: Parser = Parser()
+        self.work: WorkManager = WorkManager()
+        self.completed: int = 0
+        self.abandoned: int = 0
+
+    async def run(self, directory: str) -> int:
+        """
+        Выполняет задачи из очереди, пока они не закончатся;
+
+        :param directory: имя директории с данными;
+        :return: количество выполненных задач.
+        """
+
+        path = fr'{FILE_RAW_PATH}\{directory}'
+        shard = fr'{directory}\{SHARDS}\{self.name}'
+
+        self.work.open(path)
+
+        settings = self.work.settings()
+        shares = settings.pop('shares')
+
+        settings |= {
+            'rates': [value / shares for value in settings['rates']],
+            'rate': settings['rate'] / shares,
+            'images': settings['images'] / shares,
+            'workers': settings['workers'] // shares,
+            'directory': shard,
+            'mode': 'a' if os.path.exists(fr'{path}\{SHARDS}\{self.name}')
+            else 'w',
+            'checkpoint': f'{directory}-{self.name}.json'
+        }
+
+        os.makedirs(fr'{path}\{SHARDS}', exist_ok=True)
+
+        try:
+            if await self.parser.connect() == 200:
+                await self.parser.setting(**settings)
+
+                block = self.work.reserve(self.name)
+                self.parser.file.index.reserve(block)
+
+                await self.loop()
+
+                await self.parser.file.close()
+                self.parser.file.delete()
+        finally:
+            await self.parser.disconnect()
+            self.work.close()
+
+        return self.completed
+
+    async def loop(self) -> None:
+        """
+        Получает задачи из очереди и собирает данные их страниц. Задача
+        отмечается выполненной после записи ее данных на диск. Сбор данных
+        задачи, аренда которой утрачена, прекращается без отметки
+        о выполнении, а уже записанные данные пропускаются при объединении
+        шардов;
+
+        :return: None.
+        """
+
+        while task := self.work.claim(self.name):
+            crawl = asyncio.create_task(self.parser.crawl(*task))
+            heartbeat = asyncio.create_task(self.heartbeat(task))
+
+            try:
+                await asyncio.wait((crawl, heartbeat),
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                heartbeat.cancel()
+
+                if not crawl.done():
+                    crawl.cancel()
+                    await asyncio.gather(crawl, return_exceptions=True)
+
+            if crawl.cancelled():
+                heartbeat.result()
+
+                await self.parser.file.flush(sync=True)
+                self.parser.file.index.forget()
+
+                self.abandoned += 1
+                continue
+
+            crawl.result()
+            await self.parser.file.flush(sync=True)
+
+            self.work.complete(task)
+            self.completed += 1
+
+    async def heartbeat(self, task: tuple[int, int]) -> None:
+        """
+        Периодически продлевает аренду задачи, пока она не будет утрачена;
+
+        :param task: номера первой и последней страниц задачи;
+        :return: None.
+        """
+
+        while self.work.heartbeat(self.name, task):
+            await asyncio.sleep(HEARTBEAT)
+
+
+def work(directory: str, name: str) -> int:
+    """
+    Запускает процесс распределенного сбора данных;
+
+    :param directory: имя директории с данными;
+    :param name: имя процесса;
+    :return: количество выполненных задач.
+    """
+
+    return asyncio.run(Worker(name).run(directory))
@@ -0,0 +1,12 @@
+from parser.writers.columnar import ArrowWriter
+from parser.writers.columnar import ParquetWriter
+from parser.writers.csv import CsvWriter
+from parser.writers.sqlite import SqliteWriter
+
+
+WRITERS = {
+    'csv': CsvWriter,
+    'parquet': ParquetWriter,
+    'arrow': ArrowWriter,
+    'sqlite': SqliteWriter
+}
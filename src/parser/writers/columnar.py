@@ -0,0 +1,382 @@
+import abc
+import datetime
+import os
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet
+
+from config.parser.managers.file import COMPRESSION
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.file import GROUP
+from config.parser.managers.file import TABLES
+from parser.writers.writer import Writer
+
+
+def dtype(alias: str) -> pa.DataType:
+    """
+    Возвращает тип данных arrow по его псевдониму. Категориальные поля
+    хранятся в виде словаря, даты - в виде количества дней;
+
+    :param alias: псевдоним типа данных;
+    :return: тип данных arrow.
+    """
+
+    if alias == 'category':
+        return pa.dictionary(pa.int32(), pa.string())
+    if alias == 'date':
+        return pa.date32()
+
+    return pa.type_for_alias(alias)
+
+
+def array(values: tuple, type_: pa.DataType) -> pa.Array:
+    """
+    Формирует столбец из значений строк. Даты релизов приводятся
+    из формата ГГГГ-ММ-ДД;
+
+    :param values: значения столбца;
+    :param type_: тип данных arrow;
+    :return: столбец.
+    """
+
+    if pa.types.is_date(type_):
+        values = [datetime.date.fromisoformat(value) if value else None
+                  for value in values]
+
+    return pa.array(values, type=type_)
+
+
+SCHEMAS = {
+    name: pa.schema([(field, dtype(alias))
+                     for field, alias in FIELD_TYPES[name].items()])
+    for name in FIELD_NAMES
+}
+
+
+class ColumnarWriter(Writer):
+    """
+    Буферизованная запись данных в колоночном формате. Каждая таблица
+    хранится в отдельном каталоге каталога TABLES (отдельно от постеров
+    фильмов, в том числе для таблицы posters), строки накапливаются
+    в памяти, а каждая запись буферов на диск образует новую часть
+    таблицы. Часть сначала записывается во временный файл и затем
+    переименовывается, поэтому на диске находятся только целые части;
+
+    :var extension: расширение файлов частей;
+    :var path: путь к каталогу с данными;
+    :var buffers: буферы строк;
+    :var buffered: количество строк в буферах;
+    :var parts: номера следующих частей таблиц;
+    :var size: размер таблиц с учетом записанных на диск данных.
+    """
+
+    extension: str = ''
+
+    def __init__(self):
+        super().__init__()
+        self.path: str | None = None
+        self.buffers: dict = {name: [] for name in FIELD_NAMES}
+        self.buffered: int = 0
+        self.parts: dict = {name: 0 for name in FIELD_NAMES}
+        self.size: dict = {name: 0 for name in FIELD_NAMES}
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает каталоги таблиц. В режиме 'w' имеющиеся части удаляются,
+        в режиме 'a' нумерация частей продолжается. Незавершенные временные
+        файлы удаляются;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        self.path = path
+
+        for name in FIELD_NAMES:
+            directory = self.directory(path, name)
+            os.makedirs(directory, exist_ok=True)
+
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.tmp') or mode == 'w':
+                        os.remove(entry.path)
+
+            parts = self.files(path, name)
+
+            self.parts[name] = (int(parts[-1].split('part-')[-1][:5]) + 1
+                                if parts
+                                else 0)
+            self.size[name] = sum(os.stat(part).st_size for part in parts)
+
+    @staticmethod
+    def directory(path: str, name: str) -> str:
+        """
+        Возвращает путь к каталогу частей таблицы;
+
+        :param path: путь к каталогу с данными;
+        :param name: имя таблицы;
+        :return: путь к каталогу частей таблицы.
+        """
+
+        return fr'{path}\{TABLES}\{name}'
+
+    def files(self, path: str, name: str) -> list[str]:
+        """
+        Возвращает пути к частям таблицы в порядке их записи;
+
+        :param path: путь к каталогу с данными;
+        :param name: имя таблицы;
+        :return: пути к частям таблицы.
+        """
+
+        directory = self.directory(path, name)
+
+        return [fr'{directory}\{file}'
+                for file in sorted(os.listdir(directory))
+                if file.startswith('part-') and
+                file.endswith(self.extension)]
+
+    def write(self, records: dict) -> None:
+        """
+        Записывает строки в буферы;
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        for name in FIELD_NAMES:
+            if rows := records.get(name):
+                self.buffers[name] += rows
+                self.buffered += len(rows)
+
+    def full(self) -> bool:
+        """
+        Проверяет, достигнут ли порог количества строк в буферах. Иначе
+        части записываются только при сохранении контрольной точки;
+
+        :return: флаг необходимости записи буферов на диск.
+        """
+
+        return self.buffered >= GROUP
+
+    def take(self) -> dict[str, list]:
+        """
+        Извлекает строки из буферов и очищает их;
+
+        :return: строки таблиц.
+        """
+
+        chunks = {name: rows for name, rows in self.buffers.items() if rows}
+
+        self.buffers = {name: [] for name in FIELD_NAMES}
+        self.buffered = 0
+
+        return chunks
+
+    def dump(self, chunks: dict[str, list], sync: bool = False) -> None:
+        """
+        Преобразует строки в таблицы и записывает их в новые части.
+        Может выполняться в отдельном потоке;
+
+        :param chunks: строки таблиц;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
+
+        for name, rows in chunks.items():
+            schema = SCHEMAS[name]
+            columns = [array(values, field.type)
+                       for values, field in zip(zip(*rows, strict=True),
+                                                schema,
+                                                strict=True)]
+            table = pa.Table.from_arrays(columns, schema=schema)
+
+            path = self.directory(self.path, name)
+            path += fr'\part-{self.parts[name]:05}{self.extension}'
+
+            with open(path + '.tmp', 'wb') as file:
+                self.save(table, file)
+                file.flush()
+
+                if sync:
+                    os.fsync(file.fileno())
+
+            os.replace(path + '.tmp', path)
+
+            self.parts[name] += 1
+            self.size[name] += os.stat(path).st_size
+
+    @abc.abstractmethod
+    def save(self, table: pa.Table, file) -> None:
+        """
+        Записывает таблицу в файл части;
+
+        :param table: таблица;
+        :param file: файл части;
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def rows(self, path: str) -> int:
+        """
+        Возвращает количество записей части по ее метаданным;
+
+        :param path: путь к файлу части;
+        :return: количество записей.
+        """
+
+    def position(self) -> dict:
+        """
+        Возвращает номера следующих частей таблиц;
+
+        :return: номера частей.
+        """
+
+        return dict(self.parts)
+
+    def rollback(self, position: dict) -> None:
+        """
+        Удаляет части таблиц с номерами не меньше указанных;
+
+        :param position: номера частей;
+        :return: None.
+        """
+
+        for name, number in position.items():
+            for part in self.files(self.path, name):
+                if int(part.split('part-')[-1][:5]) >= number:
+                    self.size[name] -= os.stat(part).st_size
+                    os.remove(part)
+
+            self.parts[name] = min(self.parts[name], number)
+
+    def stat(self) -> dict:
+        """
+        Возвращает размер частей и время изменения каталогов таблиц
+        без перечисления частей;
+
+        :return: размер и время изменения (в наносекундах) таблиц.
+        """
+
+        stat = {}
+
+        for name in FIELD_NAMES:
+            mtime = os.stat(self.directory(self.path, name)).st_mtime_ns
+            stat[name] = {'size': self.size[name], 'mtime': mtime}
+
+        return stat
+
+    def probe(self, path: str) -> dict:
+        """
+        Возвращает суммарный размер частей и время изменения каталогов
+        таблиц, находящихся на диске;
+
+        :param path: путь к каталогу с данными;
+        :return: размер и время изменения (в наносекундах) таблиц.
+        """
+
+        probe = {}
+
+        for name in FIELD_NAMES:
+            size = sum(os.stat(part).st_size
+                       for part in self.files(path, name))
+            mtime = os.stat(self.directory(path, name)).st_mtime_ns
+
+            probe[name] = {'size': size, 'mtime': mtime}
+
+        return probe
+
+    def count(self, path: str, name: str) -> int:
+        """
+        Подсчитывает количество записей таблицы по метаданным частей
+        без чтения данных;
+
+        :param path: путь к каталогу с данными;
+        :param name: имя таблицы;
+        :return: количество записей.
+        """
+
+        return sum(self.rows(part) for part in self.files(path, name))
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся строки в новые части;
+
+        :return: None.
+        """
+
+        if self.path and self.buffered:
+            self.dump(self.take(), sync=True)
+
+
+class ParquetWriter(ColumnarWriter):
+    """
+    Запись данных в формате Parquet. Каждая часть содержит группы строк
+    не более GROUP записей, сжатые алгоритмом COMPRESSION.
+    """
+
+    extension = '.parquet'
+
+    def save(self, table: pa.Table, file) -> None:
+        """
+        Записывает таблицу в файл части формата Parquet;
+
+        :param table: таблица;
+        :param file: файл части;
+        :return: None.
+        """
+
+        pyarrow.parquet.write_table(table,
+                                    file,
+                                    row_group_size=GROUP,
+                                    compression=COMPRESSION)
+
+    def rows(self, path: str) -> int:
+        """
+        Возвращает количество записей части из метаданных Parquet;
+
+        :param path: путь к файлу части;
+        :return: количество записей.
+        """
+
+        return pyarrow.parquet.read_metadata(path).num_rows
+
+
+class ArrowWriter(ColumnarWriter):
+    """
+    Запись данных в формате Arrow IPC. Части не сжимаются, поэтому
+    они читаются отображением в память без копирования данных.
+    """
+
+    extension = '.arrow'
+
+    def save(self, table: pa.Table, file) -> None:
+        """
+        Записывает таблицу в файл части формата Arrow IPC;
+
+        :param table: таблица;
+        :param file: файл части;
+        :return: None.
+        """
+
+        with pyarrow.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table, max_chunksize=GROUP)
+
+    def rows(self, path: str) -> int:
+        """
+        Возвращает количество записей части из пакетов Arrow IPC;
+
+        :param path: путь к файлу части;
+        :return: количество записей.
+        """
+
+        with pa.memory_map(path) as source:
+            reader = pyarrow.ipc.open_file(source)
+
+            return sum(reader.get_batch(i).num_rows
+                       for i in range(reader.num_record_batches))
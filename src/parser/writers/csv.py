@@ -0,0 +1,247 @@
+import contextlib
+import csv
+import io
+import mmap
+import os
+import time
+
+from config.parser.managers.file import BUFFER
+from config.parser.managers.file import CHUNK
+from config.parser.managers.file import FIELD_NAMES
+from parser.writers.writer import Writer
+
+
+class CsvWriter(Writer):
+    """
+    Буферизованная запись данных в csv-файлы. Файлы остаются открытыми
+    в течение всего сбора данных, строки накапливаются в памяти
+    и записываются на диск при достижении порога размера или времени;
+
+    :var stack: стек открытых файлов, закрываемых вместе;
+    :var files: открытые файлы;
+    :var buffers: буферы строк;
+    :var writers: объекты записи строк в буферы;
+    :var size: размер файлов с учетом записанных на диск данных;
+    :var flushed: время последней записи буферов на диск.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.stack: contextlib.ExitStack = contextlib.ExitStack()
+        self.files: dict = {}
+        self.buffers: dict = {}
+        self.writers: dict = {}
+        self.size: dict = {name: 0 for name in FIELD_NAMES}
+        self.flushed: float = time.monotonic()
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает csv-файлы. В режиме 'w' файлы перезаписываются.
+        В пустые файлы записываются заголовки;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        for name in FIELD_NAMES:
+            # Файлы закрываются стеком в close()
+            file = self.stack.enter_context(
+                open(fr'{path}\{name}.csv', mode + 'b')  # noqa: SIM115
+            )
+            self.files[name] = file
+            self.size[name] = file.seek(0, os.SEEK_END)
+
+            self.reset(name)
+
+        if headers := {name: [fields]
+                       for name, fields in FIELD_NAMES.items()
+                       if not self.size[name]}:
+            self.write(headers)
+            self.dump(self.take())
+
+    def reset(self, name: str) -> None:
+        """
+        Создает пустой буфер строк csv-файла;
+
+        :param name: имя csv-файла;
+        :return: None.
+        """
+
+        self.buffers[name] = io.StringIO()
+        self.writers[name] = csv.writer(self.buffers[name], delimiter=',')
+
+    def write(self, records: dict) -> None:
+        """
+        Записывает строки в буферы;
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        for name in FIELD_NAMES:
+            if rows := records.get(name):
+                self.writers[name].writerows(rows)
+
+    def full(self) -> bool:
+        """
+        Проверяет, достигнут ли порог размера буферов или времени
+        с момента последней записи на диск;
+
+        :return: флаг необходимости записи буферов на диск.
+        """
+
+        size = sum(buffer.tell() for buffer in self.buffers.values())
+        interval = time.monotonic() - self.flushed
+
+        return size >= BUFFER['size'] or interval >= BUFFER['interval']
+
+    def take(self) -> dict[str, bytes]:
+        """
+        Извлекает содержимое буферов и очищает их;
+
+        :return: содержимое буферов в кодировке utf-8.
+        """
+
+        chunks = {}
+
+        for name, buffer in self.buffers.items():
+            if buffer.tell():
+                chunks[name] = buffer.getvalue().encode('utf-8')
+                self.reset(name)
+
+        self.flushed = time.monotonic()
+
+        return chunks
+
+    def dump(self, chunks: dict[str, bytes], sync: bool = False) -> None:
+        """
+        Записывает содержимое буферов в файлы. Может выполняться
+        в отдельном потоке;
+
+        :param chunks: содержимое буферов;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
+
+        for name, chunk in chunks.items():
+            self.files[name].write(chunk)
+            self.size[name] += len(chunk)
+
+        for file in self.files.values():
+            file.flush()
+
+            if sync:
+                os.fsync(file.fileno())
+
+    def position(self) -> dict:
+        """
+        Возвращает размер csv-файлов;
+
+        :return: размер файлов.
+        """
+
+        return dict(self.size)
+
+    def rollback(self, position: dict) -> None:
+        """
+        Обрезает csv-файлы до указанного размера;
+
+        :param position: размер файлов;
+        :return: None.
+        """
+
+        for name, size in position.items():
+            if size < self.size[name]:
+                self.files[name].truncate(size)
+                self.size[name] = size
+
+    def stat(self) -> dict:
+        """
+        Возвращает размер и время изменения открытых файлов;
+
+        :return: размер и время изменения (в наносекундах) файлов.
+        """
+
+        return {name: {'size': self.size[name],
+                       'mtime': os.fstat(file.fileno()).st_mtime_ns}
+                for name, file in self.files.items()}
+
+    def probe(self, path: str) -> dict:
+        """
+        Возвращает размер и время изменения csv-файлов, находящихся на диске;
+
+        :param path: путь к каталогу с данными;
+        :return: размер и время изменения (в наносекундах) файлов.
+        """
+
+        probe = {}
+
+        for name in FIELD_NAMES:
+            stat = os.stat(fr'{path}\{name}.csv')
+            probe[name] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+        return probe
+
+    def count(self, path: str, name: str) -> int:
+        """
+        Подсчитывает количество записей csv-файла (без заголовка);
+
+        :param path: путь к каталогу с данными;
+        :param name: имя csv-файла;
+        :return: количество записей.
+        """
+
+        return count(fr'{path}\{name}.csv')
+
+    def close(self) -> None:
+        """
+        Записывает буферы и закрывает файлы;
+
+        :return: None.
+        """
+
+        if self.files:
+            self.dump(self.take(), sync=True)
+
+        self.stack.close()
+        self.files = {}
+
+
+def count(path: str) -> int:
+    """
+    Подсчитывает количество записей csv-файла (без заголовка) по отображению
+    файла в память. Переводы строк внутри значений в кавычках
+    не учитываются;
+
+    :param path: путь к csv-файлу;
+    :return: количество записей.
+    """
+
+    records, quoted = 0, False
+
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+
+        if not size:
+            return 0
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for start in range(0, size, CHUNK):
+                chunk = data[start:start + CHUNK]
+
+                if not quoted and b'"' not in chunk:
+                    records += chunk.count(b'\n')
+                    continue
+
+                *lines, rest = chunk.split(b'\n')
+
+                for line in lines:
+                    quoted ^= line.count(b'"') % 2 == 1
+                    records += not quoted
+
+                quoted ^= rest.count(b'"') % 2 == 1
+
+    return max(records - 1, 0)
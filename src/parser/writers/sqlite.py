@@ -0,0 +1,407 @@
+import os
+import sqlite3
+
+from config.parser.managers.file import DATABASE
+from config.parser.managers.file import DIMENSIONS
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.file import GROUP
+from config.parser.managers.file import INDEXES
+from parser.writers.writer import Writer
+
+
+AFFINITIES = {
+    'int16': 'INTEGER',
+    'int32': 'INTEGER',
+    'float32': 'REAL',
+    'string': 'TEXT',
+    'category': 'TEXT',
+    'date': 'TEXT'
+}
+
+
+def table(name: str) -> str:
+    """
+    Формирует запрос создания таблицы. Значения полей, хранящихся
+    в справочниках, заменяются ссылками на них, а таблицы без индексов
+    (фильмы и постеры) имеют первичный ключ id;
+
+    :param name: имя таблицы;
+    :return: запрос создания таблицы.
+    """
+
+    dimensions = DIMENSIONS.get(name, {})
+    columns = []
+
+    for field, alias in FIELD_TYPES[name].items():
+        if field in dimensions:
+            columns.append(f'{field} INTEGER '
+                           f'REFERENCES {dimensions[field]} (id)')
+        elif field == 'id' and name not in INDEXES:
+            columns.append('id INTEGER PRIMARY KEY')
+        else:
+            columns.append(f'{field} {AFFINITIES[alias]}')
+
+    return f'CREATE TABLE IF NOT EXISTS {name} ({", ".join(columns)})'
+
+
+def select(name: str, rowid: bool = False) -> str:
+    """
+    Формирует запрос выборки строк таблицы, в котором ссылки
+    на справочники заменены значениями. Поля выборки совпадают с полями
+    csv-файла;
+
+    :param name: имя таблицы;
+    :param rowid: флаг выборки номера строки (порядка записи строк);
+    :return: запрос выборки.
+    """
+
+    dimensions = DIMENSIONS.get(name, {})
+    columns = [f'{name}.rowid AS rowid'] if rowid else []
+    joins = []
+
+    for field in FIELD_NAMES[name]:
+        if dimension := dimensions.get(field):
+            columns.append(f'{dimension}.name AS {field}')
+            joins.append(f'LEFT JOIN {dimension} '
+                         f'ON {dimension}.id = {name}.{field}')
+        else:
+            columns.append(f'{name}.{field}')
+
+    return f'SELECT {", ".join(columns)} FROM {name} {" ".join(joins)}'
+
+
+def view(name: str) -> str:
+    """
+    Формирует запрос создания представления таблицы, в котором ссылки
+    на справочники заменены значениями. Поля представления совпадают
+    с полями csv-файла;
+
+    :param name: имя таблицы;
+    :return: запрос создания представления.
+    """
+
+    return f'CREATE VIEW IF NOT EXISTS {name}_view AS {select(name)}'
+
+
+def schema() -> list[str]:
+    """
+    Формирует запросы создания справочников, таблиц, индексов
+    и представлений базы данных;
+
+    :return: запросы создания схемы базы данных.
+    """
+
+    statements = [f'CREATE TABLE IF NOT EXISTS {dimension} '
+                  f'(id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)'
+                  for dimension in sorted({dimension
+                                           for fields in DIMENSIONS.values()
+                                           for dimension in fields.values()})]
+
+    for name in FIELD_NAMES:
+        statements.append(table(name))
+
+        for columns in INDEXES.get(name, []):
+            statements.append(f'CREATE INDEX IF NOT EXISTS '
+                              f'{name}_{"_".join(columns)} '
+                              f'ON {name} ({", ".join(columns)})')
+
+        statements.append(view(name))
+
+    return statements
+
+
+class SqliteWriter(Writer):
+    """
+    Буферизованная запись данных в базу данных SQLite в режиме WAL. Имена
+    людей, студий, стран, жанров, тем и языков хранятся в справочниках,
+    а таблицы фильма ссылаются на них. Каждая запись буферов на диск
+    выполняется одной транзакцией, поэтому база данных доступна для чтения
+    в процессе сбора данных;
+
+    :var path: путь к каталогу с данными;
+    :var connection: соединение с базой данных;
+    :var names: идентификаторы значений справочников;
+    :var buffers: буферы строк;
+    :var buffered: количество строк в буферах;
+    :var size: размер записанных значений по таблицам.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.path: str | None = None
+        self.connection: sqlite3.Connection | None = None
+        self.names: dict[str, dict[str, int]] = {}
+        self.buffers: dict = {name: [] for name in FIELD_NAMES}
+        self.buffered: int = 0
+        self.size: dict = {name: 0 for name in FIELD_NAMES}
+
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает базу данных и создает недостающие таблицы. В режиме 'w'
+        база данных создается заново, в режиме 'a' загружаются справочники
+        и размер записанных значений;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+        self.close()
+
+        self.path = path
+        database = fr'{path}\{DATABASE}'
+
+        if mode == 'w':
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(database + suffix)
+                except FileNotFoundError:
+                    pass
+
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode = WAL')
+
+        with self.connection:
+            for statement in schema():
+                self.connection.execute(statement)
+
+        self.load()
+        self.measure()
+
+    def measure(self) -> None:
+        """
+        Вычисляет размер записанных значений по таблицам;
+
+        :return: None.
+        """
+
+        for name, fields in FIELD_NAMES.items():
+            length = ' + '.join(f'COALESCE(LENGTH({field}), 0)'
+                                for field in fields)
+            self.size[name] = self.connection.execute(
+                f'SELECT COALESCE(SUM({length}), 0) FROM {name}_view'
+            ).fetchone()[0]
+
+    def load(self) -> None:
+        """
+        Загружает идентификаторы значений справочников;
+
+        :return: None.
+        """
+
+        self.names = {}
+
+        for fields in DIMENSIONS.values():
+            for dimension in fields.values():
+                self.names[dimension] = dict(self.connection.execute(
+                    f'SELECT name, id FROM {dimension}'
+                ))
+
+    def intern(self, dimension: str, value: str | None) -> int | None:
+        """
+        Возвращает идентификатор значения справочника, добавляя значение
+        в справочник при его отсутствии;
+
+        :param dimension: имя справочника;
+        :param value: значение;
+        :return: идентификатор значения.
+        """
+
+        if value is None:
+            return None
+
+        names = self.names[dimension]
+
+        if (key := names.get(value)) is None:
+            key = self.connection.execute(
+                f'INSERT INTO {dimension} (name) VALUES (?)', (value, )
+            ).lastrowid
+            names[value] = key
+
+        return key
+
+    def write(self, records: dict) -> None:
+        """
+        Записывает строки в буферы;
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+        for name in FIELD_NAMES:
+            if rows := records.get(name):
+                self.buffers[name] += rows
+                self.buffered += len(rows)
+
+    def full(self) -> bool:
+        """
+        Проверяет, достигнут ли порог количества строк в буферах. Иначе
+        строки записываются только при сохранении контрольной точки;
+
+        :return: флаг необходимости записи буферов на диск.
+        """
+
+        return self.buffered >= GROUP
+
+    def take(self) -> dict[str, list]:
+        """
+        Извлекает строки из буферов и очищает их;
+
+        :return: строки таблиц.
+        """
+
+        chunks = {name: rows for name, rows in self.buffers.items() if rows}
+
+        self.buffers = {name: [] for name in FIELD_NAMES}
+        self.buffered = 0
+
+        return chunks
+
+    def dump(self, chunks: dict[str, list], sync: bool = False) -> None:
+        """
+        Записывает строки в базу данных одной транзакцией. Может
+        выполняться в отдельном потоке;
+
+        :param chunks: строки таблиц;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
+
+        synchronous = 'FULL' if sync else 'NORMAL'
+        self.connection.execute(f'PRAGMA synchronous = {synchronous}')
+
+        try:
+            with self.connection:
+                for name, rows in chunks.items():
+                    self.insert(name, rows)
+        except sqlite3.Error:
+            self.load()
+            raise
+
+    def insert(self, name: str, rows: list) -> None:
+        """
+        Записывает строки в таблицу, заменяя значения справочников
+        их идентификаторами. Строки таблиц с первичным ключом (фильмов
+        и постеров) с имеющимся id заменяются;
+
+        :param name: имя таблицы;
+        :param rows: строки таблицы;
+        :return: None.
+        """
+
+        fields = FIELD_NAMES[name]
+        dimensions = DIMENSIONS.get(name, {})
+
+        self.size[name] += sum(len(str(value))
+                               for row in rows
+                               for value in row
+                               if value is not None)
+
+        if dimensions:
+            positions = {fields.index(field): dimension
+                         for field, dimension in dimensions.items()}
+            rows = [[self.intern(positions[i], value)
+                     if i in positions
+                     else value
+                     for i, value in enumerate(row)]
+                    for row in rows]
+
+        statement = 'INSERT' if name in INDEXES else 'INSERT OR REPLACE'
+        self.connection.executemany(
+            f'{statement} INTO {name} ({", ".join(fields)}) '
+            f'VALUES ({", ".join("?" * len(fields))})',
+            rows
+        )
+
+    def position(self) -> dict:
+        """
+        Возвращает наибольшие идентификаторы строк (rowid) таблиц;
+
+        :return: идентификаторы строк.
+        """
+
+        return {name: self.connection.execute(
+                    f'SELECT COALESCE(MAX(rowid), 0) FROM {name}'
+                ).fetchone()[0]
+                for name in FIELD_NAMES}
+
+    def rollback(self, position: dict) -> None:
+        """
+        Удаляет строки с идентификаторами больше указанных одной
+        транзакцией;
+
+        :param position: идентификаторы строк;
+        :return: None.
+        """
+
+        with self.connection:
+            for name, rowid in position.items():
+                self.connection.execute(
+                    f'DELETE FROM {name} WHERE rowid > ?', (rowid, )
+                )
+
+        self.measure()
+
+    def stat(self) -> dict:
+        """
+        Возвращает размер и время изменения базы данных;
+
+        :return: размер и время изменения (в наносекундах) базы данных.
+        """
+
+        return self.probe(self.path)
+
+    def probe(self, path: str) -> dict:
+        """
+        Возвращает суммарный размер и время изменения файла базы данных
+        и журнала WAL, находящихся на диске. Значения общие для всех таблиц;
+
+        :param path: путь к каталогу с данными;
+        :return: размер и время изменения (в наносекундах) базы данных.
+        """
+
+        size, mtime = 0, 0
+
+        for suffix in ('', '-wal'):
+            try:
+                stat = os.stat(fr'{path}\{DATABASE}' + suffix)
+            except FileNotFoundError:
+                continue
+
+            size += stat.st_size
+            mtime = max(mtime, stat.st_mtime_ns)
+
+        return {name: {'size': size, 'mtime': mtime} for name in FIELD_NAMES}
+
+    def count(self, path: str, name: str) -> int:
+        """
+        Подсчитывает количество записей таблицы;
+
+        :param path: путь к каталогу с данными;
+        :param name: имя таблицы;
+        :return: количество записей.
+        """
+
+        connection = sqlite3.connect(fr'{path}\{DATABASE}')
+
+        try:
+            return connection.execute(
+                f'SELECT COUNT(*) FROM {name}'
+            ).fetchone()[0]
+        finally:
+            connection.close()
+
+    def close(self) -> None:
+        """
+        Записывает оставшиеся строки и закрывает базу данных;
+
+        :return: None.
+        """
+
+        if self.connection:
+            if self.buffered:
+                self.dump(self.take(), sync=True)
+
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,117 @@
+import abc
+
+
+class Writer(abc.ABC):
+    """
+    Интерфейс буферизованной записи собранных данных. Данные накапливаются
+    в буферах, содержимое которых извлекается в основном потоке (take)
+    и записывается на диск, в том числе в отдельном потоке (dump);
+
+    :var size: размер записанных данных по таблицам.
+    """
+
+    def __init__(self):
+        self.size: dict = {}
+
+    @abc.abstractmethod
+    def open(self, path: str, mode: str) -> None:
+        """
+        Открывает хранилище данных. В режиме 'w' хранилище создается заново,
+        в режиме 'a' данные дописываются;
+
+        :param path: путь к каталогу с данными;
+        :param mode: режим работы с файлом;
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def write(self, records: dict) -> None:
+        """
+        Записывает данные в буферы;
+
+        :param records: записываемые данные;
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def full(self) -> bool:
+        """
+        Проверяет, необходимо ли записать буферы на диск до сохранения
+        контрольной точки;
+
+        :return: флаг необходимости записи буферов на диск.
+        """
+
+    @abc.abstractmethod
+    def take(self):
+        """
+        Извлекает содержимое буферов и очищает их;
+
+        :return: содержимое буферов.
+        """
+
+    @abc.abstractmethod
+    def dump(self, chunks, sync: bool = False) -> None:
+        """
+        Записывает содержимое буферов на диск. Может выполняться
+        в отдельном потоке;
+
+        :param chunks: содержимое буферов;
+        :param sync: флаг принудительной записи файлов на диск (fsync);
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def position(self) -> dict:
+        """
+        Возвращает позицию записанных на диск данных по таблицам,
+        до которой данные могут быть отменены (rollback);
+
+        :return: позиция данных.
+        """
+
+    @abc.abstractmethod
+    def rollback(self, position: dict) -> None:
+        """
+        Отменяет данные, записанные после указанной позиции. Выполняется
+        после открытия хранилища в режиме 'a';
+
+        :param position: позиция данных;
+        :return: None.
+        """
+
+    @abc.abstractmethod
+    def stat(self) -> dict:
+        """
+        Возвращает размер и время изменения записанных данных по таблицам;
+
+        :return: размер и время изменения (в наносекундах) данных.
+        """
+
+    @abc.abstractmethod
+    def probe(self, path: str) -> dict:
+        """
+        Возвращает размер и время изменения данных, находящихся на диске,
+        для сравнения с контрольной точкой;
+
+        :param path: путь к каталогу с данными;
+        :return: размер и время изменения (в наносекундах) данных.
+        """
+
+    @abc.abstractmethod
+    def count(self, path: str, name: str) -> int:
+        """
+        Подсчитывает количество записей таблицы, находящихся на диске;
+
+        :param path: путь к каталогу с данными;
+        :param name: имя таблицы;
+        :return: количество записей.
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Записывает буферы и закрывает хранилище данных;
+
+        :return: None.
+        """
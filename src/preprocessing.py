@@ -1,11 +1,12 @@
 import os
-import shutil
 
 import pandas as pd
 
 from config.paths import PATH_PREPROCESSED_DATA
 from config.paths import PATH_RAW_DATA
-from utils.data import preprocess
+from utils.data import export
+from utils.data import stream
+from utils.data import tensorize
 from utils.explorer import explorer
 
 
@@ -21,15 +22,12 @@ def main():
     print('Список необработанных данных:', names, sep='\n', flush=True)
 
     if name := input('Выберите данные: '):
-        releases = pd.read_csv(f'{PATH_RAW_DATA}/{name}/releases.csv')
-        genres = pd.read_csv(f'{PATH_RAW_DATA}/{name}/genres.csv')
         files = os.listdir(f'{PATH_RAW_DATA}/{name}/posters')
         posters = pd.Series(files)
 
-        # Предварительная обработка данных.
-        data = preprocess(
-            releases=releases,
-            genres=genres,
+        # Предварительная обработка данных (таблицы читаются частями).
+        data = stream(
+            path=f'{PATH_RAW_DATA}/{name}',
             posters=posters
         )
 
@@ -44,14 +42,30 @@ def main():
             index=False
         )
 
-        path += r'/posters'
-        if not os.path.exists(path):
-            os.mkdir(path)
+        # Экспорт постеров (ссылками или копиями).
+        stat = export(
+            source=f'{PATH_RAW_DATA}/{name}/posters',
+            target=f'{path}/posters',
+            names=[f'{index}.jpg' for index in data['id'].to_list()]
+        )
 
-        for index in data['id'].to_list():
-            file = f'{PATH_RAW_DATA}/{name}/posters/{index}.jpg'
+        print('Постеры:',
+              f'ссылки - {stat["link"]},',
+              f'общие блоки - {stat["clone"]},',
+              f'копии - {stat["copy"]},',
+              f'пропущены - {stat["skipped"]},',
+              f'удалены - {stat["removed"]}.',
+              flush=True)
+
+        # Декодирование постеров в массивы (по строкам data.csv).
+        index = tensorize(
+            path=path,
+            ids=data['id'].to_list()
+        )
 
-            shutil.copy(file, path)
+        print(f'Декодировано постеров: {index["valid"].sum()} '
+              f'из {len(index)}.',
+              flush=True)
 
 
 if __name__ == '__main__':
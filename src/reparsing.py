@@ -0,0 +1,62 @@
+import os
+import time
+
+from config.parser.parser import SETTINGS
+from config.paths import FILE_RAW_PATH
+from parser.reparser import Reparser
+from utils.explorer import explorer
+
+
+def main():
+    """
+    Точка входа повторного парсинга архива страниц фильмов;
+
+    :return: None.
+    """
+
+    reparser = Reparser()
+
+    os.system('cls')
+
+    names = explorer(FILE_RAW_PATH, exclude=('checkpoints', 'cache'))
+    print('Список директорий:', names, sep='\n', flush=True)
+    source = input('Укажите имя директории с архивом: ')
+
+    if not os.path.exists(fr'{FILE_RAW_PATH}\{source}\archive'):
+        print('Архив страниц фильмов не найден.', flush=True)
+        return None
+
+    default = f'{source}-reparsed'
+    directory = input(f'Укажите имя новой директории ({default}): ')
+    directory = directory or default
+
+    if directory == source:
+        print('Данные не могут быть записаны в директорию с архивом.',
+              flush=True)
+        return None
+
+    reparser.setting(source=source,
+                     directory=directory,
+                     format=SETTINGS['format'],
+                     workers=SETTINGS['workers'],
+                     backend=SETTINGS['backend'])
+
+    start = time.perf_counter()
+    pages = reparser.run()
+    seconds = time.perf_counter() - start
+
+    print(f'Количество страниц: {pages}.', flush=True)
+    print(f'Время парсинга: {seconds:.2f} сек.', flush=True)
+
+    print('Количество записей:', flush=True)
+    for name, count in reparser.records.items():
+        print(f'{name:11} {count:8}', flush=True)
+
+    if failed := reparser.failures():
+        print('Неуспешно спарсенные данные:', flush=True)
+        for field, count in failed.items():
+            print(f'{field:11} {count:8}', flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+import asyncio
+import hashlib
+import os
+import random
+import shutil
+import tempfile
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from config.benchmark import CATALOGUE
+from config.benchmark import RESOLUTION
+from config.parser.managers.parsing import PARSING_FIELDS
+from parser.backends import BACKENDS
+from parser.managers.parsing import ParsingManager
+from parser.managers.poster import PosterManager
+from parser.movie import Movie
+from parser.parser import Parser
+from parser.writers import WRITERS
+from utils.data.preprocessing import EXCLUDE
+from utils.data.preprocessing import preprocess
+
+
+def corpus(path: str) -> dict:
+    """
+    Читает корпус сохраненных ответов: страницы фильмов, страницу списка
+    фильмов и постер;
+
+    :param path: путь к каталогу корпуса;
+    :return: страницы фильмов, страница списка и постер.
+    """
+
+    directory = fr'{path}\films'
+    films = []
+
+    for file in sorted(os.listdir(directory)):
+        if file.endswith('.html'):
+            with open(fr'{directory}\{file}', encoding='utf-8') as html:
+                films.append(html.read())
+
+    with open(fr'{path}\listing.html', encoding='utf-8') as html:
+        listing = html.read()
+
+    with open(fr'{path}\poster.jpg', 'rb') as image:
+        poster = image.read()
+
+    return {'films': films, 'listing': listing, 'poster': poster}
+
+
+def best(function, repeat: int) -> float:
+    """
+    Измеряет наименьшее время выполнения функции из нескольких повторов.
+    Количество выполнений в повторе подбирается так, чтобы повтор длился
+    не менее 0,2 секунды;
+
+    :param function: измеряемая функция;
+    :param repeat: количество повторов;
+    :return: время выполнения (в секундах).
+    """
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def extractors(texts: list[str], backend: str, repeat: int) -> dict:
+    """
+    Измеряет время разбора страницы (document) и парсинга каждого поля
+    на разобранных страницах;
+
+    :param texts: страницы фильмов;
+    :param backend: имя парсера страниц фильмов;
+    :param repeat: количество повторов;
+    :return: время на одну страницу (в микросекундах) по полям.
+    """
+
+    parser = BACKENDS[backend]()
+    documents = [parser.document(text) for text in texts]
+
+    timings = {'document': best(lambda: [parser.document(text)
+                                         for text in texts],
+                                repeat)}
+
+    for field in PARSING_FIELDS:
+        extractor = getattr(parser, field)
+        timings[field] = best(lambda extractor=extractor:
+                              [extractor(document) for document in documents],
+                              repeat)
+
+    return {field: seconds / len(texts) * 10 ** 6
+            for field, seconds in timings.items()}
+
+
+async def crawl(data: dict, backend: str, format: str, path: str) -> None:
+    """
+    Обрабатывает корпус так же, как при сборе данных, без обращения
+    к сети: парсинг списка фильмов и страниц фильмов, формирование
+    строк таблиц, запись данных и постеров;
+
+    :param data: корпус сохраненных ответов;
+    :param backend: имя парсера страниц фильмов;
+    :param format: формат записи данных (csv, parquet, arrow, sqlite);
+    :param path: путь к каталогу для записи данных;
+    :return: None.
+    """
+
+    manager = ParsingManager(backend)
+    writer = WRITERS[format]()
+    writer.open(path, 'w')
+
+    posters = PosterManager()
+    posters.open(path, 'w')
+
+    os.makedirs(fr'{path}\posters', exist_ok=True)
+
+    films = await manager.movies('', data['listing'])
+
+    for number, text in enumerate(data['films']):
+        if number and not number % len(films):
+            films = await manager.movies('', data['listing'])
+
+        movie = Movie(number)
+        manager.fill(movie, text)
+
+        writer.write(Parser.records([movie]))
+
+        if writer.full():
+            writer.dump(writer.take())
+
+        source = posters.stage(number)
+        with open(source, 'wb') as image:
+            image.write(data['poster'])
+
+        digest = hashlib.sha256(data['poster']).hexdigest()
+        posters.store(source, digest, fr'{path}\posters\{number}.jpg')
+        posters.add(number, digest, len(data['poster']))
+
+    writer.close()
+    posters.close()
+
+
+def pipeline(data: dict, backend: str, format: str, repeat: int) -> dict:
+    """
+    Измеряет скорость обработки корпуса от страницы до записи на диск
+    и пиковый объем памяти, выделенной при обработке;
+
+    :param data: корпус сохраненных ответов;
+    :param backend: имя парсера страниц фильмов;
+    :param format: формат записи данных (csv, parquet, arrow, sqlite);
+    :param repeat: количество повторов;
+    :return: количество фильмов в секунду и пиковый объем памяти
+    (в килобайтах).
+    """
+
+    def run() -> None:
+        path = tempfile.mkdtemp()
+
+        try:
+            asyncio.run(crawl(data, backend, format, path))
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+    seconds = best(run, repeat)
+
+    tracemalloc.start()
+
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'films': len(data['films']) / seconds, 'memory': peak / 1024}
+
+
+def catalogue(films: int) -> dict:
+    """
+    Формирует синтетические таблицы релизов, жанров и список постеров
+    каталога заданного размера с распределением значений, близким
+    к собранным данным;
+
+    :param films: количество фильмов;
+    :return: релизы, жанры и имена файлов постеров.
+    """
+
+    generator = random.Random(films)
+
+    countries = ['USA', 'UK', 'France', 'Germany', 'Japan', 'Canada']
+    types = ['Theatrical', 'Digital', 'Physical', 'Premiere', 'TV']
+    ratings = ['PG-13', 'R', 'PG', 'G', 'NC-17', None]
+    names = [*EXCLUDE, 'Drama', 'Comedy', 'Thriller', 'Action', 'Horror',
+             'Romance', 'Crime', 'Animation', 'Documentary', 'Family']
+
+    releases, genres = [], []
+
+    for i in range(films):
+        for _ in range(generator.randint(1, 8)):
+            date = f'{generator.randint(1950, 2024)}-01-01'
+            country, = generator.choices(countries, [5, 1, 1, 1, 1, 1])
+            type_, = generator.choices(types, [5, 2, 1, 1, 1])
+
+            releases.append((i,
+                             country,
+                             date,
+                             type_,
+                             generator.choice(ratings)))
+
+        for genre in generator.sample(names, generator.randint(0, 4)):
+            genres.append((i, genre))
+
+    posters = [f'{i}.jpg' for i in range(films) if generator.random() < 0.9]
+
+    return {
+        'releases': pd.DataFrame(releases, columns=['id', 'country', 'date',
+                                                    'type', 'rating']),
+        'genres': pd.DataFrame(genres, columns=['id', 'genre']),
+        'posters': pd.Series(posters)
+    }
+
+
+def reference(releases: pd.DataFrame,
+              genres: pd.DataFrame,
+              posters: pd.Series) -> pd.DataFrame:
+    """
+    Исходная построчная реализация предварительной обработки данных,
+    с которой сравнивается текущая реализация;
+
+    :param releases: таблица релизов;
+    :param genres: таблица жанров;
+    :param posters: имена файлов постеров;
+    :return: предобработанные данные.
+    """
+
+    def insert(index: int) -> list | None:
+        if index in genres.index:
+            value = genres[[index]].to_list()
+            return sorted(set(value) - set(EXCLUDE))
+        return None
+
+    mask = ((releases['country'] == 'USA') &
+            (releases['type'] == 'Theatrical') &
+            (pd.to_datetime(releases['date']) >= '2000-01-01'))
+
+    data = releases.loc[mask, ['id', 'rating']]
+    data = data[data['rating'] != 'NC-17']
+
+    genres = genres.set_index('id')['genre']
+    data['genres'] = data['id'].apply(insert)
+
+    data = data.dropna()
+
+    files = [*map(int, posters.str.split('.', expand=True)[0].to_list())]
+
+    return data[data['id'].isin(files)]
+
+
+def preprocessing(films: int, repeat: int) -> dict:
+    """
+    Измеряет время предварительной обработки синтетического каталога
+    текущей и исходной реализациями и проверяет совпадение результатов;
+
+    :param films: количество фильмов;
+    :param repeat: количество повторов;
+    :return: количество фильмов, время обработки (в секундах) текущей
+    и исходной реализациями.
+    """
+
+    data = catalogue(films)
+
+    if not preprocess(**data).equals(reference(**data)):
+        raise ValueError('Результаты предварительной обработки различаются.')
+
+    return {'films': films,
+            'seconds': best(lambda: preprocess(**data), repeat),
+            'reference': best(lambda: reference(**data), repeat)}
+
+
+def measure(path: str, backend: str, format: str, repeat: int) -> dict:
+    """
+    Выполняет все измерения на корпусе сохраненных ответов;
+
+    :param path: путь к каталогу корпуса;
+    :param backend: имя парсера страниц фильмов;
+    :param format: формат записи данных (csv, parquet, arrow, sqlite);
+    :param repeat: количество повторов;
+    :return: результаты измерений.
+    """
+
+    data = corpus(path)
+
+    return {'backend': backend,
+            'format': format,
+            'pages': len(data['films']),
+            'extractors': extractors(data['films'], backend, repeat),
+            'pipeline': pipeline(data, backend, format, repeat),
+            'preprocessing': preprocessing(CATALOGUE, repeat)}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Сравнивает результаты измерений с базовыми. Регрессией считается
+    увеличение времени парсинга или объема памяти либо уменьшение
+    скорости обработки более чем на долю tolerance. Поля, время парсинга
+    которых меньше RESOLUTION микросекунд, не сравниваются;
+
+    :param results: результаты измерений;
+    :param baseline: базовые результаты измерений;
+    :param tolerance: допустимое относительное изменение;
+    :return: базовое и текущее значения метрик с регрессией.
+    """
+
+    metrics = [(f'extractors.{field}', results['extractors'][field],
+                baseline['extractors'].get(field), 1)
+               for field in results['extractors']
+               if results['extractors'][field] >= RESOLUTION]
+    metrics += [
+        ('pipeline.films', results['pipeline']['films'],
+         baseline['pipeline'].get('films'), -1),
+        ('pipeline.memory', results['pipeline']['memory'],
+         baseline['pipeline'].get('memory'), 1),
+        ('preprocessing.seconds', results['preprocessing']['seconds'],
+         baseline.get('preprocessing', {}).get('seconds'), 1)
+    ]
+
+    regressions = {}
+
+    for metric, value, base, sign in metrics:
+        if base and sign * (value - base) / base > tolerance:
+            regressions[metric] = {'baseline': base, 'current': value}
+
+    return regressions
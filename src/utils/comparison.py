@@ -0,0 +1,45 @@
+import time
+
+from config.parser.managers.parsing import PARSING_FIELDS
+from parser.managers.parsing import ParsingManager
+from parser.movie import Movie
+
+
+def compare(texts: list[str], backends: tuple = ('soup', 'lxml')) -> dict:
+    """
+    Сравнивает парсеры страниц фильмов: проверяет совпадение значений
+    каждого поля и измеряет время парсинга;
+
+    :param texts: сохраненные страницы фильмов;
+    :param backends: имена сравниваемых парсеров (первый - эталонный);
+    :return: количество расхождений по полям и время парсинга (в секундах)
+    для каждого парсера.
+    """
+
+    results = {backend: [] for backend in backends}
+    timings = {backend: 0.0 for backend in backends}
+
+    for backend in backends:
+        manager = ParsingManager(backend)
+
+        start = time.perf_counter()
+        for text in texts:
+            movie = Movie(None)
+            manager.fill(movie, text)
+            results[backend].append(movie)
+        timings[backend] = time.perf_counter() - start
+
+    reference, *others = backends
+
+    mismatches = {backend: {field: 0 for field in PARSING_FIELDS}
+                  for backend in others}
+
+    for backend in others:
+        for expected, actual in zip(results[reference],
+                                    results[backend],
+                                    strict=True):
+            for field in PARSING_FIELDS:
+                if getattr(expected, field) != getattr(actual, field):
+                    mismatches[backend][field] += 1
+
+    return {'mismatches': mismatches, 'timings': timings}
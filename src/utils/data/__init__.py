@@ -1 +1,8 @@
+from .export import export
+from .images import normalize
+from .images import tensorize
+from .images import tensors
+from .loading import chunks
+from .loading import load
 from .preprocessing import preprocess
+from .preprocessing import stream
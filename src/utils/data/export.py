@@ -0,0 +1,153 @@
+import os
+import shutil
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from config.data import EXPORT
+from config.data import WORKERS
+
+
+FICLONE = 0x40049409
+
+METHODS = {
+    'link': ('link', 'clone', 'copy'),
+    'clone': ('clone', 'copy'),
+    'copy': ('copy', )
+}
+
+
+def clone(source: str, target: str) -> None:
+    """
+    Создает копию файла, разделяющую блоки данных с исходным файлом
+    (reflink). Поддерживается файловыми системами Linux с копированием
+    при записи (Btrfs, XFS), иначе вызывается исключение OSError;
+
+    :param source: путь к исходному файлу;
+    :param target: путь к копии файла;
+    :return: None.
+    """
+
+    try:
+        import fcntl
+    except ImportError as error:
+        raise OSError('reflink не поддерживается') from error
+
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+    shutil.copystat(source, target)
+
+
+def transfer(source: str, target: str, mode: str) -> str:
+    """
+    Размещает файл по указанному пути первым доступным способом режима
+    mode: жесткой ссылкой (link), копией с общими блоками (clone) или
+    копией (copy). Размещение выполняется через временный файл;
+
+    :param source: путь к исходному файлу;
+    :param target: путь к размещаемому файлу;
+    :param mode: режим размещения (link, clone, copy);
+    :return: способ размещения.
+    """
+
+    part = target + '.part'
+
+    for method in METHODS[mode]:
+        if os.path.exists(part):
+            os.remove(part)
+
+        try:
+            if method == 'link':
+                os.link(source, part)
+            elif method == 'clone':
+                clone(source, part)
+            else:
+                shutil.copy2(source, part)
+        except OSError:
+            if method == 'copy':
+                raise
+        else:
+            break
+
+    os.replace(part, target)
+
+    return method
+
+
+def fresh(source: os.stat_result, target: str) -> bool:
+    """
+    Проверяет, совпадают ли размер и время изменения размещенного файла
+    с исходным файлом;
+
+    :param source: параметры исходного файла;
+    :param target: путь к размещенному файлу;
+    :return: флаг совпадения.
+    """
+
+    try:
+        stat = os.stat(target)
+    except FileNotFoundError:
+        return False
+
+    return (stat.st_size == source.st_size and
+            stat.st_mtime_ns == source.st_mtime_ns)
+
+
+def deliver(source: str, target: str, mode: str) -> str:
+    """
+    Размещает файл, если размещенный файл отсутствует или отличается
+    от исходного. Выполняется в пуле потоков;
+
+    :param source: путь к исходному файлу;
+    :param target: путь к размещаемому файлу;
+    :param mode: режим размещения (link, clone, copy);
+    :return: способ размещения или 'skipped'.
+    """
+
+    if fresh(os.stat(source), target):
+        return 'skipped'
+
+    return transfer(source, target, mode)
+
+
+def export(source: str,
+           target: str,
+           names: Iterable[str],
+           mode: str = EXPORT,
+           workers: int = WORKERS) -> dict:
+    """
+    Размещает файлы каталога source в каталоге target в пуле потоков.
+    Файлы, размер и время изменения которых совпадают с исходными,
+    пропускаются, а файлы каталога target, отсутствующие в names,
+    удаляются, поэтому повторный экспорт выполняется инкрементально;
+
+    :param source: путь к исходному каталогу;
+    :param target: путь к каталогу для размещения;
+    :param names: имена размещаемых файлов;
+    :param mode: режим размещения (link, clone, copy);
+    :param workers: количество потоков;
+    :return: количество файлов по способам размещения.
+    """
+
+    os.makedirs(target, exist_ok=True)
+
+    names = set(names)
+    stat = {'link': 0, 'clone': 0, 'copy': 0, 'skipped': 0, 'removed': 0}
+
+    with os.scandir(target) as entries:
+        for entry in entries:
+            if entry.name not in names:
+                os.remove(entry.path)
+                stat['removed'] += 1
+
+    names = sorted(names)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for method in executor.map(deliver,
+                                   [f'{source}/{name}' for name in names],
+                                   [f'{target}/{name}' for name in names],
+                                   [mode] * len(names)):
+            stat[method] += 1
+
+    return stat
@@ -0,0 +1,153 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from PIL import Image
+
+from config.data import IMAGES
+from config.data import MEAN
+from config.data import PROCESSES
+from config.data import SHAPES
+from config.data import STD
+
+
+def decode(files: list[str],
+           arrays: list[str],
+           shapes: list[tuple[int, int]],
+           start: int) -> list[bool]:
+    """
+    Декодирует постеры в процессе из пула процессов и записывает их
+    в массивы всех размеров, начиная со строки start. Каждый постер
+    декодируется один раз, причем JPEG декодируется сразу в уменьшенном
+    размере, не меньшем наибольшего из размеров (draft). Строки
+    постеров, которые не удалось декодировать, остаются нулевыми;
+
+    :param files: пути к постерам;
+    :param arrays: пути к массивам (.npy);
+    :param shapes: размеры постеров в массивах (высота, ширина);
+    :param start: номер строки первого постера;
+    :return: флаги успешного декодирования.
+    """
+
+    tensors = [np.load(array, mmap_mode='r+') for array in arrays]
+    draft = (max(width for _, width in shapes),
+             max(height for height, _ in shapes))
+
+    valid = []
+
+    for row, file in enumerate(files, start=start):
+        try:
+            with Image.open(file) as image:
+                image.draft('RGB', draft)
+                image = image.convert('RGB')
+
+                for tensor, (height, width) in zip(tensors, shapes,
+                                                   strict=True):
+                    tensor[row] = np.asarray(
+                        image.resize((width, height),
+                                     Image.Resampling.BILINEAR)
+                    )
+        except (OSError, ValueError):
+            valid.append(False)
+        else:
+            valid.append(True)
+
+    for tensor in tensors:
+        tensor.flush()
+
+    return valid
+
+
+def tensorize(path: str,
+              ids: list[int],
+              shapes: list[tuple[int, int]] = SHAPES,
+              size: int = IMAGES,
+              workers: int = PROCESSES) -> pd.DataFrame:
+    """
+    Декодирует постеры каталога предобработанных данных в пуле процессов
+    и записывает их в массивы posters-<высота>x<ширина>.npy (uint8, NHWC)
+    по одному на каждый размер. Строки массивов соответствуют порядку ids
+    (строкам data.csv), а индекс (id, row, valid) записывается
+    в posters.csv. Массивы записываются через временные файлы;
+
+    :param path: путь к каталогу предобработанных данных;
+    :param ids: id фильмов;
+    :param shapes: размеры постеров (высота, ширина);
+    :param size: количество постеров в задаче процесса;
+    :param workers: количество процессов;
+    :return: индекс постеров.
+    """
+
+    ids = list(ids)
+    files = [f'{path}/posters/{i}.jpg' for i in ids]
+
+    arrays = []
+
+    for height, width in shapes:
+        array = f'{path}/posters-{height}x{width}.npy.part'
+        np.lib.format.open_memmap(array,
+                                  mode='w+',
+                                  dtype=np.uint8,
+                                  shape=(len(ids), height, width, 3))
+        arrays.append(array)
+
+    starts = range(0, len(ids), size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(decode,
+                               [files[i:i + size] for i in starts],
+                               [arrays] * len(starts),
+                               [shapes] * len(starts),
+                               starts)
+
+        valid = [flag for flags in results for flag in flags]
+
+    for array in arrays:
+        os.replace(array, array.removesuffix('.part'))
+
+    index = pd.DataFrame({'id': ids, 'row': range(len(ids)), 'valid': valid})
+    index.to_csv(f'{path}/posters.csv', index=False)
+
+    return index
+
+
+def tensors(path: str,
+            shape: tuple[int, int] = SHAPES[0]) -> tuple[np.ndarray,
+                                                         pd.DataFrame]:
+    """
+    Отображает массив постеров в память без чтения и декодирования
+    отдельных файлов;
+
+    :param path: путь к каталогу предобработанных данных;
+    :param shape: размер постеров (высота, ширина);
+    :return: массив постеров (только для чтения) и индекс постеров.
+    """
+
+    height, width = shape
+
+    array = np.load(f'{path}/posters-{height}x{width}.npy', mmap_mode='r')
+    index = pd.read_csv(f'{path}/posters.csv')
+
+    return array, index
+
+
+def normalize(batch: np.ndarray,
+              mean: tuple = MEAN,
+              std: tuple = STD) -> np.ndarray:
+    """
+    Нормализует пакет постеров: приводит значения к [0, 1], вычитает
+    среднее и делит на стандартное отклонение по каналам. Массивы
+    хранятся в uint8, поэтому нормализация выполняется для пакета;
+
+    :param batch: пакет постеров (uint8, NHWC);
+    :param mean: среднее по каналам;
+    :param std: стандартное отклонение по каналам;
+    :return: нормализованный пакет постеров (float32).
+    """
+
+    batch = batch.astype(np.float32) / 255
+
+    return (batch - np.float32(mean)) / np.float32(std)
@@ -0,0 +1,269 @@
+import contextlib
+import datetime
+import operator
+import os
+import sqlite3
+
+from collections.abc import Iterator
+
+import pandas as pd
+import pyarrow.dataset
+
+from config.data import CHUNK
+from config.parser.managers.file import DATABASE
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.file import FIELD_TYPES
+from config.parser.managers.file import TABLES
+from config.parser.managers.work import SHARDS
+from parser.writers.columnar import SCHEMAS
+from parser.writers.sqlite import select
+
+
+FORMATS = {
+    '.parquet': 'parquet',
+    '.arrow': 'ipc'
+}
+
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+
+def load(path: str, name: str, columns: list | None = None) -> pd.DataFrame:
+    """
+    Читает таблицу собранных данных. Таблицы в колоночном формате
+    (каталог с частями в каталоге TABLES) читаются без разбора значений
+    и только указанными столбцами, таблицы базы данных SQLite -
+    из представления со значениями справочников, иначе читается csv-файл;
+
+    :param path: путь к каталогу с данными;
+    :param name: имя таблицы;
+    :param columns: читаемые столбцы (по умолчанию все);
+    :return: таблица.
+    """
+
+    if os.path.isdir(f'{path}/{SHARDS}'):
+        return merge(path, name, columns)
+
+    database = f'{path}/{DATABASE}'
+
+    if os.path.isfile(database):
+        fields = ', '.join(columns or FIELD_NAMES[name])
+        uri = f'file:{database}?mode=ro'
+
+        with contextlib.closing(sqlite3.connect(uri, uri=True)) as connection:
+            return pd.read_sql_query(f'SELECT {fields} FROM {name}_view',
+                                     connection)
+
+    if not (dataset := parts(path, name)):
+        return pd.read_csv(f'{path}/{name}.csv', usecols=columns)
+
+    return (dataset
+            .to_table(columns=columns)
+            .to_pandas(date_as_object=False))
+
+
+def parts(path: str, name: str) -> pyarrow.dataset.Dataset | None:
+    """
+    Возвращает набор данных из частей таблицы в колоночном формате;
+
+    :param path: путь к каталогу с данными;
+    :param name: имя таблицы;
+    :return: набор данных или None, если частей нет.
+    """
+
+    directory = f'{path}/{TABLES}/{name}'
+    files, format = [], 'parquet'
+
+    if os.path.isdir(directory):
+        for file in sorted(os.listdir(directory)):
+            extension = os.path.splitext(file)[1]
+
+            if file.startswith('part-') and extension in FORMATS:
+                files.append(f'{directory}/{file}')
+                format = FORMATS[extension]
+
+    if not files:
+        return None
+
+    return pyarrow.dataset.dataset(files,
+                                   schema=SCHEMAS[name],
+                                   format=format)
+
+
+def merge(path: str, name: str, columns: list | None = None) -> pd.DataFrame:
+    """
+    Читает и объединяет таблицы шардов распределенного сбора данных.
+    Данные фильма, уже записанного в предыдущий шард (при повторной выдаче
+    задачи), пропускаются, кроме рейтингов;
+
+    :param path: путь к каталогу с данными;
+    :param name: имя таблицы;
+    :param columns: читаемые столбцы (по умолчанию все);
+    :return: таблица.
+    """
+
+    columns = columns or FIELD_NAMES[name]
+    fields = columns if 'id' in columns else ['id'] + columns
+
+    frames, seen = [], pd.Index([])
+
+    for shard in sorted(os.listdir(f'{path}/{SHARDS}')):
+        directory = f'{path}/{SHARDS}/{shard}'
+        frame = load(directory, name, fields)
+
+        if name != 'ratings':
+            frame = frame[~frame['id'].isin(seen)]
+
+        seen = seen.union(load(directory, 'movies', ['id'])['id'])
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)[columns]
+
+
+def chunks(path: str,
+           name: str,
+           columns: list | None = None,
+           filters: list[tuple] = (),
+           size: int = CHUNK) -> Iterator[pd.DataFrame]:
+    """
+    Читает таблицу собранных данных частями не более size строк
+    с компактными типами данных (int32, категории, даты). Условия filters
+    вида (столбец, оператор, значение) передаются источнику данных:
+    для колоночного формата - в фильтр набора данных, для базы данных
+    SQLite - в запрос, для csv-файла применяются к каждой части, поэтому
+    в памяти находятся только одна часть и подходящие строки. Строки
+    читаются в порядке их записи во всех форматах;
+
+    :param path: путь к каталогу с данными;
+    :param name: имя таблицы;
+    :param columns: читаемые столбцы (по умолчанию все);
+    :param filters: условия отбора строк;
+    :param size: количество строк в части;
+    :return: части таблицы.
+    """
+
+    columns = columns or FIELD_NAMES[name]
+
+    if os.path.isdir(f'{path}/{SHARDS}'):
+        fields = columns if 'id' in columns else ['id'] + columns
+        seen = pd.Index([])
+
+        for shard in sorted(os.listdir(f'{path}/{SHARDS}')):
+            directory = f'{path}/{SHARDS}/{shard}'
+
+            for chunk in chunks(directory, name, fields, filters, size):
+                if name != 'ratings':
+                    chunk = chunk[~chunk['id'].isin(seen)]
+
+                yield chunk[columns]
+
+            seen = seen.union(load(directory, 'movies', ['id'])['id'])
+
+        return None
+
+    database = f'{path}/{DATABASE}'
+
+    if os.path.isfile(database):
+        fields = ', '.join(columns)
+        condition = ' AND '.join(
+            f'{field} {"=" if sign == "==" else sign} ?'
+            for field, sign, _ in filters
+        )
+        query = f'SELECT {fields} FROM ({select(name, rowid=True)})'
+        query += f' WHERE {condition}' if condition else ''
+        query += ' ORDER BY rowid'
+        uri = f'file:{database}?mode=ro'
+
+        with contextlib.closing(sqlite3.connect(uri, uri=True)) as connection:
+            for chunk in pd.read_sql_query(query,
+                                           connection,
+                                           params=[value
+                                                   for *_, value in filters],
+                                           chunksize=size):
+                yield convert(chunk, name)
+
+        return None
+
+    if dataset := parts(path, name):
+        expression = None
+
+        for field, sign, value in filters:
+            if FIELD_TYPES[name][field] == 'date':
+                value = datetime.date.fromisoformat(value)
+
+            condition = OPERATORS[sign](pyarrow.dataset.field(field), value)
+            expression = (condition if expression is None
+                          else expression & condition)
+
+        for batch in dataset.to_batches(columns=columns,
+                                        filter=expression,
+                                        batch_size=size):
+            if batch.num_rows:
+                yield batch.to_pandas(date_as_object=False)
+
+        return None
+
+    with pd.read_csv(f'{path}/{name}.csv',
+                     usecols=columns,
+                     dtype=dtypes(name, columns),
+                     chunksize=size) as reader:
+        for chunk in reader:
+            chunk = convert(chunk, name)
+
+            for field, sign, value in filters:
+                if FIELD_TYPES[name][field] == 'date':
+                    value = pd.Timestamp(value)
+
+                chunk = chunk[OPERATORS[sign](chunk[field], value)]
+
+            yield chunk
+
+
+def dtypes(name: str, columns: list) -> dict:
+    """
+    Возвращает типы данных pandas для чтения столбцов таблицы. Целочисленные
+    столбцы, кроме id, допускают пропуски;
+
+    :param name: имя таблицы;
+    :param columns: читаемые столбцы;
+    :return: типы данных столбцов.
+    """
+
+    types = {}
+
+    for field in columns:
+        alias = FIELD_TYPES[name][field]
+
+        if alias == 'category':
+            types[field] = 'category'
+        elif alias.startswith('int'):
+            types[field] = alias if field == 'id' else alias.capitalize()
+
+    return types
+
+
+def convert(chunk: pd.DataFrame, name: str) -> pd.DataFrame:
+    """
+    Приводит столбцы части таблицы к компактным типам данных, даты
+    в формате ГГГГ-ММ-ДД - к типу datetime;
+
+    :param chunk: часть таблицы;
+    :param name: имя таблицы;
+    :return: часть таблицы.
+    """
+
+    chunk = chunk.astype(dtypes(name, list(chunk.columns)))
+
+    for field in chunk.columns:
+        if FIELD_TYPES[name][field] == 'date':
+            chunk[field] = pd.to_datetime(chunk[field],
+                                          format='%Y-%m-%d',
+                                          errors='coerce')
+
+    return chunk
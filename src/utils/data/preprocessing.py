@@ -1,13 +1,53 @@
+import numpy as np
 import pandas as pd
 
+from config.data import CHUNK
+from utils.data.loading import chunks
 
-def insert(index: int, genres: pd.Series, exclude: tuple = ()) -> list | None:
-    if index in genres.index:
-        value = genres[[index]].to_list()
-        value = set(value) - set(exclude)
-        return sorted(value)
-    else:
-        return None
+
+EXCLUDE = (
+    'History',
+    'TV Movie',
+    'War',
+    'Western'
+)
+
+FILTERS = [
+    ('country', '==', 'USA'),
+    ('type', '==', 'Theatrical'),
+    ('date', '>=', '2000-01-01')
+]
+
+
+def group(genres: pd.DataFrame, exclude: tuple = ()) -> pd.Series:
+    """
+    Группирует жанры по фильмам без построчного цикла: исключает жанры
+    exclude, удаляет повторы, сортирует таблицу по id и жанру и разбивает
+    столбец жанров на списки по границам id. Фильмы, все жанры которых
+    исключены, получают пустой список;
+
+    :param genres: таблица жанров (id, genre);
+    :param exclude: исключаемые жанры;
+    :return: списки жанров по id фильмов.
+    """
+
+    kept = (genres[~genres['genre'].isin(exclude)]
+            .astype({'genre': 'str'})
+            .drop_duplicates()
+            .sort_values(['id', 'genre']))
+
+    ids = kept['id'].to_numpy()
+    bounds = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+    values = np.split(kept['genre'].to_numpy(dtype=object), bounds)
+
+    lists = pd.Series([value.tolist() for value in values] if len(ids) else [],
+                      index=np.unique(ids),
+                      dtype=object)
+
+    missing = pd.Index(genres['id'].unique()).difference(lists.index)
+    empty = pd.Series([[] for _ in missing], index=missing, dtype=object)
+
+    return pd.concat([lists, empty])
 
 
 def preprocess(releases: pd.DataFrame,
@@ -16,23 +56,70 @@ def preprocess(releases: pd.DataFrame,
 
     mask = ((releases['country'] == 'USA') &
             (releases['type'] == 'Theatrical') &
-            (releases['date'] >= '2000-01-01'))
+            (pd.to_datetime(releases['date']) >= '2000-01-01'))
 
     data = releases.loc[mask, ['id', 'rating']]
     data = data[data['rating'] != 'NC-17']
 
-    genres = genres.set_index('id')['genre']
-    exclude = (
-        'History',
-        'TV Movie',
-        'War',
-        'Western'
-    )
-    data['genres'] = data['id'].apply(insert, genres=genres, exclude=exclude)
+    genres = genres[genres['id'].isin(data['id'])]
+    data['genres'] = data['id'].map(group(genres, EXCLUDE))
 
     data = data.dropna()
 
-    files = [*map(int, posters.str.split('.', expand=True)[0].to_list())]
+    files = posters.str.split('.', n=1).str[0].astype('int64').unique()
     data = data[data['id'].isin(files)]
 
     return data
+
+
+def stream(path: str, posters: pd.Series, size: int = CHUNK) -> pd.DataFrame:
+    """
+    Осуществляет предварительную обработку данных, читая таблицы частями.
+    Отбор релизов (FILTERS) выполняется при чтении, а из таблицы жанров
+    и имен файлов постеров сохраняются только строки отобранных фильмов,
+    поэтому объем памяти определяется размером части и количеством
+    отобранных строк, а не размером собранных данных;
+
+    :param path: путь к каталогу с данными;
+    :param posters: имена файлов постеров;
+    :param size: количество строк в части;
+    :return: предобработанные данные.
+    """
+
+    columns = ['id', 'country', 'date', 'type', 'rating']
+    releases = collect(chunks(path, 'releases', columns, FILTERS, size),
+                       columns)
+
+    ids = releases['id'].unique()
+
+    genres = collect((chunk[chunk['id'].isin(ids)]
+                      for chunk in chunks(path, 'genres', ['id', 'genre'],
+                                          size=size)),
+                     ['id', 'genre'])
+
+    parts = (posters[i:i + size] for i in range(0, len(posters), size))
+    posters = collect(part[part.str.split('.', n=1).str[0]
+                           .astype('int64')
+                           .isin(ids)] for part in parts)
+
+    return preprocess(releases, genres, posters)
+
+
+def collect(frames, columns: list | None = None) -> pd.DataFrame | pd.Series:
+    """
+    Объединяет части таблицы или столбца;
+
+    :param frames: части таблицы (или столбца);
+    :param columns: столбцы таблицы (None для столбца);
+    :return: таблица (или столбец).
+    """
+
+    frames = [frame for frame in frames if len(frame)]
+
+    if not frames:
+        if columns is None:
+            return pd.Series([], dtype='str')
+
+        return pd.DataFrame(columns=columns)
+
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,29 @@
+import importlib
+
+import pytest
+
+import config.paths
+
+
+@pytest.fixture
+def file(tmp_path, monkeypatch):
+    """
+    Перенаправляет данные и контрольные точки файлового менеджера
+    во временный каталог;
+
+    :return: модуль файлового менеджера.
+    """
+
+    raw, checkpoints = tmp_path / 'raw', tmp_path / 'checkpoints'
+
+    monkeypatch.setattr(config.paths, 'FILE_RAW_PATH', str(raw),
+                        raising=False)
+    monkeypatch.setattr(config.paths, 'CHECKPOINT_PATH', str(checkpoints),
+                        raising=False)
+
+    module = importlib.import_module('parser.managers.file')
+
+    monkeypatch.setattr(module, 'FILE_RAW_PATH', str(raw))
+    monkeypatch.setattr(module, 'CHECKPOINT_PATH', str(checkpoints))
+
+    return module
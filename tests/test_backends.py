@@ -0,0 +1,72 @@
+import pathlib
+
+import pytest
+
+from config.parser.managers.parsing import PARSING_FIELDS
+from parser.backends.backend import Document
+from parser.managers.parsing import ParsingManager
+from parser.movie import Movie
+from utils.comparison import compare
+
+
+CORPUS = pathlib.Path(__file__).parents[1] / 'resources' / 'benchmark'
+
+
+@pytest.fixture(scope='module')
+def texts() -> list[str]:
+    """
+    Читает сохраненные страницы фильмов;
+
+    :return: страницы фильмов.
+    """
+
+    files = sorted((CORPUS / 'films').glob('*.html'))
+
+    return [file.read_text(encoding='utf-8') for file in files]
+
+
+def test_corpus(texts):
+    """
+    Проверяет, что эталонный парсер находит каждое поле хотя бы на одной
+    странице, поэтому совпадение парсеров не достигается отсутствием
+    значений;
+    """
+
+    manager = ParsingManager('soup')
+
+    for text in texts:
+        manager.fill(Movie(None), text)
+
+    assert texts
+    assert all(manager.success[field] for field in PARSING_FIELDS)
+
+
+def test_parity(texts):
+    """
+    Проверяет совпадение значений всех полей парсеров soup и lxml;
+    """
+
+    result = compare(texts, ('soup', 'lxml'))
+
+    assert result['mismatches'] == {
+        'lxml': {field: 0 for field in PARSING_FIELDS}
+    }
+
+
+@pytest.mark.parametrize('backend', ['soup', 'lxml'])
+@pytest.mark.parametrize('data', [
+    {},
+    {'aggregateRating': None},
+    {'aggregateRating': 'none'},
+    {'aggregateRating': {'ratingValue': None}}
+])
+def test_rating(backend, data):
+    """
+    Проверяет, что отсутствующий или пустой рейтинг фильма получает
+    значение по умолчанию и учитывается как неуспешно спарсенный;
+    """
+
+    manager = ParsingManager(backend)
+
+    assert manager.field('rating', Document(None, {}, data)) is None
+    assert manager.failed['rating'] == 1
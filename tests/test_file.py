@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+import config.paths
+
+from config.parser.managers.file import FIELD_NAMES
+
+
+@pytest.fixture
+def manager(file):
+    """
+    Создает файловый менеджер, записывающий данные и контрольную точку
+    во временный каталог;
+
+    :return: файловый менеджер.
+    """
+
+    manager = file.FileManager()
+    manager.setting('data', 'w', 'checkpoint.json')
+
+    yield manager
+
+    asyncio.run(manager.close())
+
+
+def movies(start: int, stop: int) -> dict:
+    """
+    Создает записи фильмов;
+
+    :param start: id первого фильма;
+    :param stop: id, следующий за последним фильмом;
+    :return: записываемые данные.
+    """
+
+    fields = FIELD_NAMES['movies']
+
+    return {'movies': [[i] + [''] * (len(fields) - 1)
+                       for i in range(start, stop)]}
+
+
+def test_save(manager):
+    """
+    Проверяет, что контрольная точка учитывает только записанные на диск
+    данные, если во время ее записи в буферы записываются новые данные;
+    """
+
+    async def run() -> None:
+        await manager.write(movies(0, 3))
+
+        saving = asyncio.create_task(manager.save({}))
+
+        while not manager.lock.locked():
+            await asyncio.sleep(0)
+
+        await manager.write(movies(3, 5))
+        await saving
+
+    asyncio.run(run())
+
+    files = manager.load('checkpoint.json')['state']['files']
+    path = fr'{config.paths.FILE_RAW_PATH}\{manager.directory}'
+
+    assert manager.records['movies'] == 5
+    assert files['movies']['records'] == 3
+    assert files['movies']['records'] == manager.writer.count(path, 'movies')
+    assert files['movies']['size'] == manager.size['movies']
+
+
+@pytest.mark.parametrize('format', ['csv', 'parquet', 'arrow', 'sqlite'])
+def test_types(file, format):
+    """
+    Проверяет, что значения полей фильма в пределах их реальных
+    диапазонов (продолжительность фильма - более суток) записываются
+    во всех форматах;
+    """
+
+    manager = file.FileManager()
+    manager.setting('data', 'w', None, format)
+
+    movie = [1, 'Logistics', 2012, None, None, 51420, 3.5]
+
+    async def run() -> None:
+        await manager.write({'movies': [movie]})
+        await manager.close()
+
+    asyncio.run(run())
+
+    assert manager.state['files']['movies']['records'] == 1
+
+
+@pytest.mark.parametrize('format', ['csv', 'sqlite'])
+def test_resume(file, format):
+    """
+    Проверяет, что после аварийного завершения между записью данных
+    и отметок индекса продолжение сбора данных (режим 'a') откатывает
+    таблицы к позиции индекса, а повторно собранные фильмы
+    не дублируются;
+    """
+
+    def collect(manager, start: int, stop: int) -> None:
+        for i in range(start, stop):
+            if manager.index.action(f'film-{i}') == 'scrape':
+                manager.index.mark(f'film-{i}', i)
+                asyncio.run(manager.write(movies(i, i + 1)))
+
+    manager = file.FileManager()
+    manager.setting('data', 'w', 'checkpoint.json', format)
+
+    collect(manager, 0, 3)
+    asyncio.run(manager.save({}))
+    collect(manager, 3, 5)
+
+    manager.writer.dump(manager.writer.take(), True)
+    manager.writer.close()
+    manager.index.connection.close()
+    manager.index.connection = None
+    manager.archive.close()
+    manager.dead.close()
+    manager.posters.close()
+
+    state = manager.load('checkpoint.json')['state']
+    path = fr'{config.paths.FILE_RAW_PATH}\{manager.directory}'
+
+    assert manager.writer.count(path, 'movies') == 5
+
+    manager = file.FileManager()
+    manager.setting('data', 'a', 'checkpoint.json', format, state=state)
+
+    assert manager.writer.count(path, 'movies') == 3
+    assert manager.records['movies'] == 3
+
+    collect(manager, 0, 5)
+    asyncio.run(manager.close())
+
+    assert manager.writer.count(path, 'movies') == 5
+    assert manager.records['movies'] == 5
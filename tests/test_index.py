@@ -0,0 +1,71 @@
+import pytest
+
+from config.parser.managers.index import IDENTIFIER
+from parser.managers.index import IndexManager
+
+
+@pytest.fixture
+def index(tmp_path):
+    """
+    Создает индекс во временном каталоге с двумя собранными фильмами,
+    первый из которых не имел id в списке;
+
+    :return: индекс.
+    """
+
+    index = IndexManager()
+    index.open(str(tmp_path), 'w')
+
+    for slug, i in (('first', None), ('second', 7)):
+        index.action(slug)
+        index.mark(slug, index.identify(slug, i))
+
+    index.dump(index.take(), {'movies': 2})
+    index.close()
+
+    index.open(str(tmp_path), 'a')
+
+    yield index
+
+    index.close()
+
+
+def test_reopen(index):
+    """
+    Проверяет, что повторно открытый индекс сохраняет собранные фильмы,
+    позицию данных и следующий свободный id;
+    """
+
+    assert index.position() == {'movies': 2}
+    assert index.next == IDENTIFIER + 1
+    assert index.identify('third', None) == IDENTIFIER + 1
+
+
+def test_identify(index):
+    """
+    Проверяет, что собранные фильмы сохраняют свои id, а новый фильм
+    с занятым id из списка получает следующий свободный id;
+    """
+
+    assert index.identify('first', None) == IDENTIFIER
+    assert index.identify('second', 3) == 7
+    assert index.identify('third', 7) == IDENTIFIER + 1
+    assert index.identify('fourth', 8) == 8
+
+
+def test_action(index):
+    """
+    Проверяет, что собранные и повторяющиеся фильмы пропускаются,
+    а рейтинг собранных фильмов обновляется по истечении интервала;
+    """
+
+    assert index.action('first') == 'skip'
+    assert index.action('third') == 'scrape'
+    assert index.action('third') == 'skip'
+
+    index.setting(1)
+    index.connection.execute('UPDATE films SET refreshed = 0')
+    index.forget()
+
+    assert index.action('second') == 'refresh'
+    assert index.action('third') == 'scrape'
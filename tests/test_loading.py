@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+
+from config.parser.managers.file import FIELD_NAMES
+from config.parser.managers.work import SHARDS
+from parser.managers.index import IndexManager
+from parser.managers.work import WorkManager
+from utils.data.loading import chunks
+from utils.data.loading import merge
+
+
+def test_shards(tmp_path):
+    """
+    Проверяет, что фильмы без id в списке, собранные разными шардами,
+    получают разные id и не теряются при объединении шардов, а фильм,
+    собранный обоими шардами, не повторяется;
+    """
+
+    path = str(tmp_path / 'data')
+    os.makedirs(tmp_path / 'indexes')
+
+    work = WorkManager()
+    work.open(str(tmp_path / 'queue'))
+
+    for name, slug in (('worker-01', 'first'), ('worker-02', 'second')):
+        shard = f'{path}/{SHARDS}/{name}'
+        os.makedirs(shard)
+
+        index = IndexManager()
+        index.open(str(tmp_path / 'indexes' / name), 'w')
+        index.reserve(work.reserve(name))
+
+        ids = [index.identify(slug, None), index.identify('common', 7)]
+        index.close()
+
+        frame = pd.DataFrame([[i] + [''] * (len(FIELD_NAMES['movies']) - 1)
+                              for i in ids],
+                             columns=FIELD_NAMES['movies'])
+        frame.to_csv(f'{shard}/movies.csv', index=False)
+
+    assert work.reserve('worker-01') != work.reserve('worker-02')
+    work.close()
+
+    movies = merge(path, 'movies')
+    parts = pd.concat(chunks(path, 'movies'))
+
+    assert len(movies) == len(parts) == 3
+    assert movies['id'].is_unique
@@ -0,0 +1,79 @@
+import asyncio
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def parser(file):
+    """
+    Создает программу сбора данных, фильмы которой не запрашиваются
+    с сервера, а создаются по id. Обработка фильма с id 4 завершается
+    ошибкой;
+
+    :return: программа сбора данных.
+    """
+
+    module = importlib.import_module('parser.parser')
+
+    async def links(page: int) -> list[tuple]:
+        return [(i, f'film-{i}', f'/film/film-{i}/')
+                for i in range(page * 3 - 2, page * 3 + 1)]
+
+    async def movie(link: str, i: int, slug: str):
+        if i == 4:
+            raise TypeError('unexpected document')
+
+        movie = module.Movie(i)
+        movie.name, movie.actors = slug, []
+        movie.crew = movie.details = movie.genres = movie.releases = {}
+
+        return movie
+
+    parser = module.Parser()
+    parser.file.setting('data', 'w', 'checkpoint.json')
+    parser.pipeline.setting(2, 1, 2, 100)
+    parser.progress.setting([1, 2])
+    parser.links = links
+    parser.movie = movie
+
+    yield parser
+
+    asyncio.run(parser.file.close())
+
+
+def test_failed_film(parser):
+    """
+    Проверяет, что ошибка обработки одного фильма откладывает фильм,
+    не останавливая сбор данных;
+    """
+
+    async def run() -> None:
+        await asyncio.wait_for(parser.crawl(1, 2), 5)
+
+    asyncio.run(run())
+
+    failed = parser.file.dead.failed
+
+    assert [letter['id'] for letter in failed] == [4]
+    assert failed[0]['slug'] == 'film-4'
+    assert parser.progress.progress[0] == 3
+    assert parser.file.records['movies'] == 5
+
+
+def test_failed_stage(parser):
+    """
+    Проверяет, что ошибка этапа сбора данных отменяет остальные этапы
+    и вызывается повторно;
+    """
+
+    async def links(page: int) -> list[tuple]:
+        raise RuntimeError('stage failed')
+
+    parser.links = links
+
+    async def run() -> None:
+        await asyncio.wait_for(parser.crawl(1, 2), 5)
+
+    with pytest.raises(RuntimeError, match='stage failed'):
+        asyncio.run(run())